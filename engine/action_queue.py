@@ -0,0 +1,73 @@
+# action_queue.py
+
+from collections import OrderedDict
+
+
+class ActionQueue:
+    """
+    ActionQueue defers UI actions until the UI update pass is over.
+
+    Actions pushed with the same key before being executed are coalesced into a single execution,
+    and at most a budget of actions is executed per drain; the others wait for the next one.
+
+    Attributes:
+        - budget (int): Maximum number of actions executed per drain.
+        - actions (OrderedDict): Pending actions, keyed by their coalescing key, in push order.
+        - executed (int): Number of actions executed.
+        - coalesced (int): Number of pushes merged into a pending action.
+
+    Methods:
+        - push(action, key=None): Queue an action.
+        - drain(): Execute the pending actions within the budget.
+        - clear(): Drop the pending actions.
+    """
+    def __init__(self, budget=16):
+        """
+        Initialize the ActionQueue instance.
+
+        Args:
+            budget (int): Maximum number of actions executed per drain.
+        """
+        self.budget = budget
+        self.actions = OrderedDict()
+        self.executed = 0
+        self.coalesced = 0
+
+    def __len__(self):
+        return len(self.actions)
+
+    def push(self, action, key=None):
+        """
+        Queue an action. A pending action with the same key is kept in place and executed once.
+
+        Args:
+            action (Callable): The action, called without arguments.
+            key (hashable or None): Coalescing key, e.g. the action string; None to use the action itself.
+        """
+        key = action if key is None else key
+        if key in self.actions:
+            self.coalesced += 1
+            return
+        self.actions[key] = action
+
+    def drain(self):
+        """
+        Execute the pending actions in push order within the budget.
+
+        Returns:
+            int: Number of actions executed.
+        """
+        count = 0
+        while self.actions and count < self.budget:
+            _, action = self.actions.popitem(last=False)
+            action()
+            count += 1
+
+        self.executed += count
+        return count
+
+    def clear(self):
+        """
+        Drop the pending actions.
+        """
+        self.actions.clear()
@@ -0,0 +1,235 @@
+# action_registry.py
+
+import ast
+from functools import partial
+from operator import methodcaller
+
+from engine.ui_container import iter_element_configs
+
+
+class ActionRegistry:
+    """
+    ActionRegistry compiles action strings into callables once and shares them across menu loads.
+
+    An action string is either a manager method path with arguments, e.g. "ui_manager.load_menu('main_menu')",
+    compiled into a bound callable shared by every element using it, or an element method with arguments,
+    e.g. "debug(42)", compiled into a method caller bound to each element on lookup.
+
+    Attributes:
+        - managers (dict): Dictionary of manager instances, the roots of the method paths.
+        - logger (Logger): Logger instance for logging.
+        - actions (dict): Compiled actions (callable, element_bound), or the error message of the actions
+          which cannot be resolved, keyed by action string for manager methods and malformed actions,
+          and by action string and element class for element methods.
+
+    Methods:
+        Action Access:
+            - get_action(action_str, element): Get the callable of an action for an element.
+            - get_action_key(action_str, element): Get the key coalescing the queued executions of an action.
+            - validate(menu_config, element_classes): Compile every action of the menu configuration.
+
+        Compilation:
+            - compile(action_str, element_class=None): Compile an action string, using the cache.
+            - resolve_action(action_str, element_class): Resolve an action string and cache the result.
+            - parse_action(action_str): Split an action string into its method path and arguments.
+            - parse_arguments(args_str): Parse a string of arguments into a tuple of arguments.
+    """
+    def __init__(self, managers, logger):
+        """
+        Initialize the ActionRegistry instance.
+
+        Args:
+            managers (dict): Dictionary of manager instances.
+            logger (Logger): Logger instance for logging.
+        """
+        self.managers = managers
+        self.logger = logger
+        self.actions = {}
+
+    """
+    Action Access
+        - get_action
+        - get_action_key
+        - validate
+    """
+    def get_action(self, action_str, element):
+        """
+        Get the callable of an action for an element.
+
+        Args:
+            action_str (str): String representing the action.
+            element (UIElement): The element triggering the action.
+
+        Returns:
+            Callable or None: The action, called without arguments, or None if it cannot be resolved.
+        """
+        try:
+            action, element_bound = self.compile(action_str, type(element))
+        except ValueError as e:
+            self.logger.log_warning(str(e))
+            return None
+
+        return partial(action, element) if element_bound else action
+
+    def get_action_key(self, action_str, element):
+        """
+        Get the key coalescing the queued executions of an action.
+        Manager actions are coalesced across elements, element actions only per element.
+
+        Args:
+            action_str (str): String representing the action.
+            element (UIElement): The element triggering the action.
+
+        Returns:
+            hashable: The action string, or the action string and the element ID for element actions.
+        """
+        try:
+            _, element_bound = self.compile(action_str, type(element))
+        except ValueError:
+            # Unresolved actions run the element's default action
+            element_bound = True
+
+        return (action_str, element.element_id) if element_bound else action_str
+
+    def validate(self, menu_config, element_classes):
+        """
+        Compile every action of the menu configuration, raising with all the invalid ones.
+
+        Args:
+            menu_config (dict): The menu configuration.
+            element_classes (dict): Element classes resolving element methods, keyed by element type.
+
+        Raises:
+            ValueError: If an action of the configuration cannot be resolved.
+        """
+        # Each invalid action is reported once, with the elements using it
+        errors = {}
+        for menu_name, menu in menu_config.items():
+            for element_type, element_id, config in iter_element_configs(menu):
+                action_str = config.get('action')
+                if not action_str:
+                    continue
+                try:
+                    self.compile(action_str, element_classes.get(element_type))
+                except ValueError as e:
+                    errors.setdefault(str(e), []).append(f"{menu_name}.{element_id}")
+
+        if errors:
+            self.logger.log_error("Invalid actions in the menu configuration:\n    " + "\n    ".join(
+                f"{', '.join(element_ids)}: {message}" for message, element_ids in errors.items()), ValueError)
+
+    """
+    Compilation
+        - compile
+        - resolve_action
+        - parse_action
+        - parse_arguments
+    """
+    def compile(self, action_str, element_class=None):
+        """
+        Compile an action string, using the cache.
+
+        Args:
+            action_str (str): String representing the action.
+            element_class (type or None): Class of the elements triggering the action, for element methods.
+
+        Returns:
+            tuple: The compiled callable and whether it must be called with the element.
+
+        Raises:
+            ValueError: If the action cannot be resolved.
+        """
+        # Element methods are resolved per element class, manager methods are shared
+        compiled = self.actions.get(action_str) or self.actions.get((action_str, element_class))
+        if compiled is None:
+            compiled = self.resolve_action(action_str, element_class)
+
+        if isinstance(compiled, str):
+            raise ValueError(compiled)
+        return compiled
+
+    def resolve_action(self, action_str, element_class):
+        """
+        Resolve an action string and cache the result, including the error message if it cannot be resolved,
+        so an invalid action is resolved once however many elements use it.
+
+        Args:
+            action_str (str): String representing the action.
+            element_class (type or None): Class of the elements triggering the action, for element methods.
+
+        Returns:
+            tuple or str: The compiled callable and whether it must be called with the element, or the error message.
+        """
+        key = action_str
+        try:
+            method_path, args = self.parse_action(action_str)
+            method_parts = method_path.split('.')
+
+            if len(method_parts) > 1:
+                # Resolve the method path from the managers
+                obj = self.managers.get(method_parts[0])
+                for part in method_parts[1:-1]:
+                    obj = getattr(obj, part, None)
+                if obj is None:
+                    raise ValueError(f"Manager '{'.'.join(method_parts[:-1])}' of action '{action_str}' not found.")
+                method = getattr(obj, method_parts[-1], None)
+                if not callable(method):
+                    raise ValueError(f"Method '{method_parts[-1]}' of action '{action_str}' not found"
+                                     f" in manager '{'.'.join(method_parts[:-1])}'.")
+                compiled = (partial(method, *args) if args else method, False)
+            else:
+                # Resolve the method on the element
+                key = (action_str, element_class)
+                if element_class is None or not callable(getattr(element_class, method_path, None)):
+                    raise ValueError(f"Method '{method_path}' of action '{action_str}' not found in the element.")
+                compiled = (methodcaller(method_path, *args), True)
+        except ValueError as e:
+            compiled = str(e)
+
+        self.actions[key] = compiled
+        return compiled
+
+    def parse_action(self, action_str):
+        """
+        Split an action string into its method path and arguments.
+
+        Args:
+            action_str (str): String representing the action, e.g. "audio_manager.adjust_volume('master', 0.05)".
+
+        Returns:
+            tuple: The method path and the tuple of arguments.
+
+        Raises:
+            ValueError: If the action is malformed or the arguments cannot be parsed.
+        """
+        action_parts = action_str.split('(', 1)
+        method_path = action_parts[0].strip()
+        if len(action_parts) == 1:
+            return method_path, ()
+
+        args_str = action_parts[1].rstrip()
+        if not args_str.endswith(')'):
+            raise ValueError(f"Missing closing parenthesis in action '{action_str}'.")
+        return method_path, self.parse_arguments(args_str[:-1])
+
+    @staticmethod
+    def parse_arguments(args_str):
+        """
+        Parse a string of arguments into a tuple of arguments.
+
+        Args:
+            args_str (str): String representing arguments in the format 'arg1, arg2, ...'
+
+        Returns:
+            tuple: Tuple of parsed arguments.
+
+        Raises:
+            ValueError: If the arguments are not Python literals.
+        """
+        if not args_str.strip():
+            return ()
+        try:
+            args = ast.literal_eval(f"({args_str},)")
+        except (SyntaxError, ValueError) as e:
+            raise ValueError(f"Error parsing arguments '{args_str}': {e}")
+        return args
@@ -43,6 +43,7 @@ class AudioManager(BaseManager):
             - load_library(): Loads all audio assets from the specified library path.
             - load_settings(): Loads settings from the configuration.
             - apply_settings(): Apply the loaded settings to the audio manager.
+            - register_bindings(): Register the debug audio key bindings.
 
         Playback Control:
             - play_music(music_name, fade=None): Plays the specified background music.
@@ -55,6 +56,7 @@ class AudioManager(BaseManager):
             - resume_music(): Resumes the currently paused background music.
             - pause_music(): Pauses the currently playing background music.
             - toggle_music_playback(): Toggles between pausing and unpausing the music playback.
+            - get_playback_state(): Returns a snapshot of the playback and volume state.
 
         Volume Control:
             - set_master_volume(volume): Sets the master volume level.
@@ -117,6 +119,7 @@ class AudioManager(BaseManager):
         - load_library
         - load_settings
         - apply_settings
+        - register_bindings
     """
     def load_specific_components(self):
         """
@@ -231,6 +234,29 @@ class AudioManager(BaseManager):
 
         self.log_info("Audio settings have been applied.")
 
+    def register_bindings(self):
+        """
+        Register the debug audio key bindings.
+        """
+        bindings = {
+            pygame.K_1: lambda: self.play_music("bgm_eight_Lament_Scarlet"),
+            pygame.K_2: lambda: self.play_music("bgm_nagumorizu_Strategy_Meeting"),
+            pygame.K_3: lambda: self.play_music("bgm_tak_mfk_Dance_of_the_Cold_Moon"),
+            pygame.K_4: lambda: self.play_sound("maou_se_onepoint09"),
+            pygame.K_5: lambda: self.play_voice("YouFulca_voice_07_cool_attack"),
+            pygame.K_m: self.toggle_music_playback,
+            pygame.K_v: self.stop_music,
+            pygame.K_b: self.stop_sound,
+            pygame.K_n: self.stop_voice,
+            pygame.K_o: lambda: self.set_bgm_loop(-1),  # Infinite loop
+            pygame.K_p: lambda: self.set_bgm_loop(0),   # No loop
+            pygame.K_u: self.toggle_audio_mute,         # Toggle mute/unmute
+            pygame.K_KP_PLUS: lambda: self.adjust_volume("master", 0.05),
+            pygame.K_KP_MINUS: lambda: self.adjust_volume("master", -0.05),
+        }
+        for key, callback in bindings.items():
+            self.main_manager.bind_event(pygame.KEYDOWN, callback, key)
+
     """
     Playback Control
         - play_music
@@ -243,6 +269,7 @@ class AudioManager(BaseManager):
         - resume_music
         - pause_music
         - toggle_music_playback
+        - get_playback_state
     """
     def play_music(self, music_name, fade=None):
         """
@@ -421,6 +448,18 @@ class AudioManager(BaseManager):
             # No music is playing or paused
             self.log_warning("No background music is currently playing to pause or unpause.")
 
+    def get_playback_state(self):
+        """
+        Get a snapshot of the playback and volume state.
+
+        Returns:
+            tuple: Comparable snapshot of the current audio state.
+        """
+        return (
+            self.current_music_name, self.music_paused, pygame.mixer.music.get_busy(), self.bgm_loop,
+            self.mute, self.volume_master, self.volume_bgm, self.volume_sfx, self.volume_voice
+        )
+
     """
     Volume Control:
         - set_master_volume
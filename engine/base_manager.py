@@ -27,6 +27,7 @@ class BaseManager:
             - update_config(new_config, check_all_params=False): Update the configuration with new settings.
             - load_components(): Load necessary components based on the configuration.
             - load_specific_components(): Template method to be implemented in subclasses.
+            - register_bindings(): Register the event bindings of the manager.
 
         Utility:
             - get_function_name(): Get the name of the current function dynamically.
@@ -54,6 +55,7 @@ class BaseManager:
         - update_config
         - load_components
         - load_specific_components
+        - register_bindings
     """
     def initialize(self, config, managers=None, logger=None):
         """
@@ -150,6 +152,13 @@ class BaseManager:
         self.log_error(f"Subclasses should implement {self.get_function_name()} method.",
                        NotImplementedError)
 
+    def register_bindings(self):
+        """
+        Register the event bindings of the manager through the main manager.
+        Managers without bindings keep this default.
+        """
+        pass
+
     """
     Utility:
         - get_function_name
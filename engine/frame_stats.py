@@ -0,0 +1,229 @@
+# frame_stats.py
+
+import pygame
+from collections import deque
+
+
+class FrameStats:
+    """
+    FrameStats collects per-frame timings and counters and renders them as a debug overlay.
+
+    Attributes:
+        History Attributes:
+            - frame_times (deque): Duration of the most recent frames in milliseconds.
+            - update_times (deque): Time spent updating during the most recent frames in milliseconds.
+            - draw_times (deque): Time spent drawing during the most recent frames in milliseconds.
+
+        Frame Counters:
+            - update_time (float): Time spent updating during the current frame in seconds.
+            - draw_time (float): Time spent drawing during the current frame in seconds.
+            - blits (int): Number of blits issued during the current frame.
+            - surfaces (int): Number of surfaces allocated during the current frame.
+            - last_blits (int): Number of blits issued during the last completed frame.
+            - last_surfaces (int): Number of surfaces allocated during the last completed frame.
+
+        Overlay Attributes:
+            - refresh_interval (int): Minimum time in milliseconds between two overlay text refreshes.
+            - refresh_time (int): Time in milliseconds of the last overlay text refresh.
+            - font (pygame.font.Font or None): Font used to render the overlay.
+            - overlay_surface (pygame.Surface or None): Rendered overlay.
+            - overlay_pos (tuple): Position of the overlay on the game surface.
+
+    Methods:
+        Recording:
+            - begin_frame(): Reset the counters of the current frame.
+            - record_update(seconds): Add time spent updating to the current frame.
+            - record_draw(seconds): Add time spent drawing to the current frame.
+            - add_blits(count): Count blits issued during the current frame.
+            - add_surfaces(count): Count surfaces allocated during the current frame.
+            - end_frame(frame_time): Store the timings and counters of the current frame.
+
+        Statistics:
+            - get_percentile(values, percentile): Get a percentile of a history.
+            - get_lines(): Get the overlay text lines.
+
+        Overlay:
+            - refresh_overlay(): Render the overlay text.
+            - draw(surface): Draw the overlay on the given surface.
+    """
+    def __init__(self, history_size=240, refresh_interval=250):
+        """
+        Initialize the FrameStats instance.
+
+        Args:
+            history_size (int): Number of frames kept for the statistics.
+            refresh_interval (int): Minimum time in milliseconds between two overlay text refreshes.
+        """
+        # History Attributes
+        self.frame_times = deque(maxlen=history_size)
+        self.update_times = deque(maxlen=history_size)
+        self.draw_times = deque(maxlen=history_size)
+
+        # Frame Counters
+        self.update_time = 0
+        self.draw_time = 0
+        self.blits = 0
+        self.surfaces = 0
+        self.last_blits = 0
+        self.last_surfaces = 0
+
+        # Overlay Attributes
+        self.refresh_interval = refresh_interval
+        self.refresh_time = None
+        self.font = None
+        self.overlay_surface = None
+        self.overlay_pos = (5, 5)
+
+    """
+    Recording
+        - begin_frame
+        - record_update
+        - record_draw
+        - add_blits
+        - add_surfaces
+        - end_frame
+    """
+    def begin_frame(self):
+        """
+        Reset the counters of the current frame.
+        """
+        self.update_time = 0
+        self.draw_time = 0
+        self.blits = 0
+        self.surfaces = 0
+
+    def record_update(self, seconds):
+        """
+        Add time spent updating to the current frame.
+
+        Args:
+            seconds (float): Duration of the update in seconds.
+        """
+        self.update_time += seconds
+
+    def record_draw(self, seconds):
+        """
+        Add time spent drawing to the current frame.
+
+        Args:
+            seconds (float): Duration of the draw in seconds.
+        """
+        self.draw_time += seconds
+
+    def add_blits(self, count=1):
+        """
+        Count blits issued during the current frame.
+
+        Args:
+            count (int): Number of blits.
+        """
+        self.blits += count
+
+    def add_surfaces(self, count=1):
+        """
+        Count surfaces allocated during the current frame.
+
+        Args:
+            count (int): Number of surfaces.
+        """
+        self.surfaces += count
+
+    def end_frame(self, frame_time):
+        """
+        Store the timings and counters of the current frame.
+
+        Args:
+            frame_time (float): Duration of the frame in seconds.
+        """
+        self.frame_times.append(frame_time * 1000)
+        self.update_times.append(self.update_time * 1000)
+        self.draw_times.append(self.draw_time * 1000)
+        self.last_blits = self.blits
+        self.last_surfaces = self.surfaces
+
+    """
+    Statistics
+        - get_percentile
+        - get_lines
+    """
+    @staticmethod
+    def get_percentile(values, percentile):
+        """
+        Get a percentile of a history.
+
+        Args:
+            values (list): Sorted values.
+            percentile (float): Percentile to get (0 to 100).
+
+        Returns:
+            float: The value at the given percentile, or 0 if there are no values.
+        """
+        if not values:
+            return 0
+        index = min(len(values) - 1, int(len(values) * percentile / 100))
+        return values[index]
+
+    def get_lines(self):
+        """
+        Get the overlay text lines.
+
+        Returns:
+            list: Lines describing the recent frames.
+        """
+        frame_times = sorted(self.frame_times)
+        frame_count = len(self.frame_times) or 1
+        average_frame = sum(frame_times) / frame_count
+        fps = 1000 / average_frame if average_frame else 0
+
+        return [
+            f"FPS {fps:.1f} | frame {average_frame:.2f} ms",
+            f"p50 {self.get_percentile(frame_times, 50):.2f} | "
+            f"p95 {self.get_percentile(frame_times, 95):.2f} | "
+            f"p99 {self.get_percentile(frame_times, 99):.2f} ms",
+            f"update {sum(self.update_times) / frame_count:.2f} | "
+            f"draw {sum(self.draw_times) / frame_count:.2f} ms",
+            f"blits {self.last_blits} | surfaces {self.last_surfaces}",
+        ]
+
+    """
+    Overlay
+        - refresh_overlay
+        - draw
+    """
+    def refresh_overlay(self):
+        """
+        Render the overlay text.
+        """
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+
+        # Render each line and stack them on a translucent background
+        line_surfaces = [self.font.render(line, True, (255, 255, 255)) for line in self.get_lines()]
+        width = max(line.get_width() for line in line_surfaces) + 8
+        height = sum(line.get_height() for line in line_surfaces) + 8
+        self.overlay_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.overlay_surface.fill((0, 0, 0, 180))
+
+        y = 4
+        for line in line_surfaces:
+            self.overlay_surface.blit(line, (4, y))
+            y += line.get_height()
+
+    def draw(self, surface):
+        """
+        Draw the overlay on the given surface.
+
+        Args:
+            surface (pygame.Surface): The surface to draw the overlay on.
+
+        Returns:
+            pygame.Rect: The area covered by the overlay.
+        """
+        # Refresh the overlay text only a few times per second
+        current_time = pygame.time.get_ticks()
+        if self.refresh_time is None or current_time - self.refresh_time >= self.refresh_interval:
+            self.refresh_time = current_time
+            self.refresh_overlay()
+
+        self.add_blits()
+        return surface.blit(self.overlay_surface, self.overlay_pos)
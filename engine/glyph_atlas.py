@@ -0,0 +1,209 @@
+# glyph_atlas.py
+
+import pygame
+import string
+
+# Characters pre-rendered into the atlas
+DEFAULT_CHARSET = string.digits + string.ascii_letters + string.punctuation + " "
+
+
+class GlyphAtlas:
+    """
+    GlyphAtlas renders each glyph of a font, color and antialias setting once into a single surface.
+
+    Strings are drawn as a sequence of blits of glyph areas of the atlas, positioned with the glyph
+    advances and a kerning table, which avoids a full font render whenever the string changes.
+
+    Attributes:
+        Font Attributes:
+            - font (pygame.font.Font): Font used to render the glyphs.
+            - color (tuple): Glyph color.
+            - antialias (bool): Whether the glyphs are antialiased.
+            - height (int): Height of a line of text.
+
+        Atlas Attributes:
+            - atlas (pygame.Surface): Surface holding the pre-rendered glyphs.
+            - glyphs (dict): Glyph (surface, area, advance), keyed by character.
+            - kerning (dict): Kerning adjustments, keyed by character pair.
+
+    Methods:
+        Atlas Setup:
+            - build_atlas(charset, max_width): Render the charset into the atlas surface.
+            - add_glyph(char): Render a character missing from the atlas.
+
+        Text Layout:
+            - get_glyph(char): Get the glyph of a character.
+            - get_kerning(previous_char, char): Get the kerning adjustment between two characters.
+            - measure(text): Get the size of a string.
+            - get_blits(text, pos): Get the blits drawing a string.
+            - render_to(surface, text, pos): Draw a string on a surface.
+    """
+    def __init__(self, font, color, antialias=True, charset=DEFAULT_CHARSET, max_width=1024):
+        """
+        Initialize the GlyphAtlas instance.
+
+        Args:
+            font (pygame.font.Font): Font used to render the glyphs.
+            color (tuple): Glyph color.
+            antialias (bool): Whether the glyphs are antialiased.
+            charset (str): Characters pre-rendered into the atlas.
+            max_width (int): Maximum width of the atlas surface.
+        """
+        # Font Attributes
+        self.font = font
+        self.color = color
+        self.antialias = antialias
+        self.height = font.get_height()
+
+        # Atlas Attributes
+        self.atlas = None
+        self.glyphs = {}
+        self.kerning = {}
+
+        self.build_atlas(charset, max_width)
+
+    """
+    Atlas Setup
+        - build_atlas
+        - add_glyph
+    """
+    def build_atlas(self, charset, max_width):
+        """
+        Render the charset into the atlas surface.
+
+        Args:
+            charset (str): Characters to render.
+            max_width (int): Maximum width of the atlas surface.
+        """
+        charset = "".join(dict.fromkeys(charset))
+        glyph_surfaces = [self.font.render(char, self.antialias, self.color) for char in charset]
+        advances = [metrics[4] if metrics else surface.get_width()
+                    for metrics, surface in zip(self.font.metrics(charset), glyph_surfaces)]
+
+        # Pack the glyphs in rows
+        positions = []
+        x, y = 0, 0
+        for surface in glyph_surfaces:
+            if x and x + surface.get_width() > max_width:
+                x, y = 0, y + self.height
+            positions.append((x, y))
+            x += surface.get_width()
+        atlas_width = max((pos[0] + surface.get_width() for pos, surface in zip(positions, glyph_surfaces)),
+                          default=1)
+
+        # Render the glyphs into the atlas
+        self.atlas = pygame.Surface((atlas_width, y + self.height), pygame.SRCALPHA)
+        for char, surface, advance, pos in zip(charset, glyph_surfaces, advances, positions):
+            self.atlas.blit(surface, pos)
+            self.glyphs[char] = (self.atlas, pygame.Rect(pos, surface.get_size()), advance)
+
+    def add_glyph(self, char):
+        """
+        Render a character missing from the atlas.
+
+        Args:
+            char (str): The character to render.
+
+        Returns:
+            tuple: The glyph (surface, area, advance).
+        """
+        surface = self.font.render(char, self.antialias, self.color)
+        metrics = self.font.metrics(char)[0]
+        advance = metrics[4] if metrics else surface.get_width()
+        glyph = (surface, surface.get_rect(), advance)
+        self.glyphs[char] = glyph
+        return glyph
+
+    """
+    Text Layout
+        - get_glyph
+        - get_kerning
+        - measure
+        - get_blits
+        - render_to
+    """
+    def get_glyph(self, char):
+        """
+        Get the glyph of a character.
+
+        Args:
+            char (str): The character.
+
+        Returns:
+            tuple: The glyph (surface, area, advance).
+        """
+        glyph = self.glyphs.get(char)
+        return glyph if glyph else self.add_glyph(char)
+
+    def get_kerning(self, previous_char, char):
+        """
+        Get the kerning adjustment between two characters.
+
+        Args:
+            previous_char (str): The preceding character.
+            char (str): The character.
+
+        Returns:
+            int: Horizontal adjustment in pixels applied before the character.
+        """
+        pair = previous_char + char
+        kerning = self.kerning.get(pair)
+        if kerning is None:
+            kerning = self.font.size(pair)[0] - self.font.size(previous_char)[0] - self.font.size(char)[0]
+            self.kerning[pair] = kerning
+        return kerning
+
+    def measure(self, text):
+        """
+        Get the size of a string.
+
+        Args:
+            text (str or None): The string; None is measured as an empty string.
+
+        Returns:
+            tuple: The (width, height) of the string.
+        """
+        text = text or ''
+        width = 0
+        previous_char = None
+        for char in text:
+            if previous_char:
+                width += self.get_kerning(previous_char, char)
+            width += self.get_glyph(char)[2]
+            previous_char = char
+        return width, self.height
+
+    def get_blits(self, text, pos):
+        """
+        Get the blits drawing a string.
+
+        Args:
+            text (str or None): The string; None draws nothing.
+            pos (tuple): Top-left position of the string.
+
+        Returns:
+            list: Blits (surface, position, area) to be submitted with pygame.Surface.blits.
+        """
+        text = text or ''
+        blit_sequence = []
+        x, y = pos
+        previous_char = None
+        for char in text:
+            if previous_char:
+                x += self.get_kerning(previous_char, char)
+            surface, area, advance = self.get_glyph(char)
+            blit_sequence.append((surface, (x, y), area))
+            x += advance
+            previous_char = char
+        return blit_sequence
+
+    def render_to(self, surface, text, pos):
+        """
+        Draw a string on a surface.
+
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            text (str): The string.
+            pos (tuple): Top-left position of the string.
+        """
+        surface.blits(self.get_blits(text, pos), doreturn=False)
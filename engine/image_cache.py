@@ -0,0 +1,198 @@
+# image_cache.py
+
+import pygame
+from collections import OrderedDict
+
+
+class ImageCache:
+    """
+    ImageCache shares decoded and scaled images between UI elements.
+
+    Images are keyed by (path, size, convert_mode). Entries are reference counted and only
+    unreferenced entries are evicted, least recently used first, when the cache exceeds its budget.
+
+    Attributes:
+        - budget (int): Maximum number of bytes held by the cache before evicting unreferenced entries.
+        - entries (OrderedDict): Cache entries [surface, reference count, size in bytes], in LRU order.
+        - total_bytes (int): Number of bytes held by the cache.
+        - hits (int): Number of requests served from the cache.
+        - misses (int): Number of requests that required decoding or scaling an image.
+
+    Methods:
+        Cache Access:
+            - acquire(path, size=None, convert_mode='alpha'): Get a shared image and take a reference on it.
+            - release(path, size=None, convert_mode='alpha'): Drop a reference taken with acquire.
+            - prime(path, decoded_surface, convert_mode='alpha'): Store an image decoded ahead of time.
+
+        Cache Management:
+            - get_surface(key): Get the surface of an entry, creating it if needed.
+            - store(key, surface): Store a new entry.
+            - evict(): Evict unreferenced entries until the cache fits its budget.
+            - clear(): Remove all entries.
+            - get_surface_bytes(surface): Get the memory used by a surface.
+            - convert_surface(surface, convert_mode): Convert a decoded surface to the display format.
+    """
+    def __init__(self, budget=32 * 1024 * 1024):
+        """
+        Initialize the ImageCache instance.
+
+        Args:
+            budget (int): Maximum number of bytes held by the cache before evicting unreferenced entries.
+        """
+        self.budget = budget
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    """
+    Cache Access
+        - acquire
+        - release
+        - prime
+    """
+    def acquire(self, path, size=None, convert_mode='alpha'):
+        """
+        Get a shared image and take a reference on it.
+        The returned surface is shared and must not be modified.
+
+        Args:
+            path (str): Path of the image file.
+            size (tuple or None): Size to scale the image to, or None for the original size.
+            convert_mode (str or None): 'alpha' for convert_alpha, 'opaque' for convert, None to keep the file format.
+
+        Returns:
+            pygame.Surface: The shared image.
+        """
+        key = (path, tuple(size) if size else None, convert_mode)
+        surface = self.get_surface(key)
+        self.entries[key][1] += 1
+        self.evict()
+        return surface
+
+    def release(self, path, size=None, convert_mode='alpha'):
+        """
+        Drop a reference taken with acquire.
+
+        Args:
+            path (str): Path of the image file.
+            size (tuple or None): Size the image was acquired with.
+            convert_mode (str or None): Conversion the image was acquired with.
+        """
+        entry = self.entries.get((path, tuple(size) if size else None, convert_mode))
+        if entry and entry[1] > 0:
+            entry[1] -= 1
+            self.evict()
+
+    def prime(self, path, decoded_surface, convert_mode='alpha'):
+        """
+        Store an image decoded ahead of time, e.g. on a worker thread, without taking a reference.
+        The conversion to the display format happens here and must run on the main thread.
+
+        Args:
+            path (str): Path of the image file.
+            decoded_surface (pygame.Surface): The image as returned by pygame.image.load.
+            convert_mode (str or None): 'alpha' for convert_alpha, 'opaque' for convert, None to keep the file format.
+        """
+        key = (path, None, convert_mode)
+        if key not in self.entries:
+            self.store(key, self.convert_surface(decoded_surface, convert_mode))
+            self.evict()
+
+    """
+    Cache Management
+        - get_surface
+        - store
+        - evict
+        - clear
+        - get_surface_bytes
+        - convert_surface
+    """
+    def get_surface(self, key):
+        """
+        Get the surface of an entry, creating it if needed.
+
+        Args:
+            key (tuple): Entry key (path, size, convert_mode).
+
+        Returns:
+            pygame.Surface: The surface of the entry.
+        """
+        entry = self.entries.get(key)
+        if entry:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[0]
+
+        self.misses += 1
+        path, size, convert_mode = key
+        if size:
+            # Scaled variants are built from the cached original image
+            surface = pygame.transform.scale(self.get_surface((path, None, convert_mode)), size)
+        else:
+            surface = self.convert_surface(pygame.image.load(path), convert_mode)
+
+        self.store(key, surface)
+        return surface
+
+    def store(self, key, surface):
+        """
+        Store a new entry.
+
+        Args:
+            key (tuple): Entry key (path, size, convert_mode).
+            surface (pygame.Surface): Surface of the entry.
+        """
+        size_bytes = self.get_surface_bytes(surface)
+        self.entries[key] = [surface, 0, size_bytes]
+        self.total_bytes += size_bytes
+
+    def evict(self):
+        """
+        Evict unreferenced entries, least recently used first, until the cache fits its budget.
+        """
+        if self.total_bytes <= self.budget:
+            return
+
+        for key in [key for key, entry in self.entries.items() if entry[1] == 0]:
+            self.total_bytes -= self.entries.pop(key)[2]
+            if self.total_bytes <= self.budget:
+                break
+
+    def clear(self):
+        """
+        Remove all entries.
+        """
+        self.entries.clear()
+        self.total_bytes = 0
+
+    @staticmethod
+    def get_surface_bytes(surface):
+        """
+        Get the memory used by a surface.
+
+        Args:
+            surface (pygame.Surface): The surface.
+
+        Returns:
+            int: Number of bytes used by the pixels of the surface.
+        """
+        return surface.get_pitch() * surface.get_height()
+
+    @staticmethod
+    def convert_surface(surface, convert_mode):
+        """
+        Convert a decoded surface to the display format.
+
+        Args:
+            surface (pygame.Surface): Decoded surface.
+            convert_mode (str or None): 'alpha' for convert_alpha, 'opaque' for convert, None to keep the file format.
+
+        Returns:
+            pygame.Surface: The converted surface.
+        """
+        if convert_mode == 'alpha':
+            return surface.convert_alpha()
+        if convert_mode == 'opaque':
+            return surface.convert()
+        return surface
@@ -0,0 +1,52 @@
+# input_state.py
+
+from dataclasses import dataclass, replace
+
+# Button states indexed like pygame mouse buttons: None, Left, Middle, Right, Scroll Up, Scroll Down
+NO_BUTTONS = (False, False, False, False, False, False)
+
+
+@dataclass(frozen=True)
+class InputState:
+    """
+    InputState is an immutable snapshot of the mouse and keyboard input of a frame.
+
+    Attributes:
+        - mouse_pos (tuple): Mouse position in game surface coordinates.
+        - mouse_delta (tuple): Mouse movement since the input was last consumed.
+        - buttons_down (tuple): Buttons pressed since the input was last consumed.
+        - buttons_held (tuple): Buttons currently held down.
+        - buttons_up (tuple): Buttons released since the input was last consumed.
+        - wheel (int): Vertical wheel movement since the input was last consumed.
+        - modifiers (int): Keyboard modifier flags (pygame.KMOD_*).
+
+    Methods:
+        - empty(): Create an input state without any input.
+        - clear_edges(): Get a copy of the input state with the per-frame edges consumed.
+    """
+    mouse_pos: tuple = (0, 0)
+    mouse_delta: tuple = (0, 0)
+    buttons_down: tuple = NO_BUTTONS
+    buttons_held: tuple = NO_BUTTONS
+    buttons_up: tuple = NO_BUTTONS
+    wheel: int = 0
+    modifiers: int = 0
+
+    @classmethod
+    def empty(cls):
+        """
+        Create an input state without any input.
+
+        Returns:
+            InputState: The empty input state.
+        """
+        return cls()
+
+    def clear_edges(self):
+        """
+        Get a copy of the input state with the per-frame edges consumed.
+
+        Returns:
+            InputState: The input state keeping only the position, held buttons and modifiers.
+        """
+        return replace(self, mouse_delta=(0, 0), buttons_down=NO_BUTTONS, buttons_up=NO_BUTTONS, wheel=0)
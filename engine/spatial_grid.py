@@ -0,0 +1,126 @@
+# spatial_grid.py
+
+import pygame
+
+
+class SpatialGrid:
+    """
+    SpatialGrid indexes rects in a uniform grid for fast point queries.
+
+    Attributes:
+        - cell_size (int): Width and height of a grid cell in pixels.
+        - cells (dict): Sets of keys, keyed by (column, row) cell coordinates.
+        - rects (dict): Indexed rects, keyed by their keys.
+
+    Methods:
+        Index Management:
+            - insert(key, rect): Insert or move a rect in the grid.
+            - remove(key): Remove a rect from the grid.
+            - clear(): Remove all rects from the grid.
+
+        Queries:
+            - get_cells(rect): Get the coordinates of the cells covered by a rect.
+            - query_point(pos): Get the keys of the rects containing a point.
+    """
+    def __init__(self, cell_size=64):
+        """
+        Initialize the SpatialGrid instance.
+
+        Args:
+            cell_size (int): Width and height of a grid cell in pixels.
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+        self.rects = {}
+
+    """
+    Index Management
+        - insert
+        - remove
+        - clear
+    """
+    def insert(self, key, rect):
+        """
+        Insert or move a rect in the grid.
+
+        Args:
+            key (hashable): Key identifying the rect.
+            rect (pygame.Rect): The rect to index.
+        """
+        previous_rect = self.rects.get(key)
+        if previous_rect == rect:
+            return
+
+        # Move the key only between the cells that changed
+        previous_cells = self.get_cells(previous_rect) if previous_rect else set()
+        current_cells = self.get_cells(rect)
+        for cell in previous_cells - current_cells:
+            keys = self.cells[cell]
+            keys.discard(key)
+            if not keys:
+                del self.cells[cell]
+        for cell in current_cells - previous_cells:
+            self.cells.setdefault(cell, set()).add(key)
+
+        self.rects[key] = pygame.Rect(rect)
+
+    def remove(self, key):
+        """
+        Remove a rect from the grid.
+
+        Args:
+            key (hashable): Key identifying the rect.
+        """
+        rect = self.rects.pop(key, None)
+        if rect is None:
+            return
+
+        for cell in self.get_cells(rect):
+            keys = self.cells[cell]
+            keys.discard(key)
+            if not keys:
+                del self.cells[cell]
+
+    def clear(self):
+        """
+        Remove all rects from the grid.
+        """
+        self.cells.clear()
+        self.rects.clear()
+
+    """
+    Queries
+        - get_cells
+        - query_point
+    """
+    def get_cells(self, rect):
+        """
+        Get the coordinates of the cells covered by a rect.
+
+        Args:
+            rect (pygame.Rect): The rect to locate.
+
+        Returns:
+            set: Coordinates (column, row) of the covered cells.
+        """
+        first_column, first_row = rect.left // self.cell_size, rect.top // self.cell_size
+        last_column = (rect.right - 1) // self.cell_size if rect.width else first_column
+        last_row = (rect.bottom - 1) // self.cell_size if rect.height else first_row
+        return {(column, row)
+                for column in range(first_column, last_column + 1)
+                for row in range(first_row, last_row + 1)}
+
+    def query_point(self, pos):
+        """
+        Get the keys of the rects containing a point.
+
+        Args:
+            pos (tuple): The (x, y) position to query.
+
+        Returns:
+            set: Keys of the rects containing the point.
+        """
+        keys = self.cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size))
+        if not keys:
+            return set()
+        return {key for key in keys if self.rects[key].collidepoint(pos)}
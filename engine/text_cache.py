@@ -0,0 +1,94 @@
+# text_cache.py
+
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    TextCache keeps rendered text surfaces so identical strings are rendered only once.
+
+    Surfaces are keyed by (font, text, color, antialias, background) and evicted least recently
+    used first when the cache exceeds its memory budget. Evicted surfaces stay valid for the
+    elements still drawing them.
+
+    Attributes:
+        - budget (int): Maximum number of bytes held by the cache.
+        - entries (OrderedDict): Rendered surfaces and their size in bytes, in LRU order.
+        - total_bytes (int): Number of bytes held by the cache.
+        - hits (int): Number of renders served from the cache.
+        - misses (int): Number of renders that required rendering the text.
+
+    Methods:
+        Cache Access:
+            - render(font, text, color, antialias=True, background=None): Get a rendered text surface.
+
+        Cache Management:
+            - evict(): Evict entries until the cache fits its budget.
+            - clear(): Remove all entries.
+    """
+    def __init__(self, budget=8 * 1024 * 1024):
+        """
+        Initialize the TextCache instance.
+
+        Args:
+            budget (int): Maximum number of bytes held by the cache.
+        """
+        self.budget = budget
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    """
+    Cache Access
+        - render
+    """
+    def render(self, font, text, color, antialias=True, background=None):
+        """
+        Get a rendered text surface.
+        The returned surface is shared and must not be modified.
+
+        Args:
+            font (pygame.font.Font): Font used to render the text.
+            text (str): Text to render.
+            color (tuple): Text color.
+            antialias (bool): Whether to render with antialiasing.
+            background (tuple or None): Background color, or None for a transparent background.
+
+        Returns:
+            pygame.Surface: The rendered text.
+        """
+        key = (font, text, tuple(color), antialias, tuple(background) if background else None)
+        entry = self.entries.get(key)
+        if entry:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[0]
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        size_bytes = surface.get_pitch() * surface.get_height()
+        self.entries[key] = (surface, size_bytes)
+        self.total_bytes += size_bytes
+        self.evict()
+        return surface
+
+    """
+    Cache Management
+        - evict
+        - clear
+    """
+    def evict(self):
+        """
+        Evict entries, least recently used first, until the cache fits its budget.
+        """
+        while self.total_bytes > self.budget and len(self.entries) > 1:
+            _, (_, size_bytes) = self.entries.popitem(last=False)
+            self.total_bytes -= size_bytes
+
+    def clear(self):
+        """
+        Remove all entries.
+        """
+        self.entries.clear()
+        self.total_bytes = 0
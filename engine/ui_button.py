@@ -12,8 +12,8 @@ class UIButton(UIElement):
         Inherits from UIElement:
             - element_type (str): The type of the UI element.
             - element_id (str): ID of the UI element.
-            - config (dict): Configuration dictionary for the element.
-            - managers (dict): Dictionary of manager instances.
+            - style (UIStyle): Shared style of the element.
+            - ui_manager (UIManager): The UIManager, which provides the other managers.
             - logger (Logger): Logger instance for logging.
             - x, y, width, height, label, font_name, font_size, color, image_path, action_str,
               font, image, rect, text_rect, text_surface, surface
@@ -21,20 +21,23 @@ class UIButton(UIElement):
         UIButton Attributes:
             - action_str (str)
             - action (Callable): The action to be executed when the button is clicked.
+            - action_key (hashable): Key coalescing the queued executions of the action.
 
     Methods:
         Action Resolution:
-            - resolve_action(action_str): Resolve the action string to a callable function with arguments.
+            - resolve_action(action_str): Resolve the action string to a callable through the action registry.
             - default_action(): Defines a default action when the specified action cannot be found.
-            - parse_arguments(args_str): Parses a string of arguments into a tuple of arguments.
 
         Interaction:
-            - click(): Triggers the action associated with clicking the button.
+            - click(): Queue the action associated with clicking the button.
+            - debug(*args): Log the arguments of a debug action.
 
         Game Loop:
-            - update(mouse_pos, mouse_clicks): Updates the UIButton's state.
+            - update(input_state, hovered=None): Updates the UIButton's state.
             - draw(surface): Draws the UIButton on the provided surface.
     """
+    __slots__ = ('action_str', 'action', 'action_key')
+
     def __init__(self, element_id, config, managers, logger):
         """
         Initialize the UIButton.
@@ -48,18 +51,19 @@ class UIButton(UIElement):
         super().__init__('button', element_id, config, managers, logger)
 
         # Action Attributes
-        self.action_str = self.config.get('action')
+        self.action_str = config.get('action')
         self.action = self.resolve_action(self.action_str)
+        self.action_key = self.ui_manager.action_registry.get_action_key(self.action_str, self) \
+            if self.action else None
 
     """
     Action Resolution
         - resolve_action
         - default_action
-        - parse_arguments
     """
     def resolve_action(self, action_str):
         """
-        Resolve the action string to a callable function with arguments.
+        Resolve the action string to a callable through the shared action registry.
 
         Args:
             action_str (str): String representing the action to resolve.
@@ -70,40 +74,8 @@ class UIButton(UIElement):
         if not action_str:
             return None
 
-        try:
-            action_parts = action_str.split('(', 1)
-            method_str = action_parts[0].strip()
-            args_str = action_parts[1][:-1] if len(action_parts) > 1 else ''
-            args = self.parse_arguments(args_str)
-
-            method_parts = method_str.split('.')
-            if len(method_parts) > 1:
-                # Resolve method in the context of managers
-                obj = self
-                for part in method_parts[:-1]:
-                    obj = getattr(obj, part, None)
-                    if obj is None:
-                        self.logger.log_warning(f"Manager or method '{'.'.join(method_parts[:-1])}' not found.")
-                        return lambda: self.default_action()
-                method_name = method_parts[-1]
-                if hasattr(obj, method_name):
-                    method = getattr(obj, method_name)
-                    return lambda: method(*args)
-                else:
-                    self.logger.log_warning(f"Method '{method_name}' not found in manager"
-                                            f" '{'.'.join(method_parts[:-1])}'.")
-                    return lambda: self.default_action()
-            else:
-                # Resolve method within the class itself
-                if hasattr(self, method_str):
-                    method = getattr(self, method_str)
-                    return lambda: method(*args)
-                else:
-                    self.logger.log_warning(f"Method '{method_str}' not found in UIElement.")
-                    return lambda: self.default_action()
-        except Exception as e:
-            self.logger.log_error(f"Error resolving action '{action_str}': {e}")
-            return lambda: self.default_action()
+        action = self.ui_manager.action_registry.get_action(action_str, self)
+        return action if action else self.default_action
 
     def default_action(self):
         """
@@ -111,51 +83,44 @@ class UIButton(UIElement):
         """
         self.logger.log_warning(f"Action for element '{self.element_id}' is not defined.")
 
-    @staticmethod
-    def parse_arguments(args_str):
-        """
-        Parse a string of arguments into a tuple of arguments.
-
-        Args:
-            args_str (str): String representing arguments in the format 'arg1, arg2, ...'
-
-        Returns:
-            tuple: Tuple of parsed arguments.
-        """
-        import ast
-        try:
-            args = ast.literal_eval(f"({args_str})")
-            return args if isinstance(args, tuple) else (args,)
-        except (SyntaxError, ValueError) as e:
-            print(f"Error parsing arguments '{args_str}': {e}")
-            return ()
-
     """
     Interaction
         - click
+        - debug
     """
     def click(self):
         """
-        Triggers the action associated with clicking the button.
+        Queue the action associated with clicking the button.
+        The UIManager executes it after the update pass; identical actions of a frame run once,
+        and element actions only coalesce with the same button's clicks.
         """
         if self.action:
-            self.action()
+            self.ui_manager.action_queue.push(self.action, self.action_key)
+
+    def debug(self, *args):
+        """
+        Log the arguments of a debug action, used to test action parsing from the menu configuration.
+
+        Args:
+            *args: Arguments of the action.
+        """
+        self.logger.log_debug(f"Debug action of element '{self.element_id}': {args}")
 
     """
     Game Loop
         - update
         - draw
     """
-    def update(self, mouse_pos, mouse_clicks):
+    def update(self, input_state, hovered=None):
         """
         Update the UIButton state.
 
         Args:
-            mouse_pos (tuple): Current position of the mouse.
-            mouse_clicks (list): List of mouse click states.
+            input_state (InputState): Input snapshot of the frame.
+            hovered (bool or None): Hit-test result provided by the UIManager, or None to test the collision rect.
         """
-        super().update(mouse_pos, mouse_clicks)
-        if self.hovered_state and mouse_clicks[1]:
+        super().update(input_state, hovered)
+        if self.hovered_state and input_state.buttons_down[1]:
             self.click()
 
     def draw(self, surface):
@@ -164,5 +129,8 @@ class UIButton(UIElement):
 
         Args:
             surface (pygame.Surface): The surface to draw the UIButton on.
+
+        Returns:
+            int: Number of blits issued.
         """
-        super().draw(surface)
+        return super().draw(surface)
@@ -0,0 +1,523 @@
+# ui_container.py
+
+import bisect
+from engine.spatial_grid import SpatialGrid
+from engine.ui_element import UIElement
+
+
+def iter_element_configs(elements):
+    """
+    Iterate over the element configurations of a menu, including the children of the containers.
+
+    Args:
+        elements (dict): Element configurations, keyed by element type, then by element ID.
+
+    Yields:
+        tuple: The element type, element ID and configuration of each element, parents first.
+    """
+    for element_type, element_configs in elements.items():
+        for element_id, config in element_configs.items():
+            yield element_type, element_id, config
+            if 'children' in config:
+                yield from iter_element_configs(config['children'])
+
+
+class UIContainer(UIElement):
+    """
+    UIContainer represents a panel holding child UI elements positioned relative to it.
+
+    The UIManager only sees the container: its children are updated, hit-tested and drawn through it.
+    Children are hit-tested through a spatial grid of rects relative to the origin instead of being scanned.
+    Moving the container moves its subtree, and a changed child wakes only its ancestors. Inactive or
+    hidden containers skip their whole subtree, and containers off the display are culled as a whole.
+
+    Attributes:
+        Inherits from UIElement:
+            - element_type (str): The type of the UI element.
+            - element_id (str): ID of the UI element.
+            - style (UIStyle): Shared style of the element; the rectangle is the panel.
+            - ui_manager (UIManager): The UIManager, which provides the other managers.
+            - logger (Logger): Logger instance for logging.
+            - parent (UIContainer or None): Container holding the container.
+
+        UIContainer Attributes:
+            - children (list): Child elements ordered by layer, then by insertion order.
+            - child_map (dict): Child elements, keyed by element ID.
+            - child_layers (list): Layers of the elements in children, used for bisection.
+            - child_offsets (dict): Positions of the children relative to the origin, keyed by element ID.
+            - child_rects (dict): Cached bounding rects of the children, keyed by element ID.
+            - child_grid (SpatialGrid): Hit rects of the children relative to the origin, keyed by element ID.
+            - stale_rects (set): IDs of the children whose cached bounding rect must be recomputed.
+            - awake_children (set): IDs of the children to update even when the mouse is outside the container.
+            - world_rect (pygame.Rect or None): Cached rect covering the container and its subtree.
+            - world_rect_dirty (bool): Whether the world rect must be recomputed.
+            - children_dirty (bool): Whether a child changed since the subtree was last drawn.
+
+    Methods:
+        Child Management:
+            - add_child(element): Add a child, positioned relative to the container.
+            - remove_child(element_id): Remove a child.
+            - get_child(element_id): Get a child by ID.
+            - move_child(element_id, offset_x, offset_y): Move a child relative to the container.
+            - get_origin(): Get the point the children are positioned from.
+            - layout_children(): Move the children to their offsets from the origin.
+
+        Setup Methods:
+            - setup_children(config): Create the children of the configuration.
+            - get_surface_bytes(): Get the memory used by the surfaces of the subtree.
+            - release_resources(): Release the shared resources held by the subtree.
+
+        State Methods:
+            - reset_state(config): Reset the container and its children to a configuration.
+
+        Dirty Tracking:
+            - wake_child(element): Record a change of a child and propagate it to the ancestors.
+            - mark_dirty(): Mark the container as needing to be redrawn.
+            - mark_geometry_dirty(): Mark the rects of the container as needing to be realigned.
+            - get_world_rect(): Get the rect covering the subtree, recomputing only the stale child rects.
+            - is_dirty(): Check whether the subtree changed since it was last drawn.
+            - is_animating(): Check whether an element of the subtree is being dragged.
+            - pop_dirty_rects(): Get the regions of the subtree changed since the last call.
+
+        Game Loop:
+            - update(input_state, hovered=None): Update the container, then its children.
+            - update_graphics(): Realign the container and move its children if it moved.
+            - update_children(input_state): Update the hovered and awake children.
+            - collect_blits(blit_sequence): Append the blits of the container and its on-screen children.
+    """
+    __slots__ = ('children', 'child_map', 'child_layers', 'child_offsets', 'child_rects', 'child_grid',
+                 'stale_rects', 'awake_children', 'world_rect', 'world_rect_dirty', 'children_dirty')
+
+    def __init__(self, element_id, config, managers, logger):
+        """
+        Initialize the UIContainer and create the children of its configuration.
+
+        Args:
+            element_id (str): ID of the UI element.
+            config (dict): Configuration dictionary for the element, with the children configurations
+                under 'children', keyed by element type, then by element ID.
+            managers (dict): Dictionary of manager instances.
+            logger (Logger): Logger instance for logging.
+        """
+        # Tree Attributes, needed by the dirty tracking during the UIElement initialization
+        self.children = []
+        self.child_map = {}
+        self.child_layers = []
+        self.child_offsets = {}
+        self.child_rects = {}
+        self.child_grid = SpatialGrid(managers['ui_manager'].config["grid_cell_size"])
+        self.stale_rects = set()
+        self.awake_children = set()
+        self.world_rect = None
+        self.world_rect_dirty = True
+        self.children_dirty = False
+
+        super().__init__('container', element_id, {'text_enabled': False, **config}, managers, logger)
+
+        self.setup_children(config)
+
+    """
+    Child Management
+        - add_child
+        - remove_child
+        - get_child
+        - move_child
+        - get_origin
+        - layout_children
+    """
+    def add_child(self, element):
+        """
+        Add a child, positioned relative to the container: its position is used as the offset from the origin.
+
+        Args:
+            element (UIElement): The child element.
+        """
+        if element.element_id in self.child_map:
+            self.remove_child(element.element_id)
+
+        # Insert after the children of the same layer to keep the insertion order
+        index = bisect.bisect_right(self.child_layers, element.layer)
+        self.children.insert(index, element)
+        self.child_layers.insert(index, element.layer)
+        self.child_map[element.element_id] = element
+        self.child_offsets[element.element_id] = (element.pos_x, element.pos_y)
+
+        element.parent = self
+        origin_x, origin_y = self.get_origin()
+        element.set_position(origin_x + element.pos_x, origin_y + element.pos_y)
+        self.wake_child(element)
+
+    def remove_child(self, element_id):
+        """
+        Remove a child.
+
+        Args:
+            element_id (str): ID of the child to remove.
+
+        Returns:
+            UIElement or None: The removed child, or None if it does not exist.
+        """
+        element = self.get_child(element_id)
+        if element is None:
+            self.logger.log_warning(f"Child '{element_id}' does not exist in container '{self.element_id}'.")
+            return None
+
+        index = self.children.index(element)
+        del self.children[index]
+        del self.child_layers[index]
+        del self.child_map[element_id]
+        del self.child_offsets[element_id]
+        self.child_rects.pop(element_id, None)
+        self.child_grid.remove(element_id)
+        self.stale_rects.discard(element_id)
+        self.awake_children.discard(element_id)
+        element.parent = None
+        element.release_resources()
+
+        # The area covered by the child must be redrawn
+        self.world_rect_dirty = True
+        self.mark_dirty()
+        return element
+
+    def get_child(self, element_id):
+        """
+        Get a child by ID.
+
+        Args:
+            element_id (str): ID of the child.
+
+        Returns:
+            UIElement or None: The child, or None if it does not exist.
+        """
+        return self.child_map.get(element_id)
+
+    def move_child(self, element_id, offset_x, offset_y):
+        """
+        Move a child relative to the container.
+
+        Args:
+            element_id (str): ID of the child.
+            offset_x (int): Horizontal position relative to the origin.
+            offset_y (int): Vertical position relative to the origin.
+        """
+        element = self.get_child(element_id)
+        if element is None:
+            self.logger.log_warning(f"Child '{element_id}' does not exist in container '{self.element_id}'.")
+            return
+
+        self.child_offsets[element_id] = (offset_x, offset_y)
+        origin_x, origin_y = self.get_origin()
+        element.set_position(origin_x + offset_x, origin_y + offset_y)
+
+    def get_origin(self):
+        """
+        Get the point the children are positioned from.
+
+        Returns:
+            tuple: The top-left corner of the panel, or the anchor of the container without a rectangle.
+        """
+        if self.rectangle_rect:
+            return self.rectangle_rect.topleft
+        return self.pos_x, self.pos_y
+
+    def layout_children(self):
+        """
+        Move the children to their offsets from the origin. The children realign on their next update.
+        """
+        origin_x, origin_y = self.get_origin()
+        child_offsets = self.child_offsets
+        for child in self.children:
+            offset_x, offset_y = child_offsets[child.element_id]
+            child.set_position(origin_x + offset_x, origin_y + offset_y)
+
+    """
+    Setup Methods
+        - setup_children
+        - get_surface_bytes
+        - release_resources
+    """
+    def setup_children(self, config):
+        """
+        Create the children of the configuration.
+
+        Args:
+            config (dict): Configuration dictionary of the container.
+        """
+        for element_type, elements in config.get('children', {}).items():
+            for element_id, child_config in elements.items():
+                self.add_child(self.ui_manager.create_element(element_type, element_id, child_config))
+
+    def get_surface_bytes(self):
+        """
+        Get the memory used by the surfaces owned by the container and its subtree.
+
+        Returns:
+            int: Number of bytes used by the pixels of the owned surfaces.
+        """
+        return super().get_surface_bytes() + sum(child.get_surface_bytes() for child in self.children)
+
+    def release_resources(self):
+        """
+        Release the shared resources held by the container and its subtree.
+        """
+        super().release_resources()
+        for child in self.children:
+            child.release_resources()
+
+    """
+    State Methods
+        - reset_state
+    """
+    def reset_state(self, config):
+        """
+        Reset the container and its children to a configuration.
+
+        Args:
+            config (dict): Configuration dictionary of the container.
+        """
+        super().reset_state(config)
+
+        # Reset the children, then position them from their configured offsets
+        for elements in config.get('children', {}).values():
+            for element_id, child_config in elements.items():
+                child = self.get_child(element_id)
+                if child:
+                    child.reset_state(child_config)
+                    self.child_offsets[element_id] = (child.pos_x, child.pos_y)
+        self.layout_children()
+
+    """
+    Dirty Tracking
+        - mark_dirty
+        - mark_geometry_dirty
+        - wake_child
+        - get_world_rect
+        - is_dirty
+        - is_animating
+        - pop_dirty_rects
+    """
+    def mark_dirty(self):
+        """
+        Mark the container as needing to be redrawn; its own rects may have changed with its state.
+        """
+        self.world_rect_dirty = True
+        super().mark_dirty()
+
+    def mark_geometry_dirty(self):
+        """
+        Mark the rects of the container as needing to be realigned.
+        """
+        self.world_rect_dirty = True
+        super().mark_geometry_dirty()
+
+    def wake_child(self, element):
+        """
+        Record a change of a child and propagate it to the ancestors.
+
+        Args:
+            element (UIElement): The changed child.
+        """
+        self.awake_children.add(element.element_id)
+        self.stale_rects.add(element.element_id)
+        self.world_rect_dirty = True
+        if self.children_dirty:
+            return
+
+        # Wake the ancestors only once per drawn frame
+        self.children_dirty = True
+        self.wake()
+
+    def get_world_rect(self):
+        """
+        Get the rect covering the container and its subtree, refreshing the grid of the stale children.
+        Only the bounding rects of the children changed since the last call are recomputed.
+
+        Returns:
+            pygame.Rect or None: The world rect, or None if the subtree draws nothing.
+        """
+        if not self.world_rect_dirty:
+            return self.world_rect
+
+        # A hidden subtree draws nothing; its stale children are recomputed once it is shown
+        if not self.state_visible:
+            self.world_rect = None
+            self.world_rect_dirty = False
+            return None
+
+        # Recompute the cached rects of the stale children only, and move them in the grid
+        child_rects = self.child_rects
+        origin_x, origin_y = self.get_origin()
+        for element_id in self.stale_rects:
+            child = self.child_map.get(element_id)
+            if child is None:
+                continue
+
+            # Nested containers are hit-tested with their world rect to reach their children
+            if isinstance(child, UIContainer):
+                child_rects[element_id] = hit_rect = child.get_world_rect()
+            else:
+                child_rects[element_id] = child.get_bounding_rect()
+                hit_rect = child.collision_rect
+            if hit_rect:
+                self.child_grid.insert(element_id, hit_rect.move(-origin_x, -origin_y))
+            else:
+                self.child_grid.remove(element_id)
+        self.stale_rects.clear()
+
+        rects = [r for r in (self.get_bounding_rect(), *child_rects.values()) if r]
+        self.world_rect = rects[0].unionall(rects[1:]) if rects else None
+        self.world_rect_dirty = False
+        return self.world_rect
+
+    def is_dirty(self):
+        """
+        Check whether the container or one of its children changed since the subtree was last drawn.
+
+        Returns:
+            bool: True if the subtree needs to be updated and redrawn.
+        """
+        return self.dirty or self.geometry_dirty or self.children_dirty
+
+    def is_animating(self):
+        """
+        Check whether the container or one of its awake children is being dragged.
+
+        Returns:
+            bool: True if an element of the subtree is being animated or dragged.
+        """
+        if self.dragging:
+            return True
+        return any(self.child_map[element_id].is_animating() for element_id in self.awake_children)
+
+    def pop_dirty_rects(self):
+        """
+        Get the regions of the subtree changed since the last call and reset the dirty state.
+        A changed container refreshes its whole world rect; otherwise only the changed children are refreshed.
+
+        Returns:
+            list: The changed regions.
+        """
+        if not self.dirty and not self.children_dirty:
+            return []
+
+        world_rect = self.get_world_rect() if self.state_visible else None
+        if self.dirty:
+            # Both the old and the new area of the subtree must be refreshed
+            dirty_rects = [r for r in (self.drawn_rect, world_rect) if r]
+            for child in self.children:
+                child.pop_dirty_rects()
+        elif world_rect:
+            dirty_rects = []
+            for child in self.children:
+                dirty_rects.extend(child.pop_dirty_rects())
+        else:
+            # The changes of a hidden subtree are refreshed when the container is shown again
+            dirty_rects = []
+
+        self.drawn_rect = world_rect
+        self.dirty = False
+        self.children_dirty = False
+        return dirty_rects
+
+    """
+    Game Loop
+        - update
+            - update_graphics
+            - update_children
+        - collect_blits
+    """
+    def update(self, input_state, hovered=None):
+        """
+        Update the container, then its children. Inactive or hidden containers skip their subtree.
+
+        Args:
+            input_state (InputState): Input snapshot of the frame.
+            hovered (bool or None): Hit-test result provided by the UIManager, or None to test the collision rect.
+        """
+        if not self.state_active:
+            return
+
+        self.update_graphics()
+        self.update_events(input_state, hovered)
+        if self.state_visible:
+            self.update_children(input_state)
+
+    def update_graphics(self):
+        """
+        Realign the container and move its children if it moved.
+        """
+        moved = self.geometry_dirty
+        super().update_graphics()
+        if moved:
+            self.layout_children()
+
+    def update_children(self, input_state):
+        """
+        Update the children under the mouse and the awake ones (moved, changed, hovered or dragged).
+        The children under the mouse are found through the grid, so idle children away from the mouse
+        are never visited, and neither is any child of an idle container away from the mouse.
+
+        Args:
+            input_state (InputState): Input snapshot of the frame.
+        """
+        mouse_pos = input_state.mouse_pos
+        world_rect = self.get_world_rect()
+        pointer_inside = bool(world_rect) and world_rect.collidepoint(mouse_pos)
+
+        previous_awake = self.awake_children
+        if not pointer_inside and not previous_awake:
+            return
+
+        # Hit-test in coordinates relative to the origin, then add the children still awake
+        origin_x, origin_y = self.get_origin()
+        candidate_ids = set(previous_awake)
+        if pointer_inside:
+            candidate_ids |= self.child_grid.query_point((mouse_pos[0] - origin_x, mouse_pos[1] - origin_y))
+        candidates = sorted((self.child_map[element_id] for element_id in candidate_ids), key=lambda c: c.layer)
+
+        awake_children = self.awake_children = set()
+        for child in candidates:
+            element_id = child.element_id
+            hovered = pointer_inside and bool(child.collision_rect) and child.collision_rect.collidepoint(mouse_pos)
+            child.update(input_state, hovered)
+
+            # Disabled children skip their update but are still drawn, so they follow the container
+            if not child.state_active:
+                child.update_graphics()
+
+            # Keep the offset of a child which moved itself, e.g. by being dragged
+            if child.geometry_dirty:
+                self.child_offsets[element_id] = (child.pos_x - origin_x, child.pos_y - origin_y)
+
+            # Children which must be revisited after the mouse leaves stay awake
+            if child.geometry_dirty or child.hovered_state or child.is_animating() \
+                    or (isinstance(child, UIContainer) and child.awake_children):
+                awake_children.add(element_id)
+
+    def collect_blits(self, blit_sequence):
+        """
+        Append the blits of the container and of its children on the display, in layer order.
+
+        Args:
+            blit_sequence (list): Blit sequence to be submitted with pygame.Surface.blits.
+        """
+        if not self.state_visible:
+            return
+
+        # Cull the whole subtree, then the children only when it is partially on the display
+        world_rect = self.get_world_rect()
+        display = self.ui_manager.display if self.ui_manager else None
+        view_rect = display.get_rect() if display else None
+        if view_rect and world_rect and not view_rect.colliderect(world_rect):
+            return
+
+        super().collect_blits(blit_sequence)
+        if view_rect is None or world_rect is None or view_rect.contains(world_rect):
+            for child in self.children:
+                child.collect_blits(blit_sequence)
+        else:
+            child_rects = self.child_rects
+            for child in self.children:
+                child_rect = child_rects.get(child.element_id)
+                if child_rect and view_rect.colliderect(child_rect):
+                    child.collect_blits(blit_sequence)
@@ -1,41 +1,50 @@
 # ui_element.py
 
 import pygame
-from utils import setup_managers
+from engine.ui_style import UIStyle, style_properties
 
+# Per-element options and their default values; style options are defined in ui_style.py
 DEFAULT_CONFIG = {
     'pos_x': 0,
     'pos_y': 0,
-    'align': 'center',
-    'rectangle_enabled': True,
-    'image_enabled': True,
-    'shadow_enabled': True,
-    'shadow_color': (255, 255, 255),
-    'shadow_offset': (5, 5),
-    'shadow_blur': 150,
-    'text_enabled': True,
-    'text_color': (255, 255, 255),
-    'text_align': 'center',
-    'text_font_size': 36,
-    'hover_color': (255, 0, 0),
-    'outline_enabled': True,
-    'outline_color': (0, 255, 255),
-    'outline_border': 1,
-    'collision_enabled': True,
-    'collision_color': (255, 0, 0),
-    'collision_border': 1,
+    'text_label': None,
     'state_active': True,
     'state_visible': True,
-    'layer': 0,
-    'drag_enabled': True,
-    'drag_exclusive': True
+    'layer': 0
 }
 
 
+@style_properties
 class UIElement:
+    __slots__ = (
+        # Core Attributes
+        'element_type', 'element_id', 'style', 'ui_manager', 'logger', 'parent',
+        # Position Attributes
+        'geometry_dirty', '_pos_x', '_pos_y', 'store', 'store_row',
+        # Rectangle Attributes
+        'rectangle_surface', 'rectangle_rect', 'rectangle_states',
+        # Image Attributes
+        'image', 'image_surface', 'image_rect',
+        # Shadow Attributes
+        'shadow_surface', 'shadow_rect', 'shadow_pos_x', 'shadow_pos_y',
+        # Text Attributes
+        'text_label', 'text_surface', 'text_rect', 'text_font',
+        # Outline Attributes
+        'outline_rect', 'outline_surface', 'outline_pos_x', 'outline_pos_y',
+        # Collision Attributes
+        'collision_rect', 'collision_surface',
+        # Hover and State Attributes
+        'hovered_state', 'state_active', 'state_visible', 'visual_state', 'layer',
+        # Drag Attributes
+        'dragging', 'drag_offset', 'original_pos',
+        # Dirty and Baked Attributes
+        'dirty', 'drawn_rect', 'baked_surfaces'
+    )
+
     def __init__(self, element_type, element_id, config, managers, logger):
         """
         Initialize UIElement with its type, ID, config, and necessary managers.
+        Style options are read from a shared UIStyle; the config itself is not kept.
 
         Args:
             element_type (str): The type of element.
@@ -47,99 +56,197 @@ class UIElement:
         # Core Attributes
         self.element_type = element_type
         self.element_id = element_id
-        self.config = {**DEFAULT_CONFIG, **config}
-        self.managers = managers
+        self.style = UIStyle.from_config(config)
         self.logger = logger
 
-        # Set up references to managers
-        setup_managers(self, managers)
+        # Set up the reference to the UIManager, which provides the other managers
+        self.ui_manager = managers.get('ui_manager') if managers else None
+
+        # Container holding the element, set by UIContainer.add_child
+        self.parent = None
 
         # Position Attributes
-        self.pos_x = self.config.get('pos_x')
-        self.pos_y = self.config.get('pos_y')
-        self.align = self.config.get('align')
+        self.geometry_dirty = True
+        self._pos_x = None
+        self._pos_y = None
+        self.store = None
+        self.store_row = None
+        self.pos_x = config.get('pos_x', DEFAULT_CONFIG['pos_x'])
+        self.pos_y = config.get('pos_y', DEFAULT_CONFIG['pos_y'])
 
         # Rectangle Attributes
-        self.rectangle_enabled = self.config.get('rectangle_enabled')
-        self.rectangle_width = self.config.get('rectangle_width')
-        self.rectangle_height = self.config.get('rectangle_height')
-        self.rectangle_color = self.config.get('rectangle_color')
         self.rectangle_surface = None
         self.rectangle_rect = None
+        self.rectangle_states = {}
 
         # Image Attributes
-        self.image_enabled = self.config.get('image_enabled')
-        self.image_path = self.config.get('image_path')
-        self.image_width = self.config.get('image_width')
-        self.image_height = self.config.get('image_height')
         self.image = None
         self.image_surface = None
         self.image_rect = None
 
         # Shadow Attributes
-        self.shadow_enabled = self.config.get('shadow_enabled')
-        self.shadow_color = self.config.get('shadow_color')
-        self.shadow_offset = self.config.get('shadow_offset')
-        self.shadow_blur = self.config.get('shadow_blur')
         self.shadow_surface = None
         self.shadow_rect = None
         self.shadow_pos_x = None
         self.shadow_pos_y = None
 
         # Text Attributes
-        self.text_enabled = self.config.get('text_enabled')
-        self.text_label = self.config.get('text_label')
-        self.text_color = self.config.get('text_color')
-        self.text_align = self.config.get('text_align')
-        self.text_font_name = self.config.get('text_font_name')
-        self.text_font_size = self.config.get('text_font_size')
+        self.text_label = config.get('text_label', DEFAULT_CONFIG['text_label'])
         self.text_surface = None
         self.text_rect = None
         self.text_font = None
 
         # Outline Attributes
-        self.outline_enabled = self.config.get('outline_enabled')
-        self.outline_color = self.config.get('outline_color')
-        self.outline_border = self.config.get('outline_border')
         self.outline_rect = None
         self.outline_surface = None
         self.outline_pos_x = None
         self.outline_pos_y = None
 
         # Collision Attributes
-        self.collision_enabled = self.config.get('collision_enabled')
-        self.collision_width = self.config.get('collision_width')
-        self.collision_height = self.config.get('collision_height')
-        self.collision_color = self.config.get('collision_color')
-        self.collision_border = self.config.get('collision_border')
         self.collision_rect = None
         self.collision_surface = None
 
         # Hover Attributes
-        self.hover_color = self.config.get('hover_color')
         self.hovered_state = False
 
         # State Attributes
-        self.state_active = self.config.get('state_active')
-        self.state_visible = self.config.get('state_visible')
-        
+        self.state_active = config.get('state_active', DEFAULT_CONFIG['state_active'])
+        self.state_visible = config.get('state_visible', DEFAULT_CONFIG['state_visible'])
+
+        # Visual State Attributes
+        self.visual_state = 'normal' if self.state_active else 'disabled'
+
         # TBD Attributes
-        self.layer = self.config.get('layer')
+        self.layer = config.get('layer', DEFAULT_CONFIG['layer'])
 
         # Drag Attributes
-        self.drag_enabled = self.config.get('drag_enabled')
-        self.drag_exclusive = self.config.get('drag_exclusive')
         self.dragging = False
         self.drag_offset = None
         self.original_pos = None
 
+        # Dirty Attributes
+        self.dirty = True
+        self.drawn_rect = None
+
+        # Baked Attributes
+        self.baked_surfaces = {}
+
         # Initialize graphical components
         self.setup_graphics()
 
+    """
+    Manager Properties
+    - managers
+    - main_manager
+    - window_manager
+    - audio_manager
+    """
+    @property
+    def managers(self):
+        """dict: Dictionary of manager instances."""
+        return self.ui_manager.managers
+
+    @property
+    def main_manager(self):
+        """MainManager: The main manager."""
+        return self.ui_manager.main_manager
+
+    @property
+    def window_manager(self):
+        """WindowManager: The window manager."""
+        return self.ui_manager.window_manager
+
+    @property
+    def audio_manager(self):
+        """AudioManager: The audio manager."""
+        return self.ui_manager.audio_manager
+
+    """
+    Position Properties
+    - pos_x
+    - pos_y
+    - set_position
+    - mark_geometry_dirty
+    - bind_store
+    - unbind_store
+    """
+    @property
+    def pos_x(self):
+        """int: Horizontal anchor position of the element, read from the UIStore row when bound."""
+        if self.store is None:
+            return self._pos_x
+        return int(self.store.positions[self.store_row, 0])
+
+    @pos_x.setter
+    def pos_x(self, value):
+        if value != self.pos_x:
+            if self.store is None:
+                self._pos_x = value
+            else:
+                self.store.set_coordinate(self.store_row, 0, value)
+            self.mark_geometry_dirty()
+
+    @property
+    def pos_y(self):
+        """int: Vertical anchor position of the element, read from the UIStore row when bound."""
+        if self.store is None:
+            return self._pos_y
+        return int(self.store.positions[self.store_row, 1])
+
+    @pos_y.setter
+    def pos_y(self, value):
+        if value != self.pos_y:
+            if self.store is None:
+                self._pos_y = value
+            else:
+                self.store.set_coordinate(self.store_row, 1, value)
+            self.mark_geometry_dirty()
+
+    def set_position(self, pos_x, pos_y):
+        """
+        Move the element; its rects are realigned on the next update.
+
+        Args:
+            pos_x (int): Horizontal anchor position.
+            pos_y (int): Vertical anchor position.
+        """
+        self.pos_x = pos_x
+        self.pos_y = pos_y
+
+    def mark_geometry_dirty(self):
+        """
+        Mark the rects of the element as needing to be realigned.
+        """
+        self.geometry_dirty = True
+        self.wake()
+
+    def bind_store(self, store, store_row):
+        """
+        Make the element a view of a UIStore row; the row holds the position from now on.
+
+        Args:
+            store (UIStore): The columnar store.
+            store_row (int): Row of the element in the store.
+        """
+        self.store = store
+        self.store_row = store_row
+
+    def unbind_store(self):
+        """
+        Detach the element from its UIStore row, keeping its current position.
+        """
+        if self.store is None:
+            return
+
+        self._pos_x, self._pos_y = self.store.get_position(self.store_row)
+        self.store = None
+        self.store_row = None
+
     """
     Helper Methods
     - create_surface_rect
     - align_rect
+    - count_surfaces
     """
     def create_surface_rect(self, width, height,
                             position=None, align=None,
@@ -148,6 +255,7 @@ class UIElement:
         # Create the surface with or without alpha channel
         surface_flags = pygame.SRCALPHA if alpha is not None else 0
         surface = pygame.Surface((width, height), surface_flags)
+        self.count_surfaces()
 
         # Create a rect from the surface
         rect = surface.get_rect()
@@ -202,6 +310,16 @@ class UIElement:
         else:
             self.logger.log_warning(f"Unsupported alignment value '{align}' provided.")
 
+    def count_surfaces(self, count=1):
+        """
+        Report surface allocations to the frame statistics.
+
+        Args:
+            count (int): Number of surfaces allocated.
+        """
+        if self.main_manager:
+            self.main_manager.frame_stats.add_surfaces(count)
+
     """
     Setup Methods
     - setup_graphics
@@ -210,6 +328,8 @@ class UIElement:
         - setup_shadow
         - setup_collision
         - setup_text
+    - get_surface_bytes
+    - release_resources
     """
     def setup_graphics(self):
         """Initialize and set up all graphical components."""
@@ -226,15 +346,15 @@ class UIElement:
         if not self.image_enabled or not self.image_path:
             return
 
-        # Load the image surface with alpha transparency
-        self.image = pygame.image.load(self.image_path).convert_alpha()
-        self.image_surface = self.image.copy()
+        # Get the shared image surface with alpha transparency from the image cache
+        image_cache = self.ui_manager.image_cache
+        self.image = image_cache.acquire(self.image_path)
 
         # Check if specific dimensions for the image are provided
         if self.image_width and self.image_height:
-            self.image_surface = pygame.transform.scale(self.image_surface, (self.image_width, self.image_height))
+            self.image_surface = image_cache.acquire(self.image_path, (self.image_width, self.image_height))
         else:
-            self.image_width, self.image_height = self.image_surface.get_size()
+            self.image_surface = self.image
 
         # Create the image rect
         self.image_rect = self.image_surface.get_rect()
@@ -244,18 +364,33 @@ class UIElement:
 
     def setup_rect(self):
         """
-        Set up the rectangle surface and rect.
+        Set up the rectangle surfaces of every visual state and the rectangle rect.
         """
         if not self.rectangle_enabled:
             return
 
-        # Create the rectangle surface and rect; fill the surface
-        self.rectangle_surface, self.rectangle_rect = self.create_surface_rect(
-            self.rectangle_width, self.rectangle_height,
-            position=(self.pos_x, self.pos_y), align=self.align,
-            color=self.rectangle_color, alpha=False,
-            shape=None, border_thickness=None
-        )
+        # Determine the color of each visual state; states without a color look normal
+        state_colors = {
+            'normal': self.rectangle_color,
+            'hovered': self.hover_color or self.rectangle_color,
+            'pressed': self.pressed_color or self.hover_color or self.rectangle_color,
+            'disabled': self.disabled_color or self.rectangle_color
+        }
+
+        # Create and fill one rectangle surface per distinct color
+        surfaces = {}
+        self.rectangle_states = {}
+        for state, color in state_colors.items():
+            if color not in surfaces:
+                surfaces[color], self.rectangle_rect = self.create_surface_rect(
+                    self.rectangle_width, self.rectangle_height,
+                    position=(self.pos_x, self.pos_y), align=self.align,
+                    color=color, alpha=False,
+                    shape=None, border_thickness=None
+                )
+            self.rectangle_states[state] = surfaces[color]
+
+        self.rectangle_surface = self.rectangle_states[self.visual_state]
 
     def setup_shadow(self):
         """
@@ -309,16 +444,126 @@ class UIElement:
         if not self.text_enabled:
             return
 
-        # Initialize the text_font
-        self.text_font = pygame.font.Font(self.text_font_name, self.text_font_size)
+        # Get the shared text_font from the font pool
+        self.text_font = self.ui_manager.get_font(self.text_font_name, self.text_font_size)
 
-        # Create the text surface and rect
-        self.text_surface = self.text_font.render(self.text_label, True, self.text_color)
+        # Get the text surface from the text cache and create its rect
+        self.text_surface = self.ui_manager.text_cache.render(self.text_font, self.text_label, self.text_color)
         self.text_rect = self.text_surface.get_rect()
 
         # Align the text rect
         self.align_rect(self.text_rect, self.text_align, (self.pos_x, self.pos_y))
 
+    def get_surface_bytes(self):
+        """
+        Get the memory used by the surfaces owned by the element.
+        Images and text surfaces are shared through the caches and are not counted.
+
+        Returns:
+            int: Number of bytes used by the pixels of the owned surfaces.
+        """
+        surfaces = {id(surface): surface for surface in (
+            *self.rectangle_states.values(), *self.baked_surfaces.values(),
+            self.rectangle_surface, self.shadow_surface, self.outline_surface, self.collision_surface
+        ) if surface}
+        return sum(surface.get_pitch() * surface.get_height() for surface in surfaces.values())
+
+    def release_resources(self):
+        """
+        Release the shared resources held by the element.
+        """
+        if self.image:
+            image_cache = self.ui_manager.image_cache
+            image_cache.release(self.image_path)
+            if self.image_surface is not self.image:
+                image_cache.release(self.image_path, (self.image_width, self.image_height))
+            self.image = None
+            self.image_surface = None
+
+    """
+    State Methods
+    - set_text
+    - set_active
+    - set_visible
+    - set_visual_state
+    - reset_state
+    """
+    def set_text(self, text_label):
+        """
+        Change the text of the element.
+
+        Args:
+            text_label (str): The new text.
+        """
+        if text_label == self.text_label:
+            return
+
+        self.text_label = text_label
+        self.mark_dirty()
+        self.setup_text()
+        self.invalidate_composite()
+
+        # The outline depends on the size of the text
+        self.mark_geometry_dirty()
+
+    def set_active(self, state_active):
+        """
+        Enable or disable the element.
+
+        Args:
+            state_active (bool): Whether the element reacts to input.
+        """
+        self.state_active = state_active
+        if not state_active:
+            self.hovered_state = False
+            self.dragging = False
+        self.set_visual_state('normal' if state_active else 'disabled')
+        if self.store is not None:
+            self.store.sync(self)
+
+    def set_visible(self, state_visible):
+        """
+        Show or hide the element.
+
+        Args:
+            state_visible (bool): Whether the element is drawn.
+        """
+        if state_visible != self.state_visible:
+            self.state_visible = state_visible
+            self.mark_dirty()
+            if self.store is not None:
+                self.store.sync(self)
+
+    def set_visual_state(self, visual_state):
+        """
+        Swap the pre-rendered surfaces drawn for a visual state.
+
+        Args:
+            visual_state (str): 'normal', 'hovered', 'pressed' or 'disabled'.
+        """
+        if visual_state == self.visual_state:
+            return
+
+        self.visual_state = visual_state
+        if self.rectangle_states:
+            self.rectangle_surface = self.rectangle_states[visual_state]
+        self.mark_dirty()
+
+    def reset_state(self, config):
+        """
+        Reset the position, text and state of the element to a configuration.
+
+        Args:
+            config (dict): Configuration dictionary of the element.
+        """
+        self.dragging = False
+        self.hovered_state = False
+        self.set_position(config.get('pos_x', DEFAULT_CONFIG['pos_x']),
+                          config.get('pos_y', DEFAULT_CONFIG['pos_y']))
+        self.set_text(config.get('text_label', DEFAULT_CONFIG['text_label']))
+        self.set_visible(config.get('state_visible', DEFAULT_CONFIG['state_visible']))
+        self.set_active(config.get('state_active', DEFAULT_CONFIG['state_active']))
+
     """
     Update Methods
     - update_graphics
@@ -331,12 +576,24 @@ class UIElement:
         - update_drag
     """
     def update_graphics(self):
+        """
+        Realign the rects and the outline, only if the geometry changed since the last update.
+        """
+        if not self.geometry_dirty:
+            return
+
         self.update_rect()
         self.update_outline()
+        self.geometry_dirty = False
+        self.mark_dirty()
+
+    def update_events(self, input_state, hovered=None):
+        # Test the collision rect unless the UIManager already did
+        if hovered is None:
+            hovered = self.collision_rect.collidepoint(input_state.mouse_pos)
 
-    def update_events(self, mouse_pos):
-        self.update_drag(mouse_pos)
-        self.update_hover(mouse_pos)
+        self.update_drag(input_state, hovered)
+        self.update_hover(input_state, hovered)
 
     def update_rect(self):
         """
@@ -376,13 +633,16 @@ class UIElement:
         width = max_x - min_x
         height = max_y - min_y
 
-        # Create a new outline rect if the bounding box has changed
-        if pygame.Rect(min_x, min_y, width, height) != self.outline_rect:
-            # Update the outline position
-            self.outline_pos_x, self.outline_pos_y = (min_x, min_y)
+        # Update the outline position
+        self.outline_pos_x, self.outline_pos_y = (min_x, min_y)
 
+        # Create a new outline surface only if the size of the bounding box has changed
+        if self.outline_rect and self.outline_rect.size == (width, height):
+            self.align_rect(self.outline_rect, 'nw', (self.outline_pos_x, self.outline_pos_y))
+        else:
             # Create the outline surface and rect
             self.outline_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            self.count_surfaces()
             self.outline_rect = self.outline_surface.get_rect()
 
             # Draw the outline on the surface
@@ -391,49 +651,57 @@ class UIElement:
             # Align the outline rect
             self.align_rect(self.outline_rect, 'nw', (self.outline_pos_x, self.outline_pos_y))
 
+            # The outline is part of the composite
+            self.invalidate_composite()
+
     def update_click(self):
         pass
 
-    def update_scroll(self):
+    def update_scroll(self, input_state, hovered):
         pass
 
-    def update_hover(self, mouse_pos):
+    def update_hover(self, input_state, hovered):
         """
         Update the hover logic.
 
         Args:
-            mouse_pos (tuple): The (x, y) position of the mouse cursor.
+            input_state (InputState): Input snapshot of the frame.
+            hovered (bool): Whether the mouse is over the collision rect.
         """
         # Determine if the mouse is hovering over the collision rect
-        self.hovered_state = self.collision_rect.collidepoint(mouse_pos)
-        if self.rectangle_surface and self.hover_color:
-            # Change the rect color based on the hover state
-            self.rectangle_surface.fill(self.hover_color if self.hovered_state else self.rectangle_color)
+        self.hovered_state = bool(hovered)
 
-    def update_drag(self, mouse_pos):
+        # Swap the visual state only when it changes
+        if self.hovered_state:
+            self.set_visual_state('pressed' if input_state.buttons_held[1] else 'hovered')
+        else:
+            self.set_visual_state('normal')
+
+    def update_drag(self, input_state, hovered):
         """
         Update the drag logic.
 
         Args:
-            mouse_pos (tuple): The (x, y) position of the mouse cursor.
+            input_state (InputState): Input snapshot of the frame.
+            hovered (bool): Whether the mouse is over the collision rect.
         """
         if not self.drag_enabled:
             return
 
-        mouse_buttons = pygame.mouse.get_pressed()
+        mouse_pos = input_state.mouse_pos
+        mouse_buttons = input_state.buttons_held
 
         # Left mouse button is pressed
-        if mouse_buttons[0]:
+        if mouse_buttons[1]:
             if self.dragging:
-                if mouse_buttons[2]:
+                if mouse_buttons[3]:
                     # Right mouse button cancels dragging
                     self.dragging = False
-                    self.pos_x, self.pos_y = self.original_pos
+                    self.set_position(*self.original_pos)
                 else:
                     # Update position based on the current mouse position and the calculated drag offset
-                    self.pos_x = mouse_pos[0] - self.drag_offset[0]
-                    self.pos_y = mouse_pos[1] - self.drag_offset[1]
-            elif self.collision_rect.collidepoint(mouse_pos):
+                    self.set_position(mouse_pos[0] - self.drag_offset[0], mouse_pos[1] - self.drag_offset[1])
+            elif hovered:
                 # Check if the mouse is within the element's rectangle to start dragging
                 self.dragging = True
 
@@ -464,31 +732,219 @@ class UIElement:
             # Stop dragging when the mouse button is released
             self.dragging = False
 
+    """
+    Dirty Tracking
+    - get_bounding_rect
+    - mark_dirty
+    - wake
+    - is_dirty
+    - is_animating
+    - pop_dirty_rects
+    """
+    def get_bounding_rect(self):
+        """
+        Get the rect covering everything the element draws.
+
+        Returns:
+            pygame.Rect or None: The bounding rect, or None if the element draws nothing.
+        """
+        if not self.state_visible:
+            return None
+
+        rects = [self.shadow_rect, self.rectangle_rect, self.image_rect,
+                 self.text_rect, self.outline_rect, self.collision_rect]
+        rects = [r for r in rects if r]
+        if not rects:
+            return None
+
+        return rects[0].unionall(rects[1:])
+
+    def mark_dirty(self):
+        """
+        Mark the element as needing to be redrawn.
+        """
+        self.dirty = True
+        self.wake()
+
+    def wake(self):
+        """
+        Schedule the element for an update through its parent, its UIStore row or the UIManager.
+        """
+        if self.parent is not None:
+            self.parent.wake_child(self)
+        elif self.store is not None:
+            self.store.wake(self)
+        elif self.ui_manager is not None:
+            self.ui_manager.wake_element(self)
+
+    def is_dirty(self):
+        """
+        Check whether the element changed since it was last drawn, or was moved and not realigned yet.
+
+        Returns:
+            bool: True if the element needs to be updated and redrawn.
+        """
+        return self.dirty or self.geometry_dirty
+
+    def is_animating(self):
+        """
+        Check whether the element changes on its own from frame to frame.
+
+        Returns:
+            bool: True if the element is being animated or dragged.
+        """
+        return self.dragging
+
+    def pop_dirty_rects(self):
+        """
+        Get the regions changed since the last call and reset the dirty state.
+
+        Returns:
+            list: The previously drawn rect and the current rect, if the element changed.
+        """
+        if not self.dirty:
+            return []
+
+        # Both the old and the new area of the element must be refreshed
+        bounding_rect = self.get_bounding_rect()
+        dirty_rects = [r for r in (self.drawn_rect, bounding_rect) if r]
+        self.drawn_rect = bounding_rect
+        self.dirty = False
+        return dirty_rects
+
+    """
+    Baked Composite
+    - get_composite
+    - bake_composite
+    - invalidate_composite
+    """
+    def get_composite(self):
+        """
+        Get the composite of the current visual state, baking it if needed.
+
+        Returns:
+            tuple: The composite surface and its rect, or (None, None) if the element draws nothing.
+        """
+        bounding_rect = self.get_bounding_rect()
+        if bounding_rect is None:
+            return None, None
+
+        # Layers only move together, so the composite is translated to the current bounding rect
+        composite_surface = self.baked_surfaces.get(self.visual_state)
+        if composite_surface is None or composite_surface.get_size() != bounding_rect.size:
+            composite_surface = self.bake_composite(bounding_rect)
+            self.baked_surfaces[self.visual_state] = composite_surface
+
+        return composite_surface, bounding_rect
+
+    def bake_composite(self, bounding_rect):
+        """
+        Composite the layers of the current visual state into a single surface.
+
+        Args:
+            bounding_rect (pygame.Rect): The rect covering all the layers.
+
+        Returns:
+            pygame.Surface: The composite surface.
+        """
+        composite_surface = pygame.Surface(bounding_rect.size, pygame.SRCALPHA)
+        self.count_surfaces()
+
+        # Blit the layers relative to the top-left corner of the bounding rect, keeping the source areas
+        layer_blits = []
+        self.collect_layer_blits(layer_blits)
+        composite_surface.blits([(blit[0], (blit[1][0] - bounding_rect.x, blit[1][1] - bounding_rect.y), *blit[2:])
+                                 for blit in layer_blits], doreturn=False)
+        return composite_surface
+
+    def invalidate_composite(self):
+        """
+        Discard the composites after a visual property changed.
+        """
+        if self.baked_surfaces:
+            self.baked_surfaces.clear()
+            self.mark_dirty()
+
     """
     Game Loop
     - update
+    - collect_blits
+    - collect_layer_blits
+        - collect_text_blits
     - draw
     """
-    def update(self, mouse_pos, mouse_clicks):
+    def update(self, input_state, hovered=None):
+        """
+        Update the element state.
+
+        Args:
+            input_state (InputState): Input snapshot of the frame.
+            hovered (bool or None): Hit-test result provided by the UIManager, or None to test the collision rect.
+        """
         if not self.state_active:
             return
 
         self.update_graphics()
-        self.update_events(mouse_pos)
+        self.update_events(input_state, hovered)
 
-    def draw(self, surface):
+    def collect_blits(self, blit_sequence):
+        """
+        Append the (surface, rect) pairs drawing the element to a blit sequence.
+        Baked elements are drawn with a single blit of their composite.
+
+        Args:
+            blit_sequence (list): Blit sequence to be submitted with pygame.Surface.blits.
+        """
         if not self.state_visible:
             return
 
+        if self.baked:
+            composite_surface, composite_rect = self.get_composite()
+            if composite_surface:
+                blit_sequence.append((composite_surface, composite_rect))
+        else:
+            self.collect_layer_blits(blit_sequence)
+
+    def collect_layer_blits(self, blit_sequence):
+        """
+        Append the (surface, rect) pairs drawing each layer of the element to a blit sequence.
+
+        Args:
+            blit_sequence (list): Blit sequence to be submitted with pygame.Surface.blits.
+        """
         if self.shadow_surface:
-            surface.blit(self.shadow_surface, self.shadow_rect)
+            blit_sequence.append((self.shadow_surface, self.shadow_rect))
         if self.rectangle_surface:
-            surface.blit(self.rectangle_surface, self.rectangle_rect)
+            blit_sequence.append((self.rectangle_surface, self.rectangle_rect))
         if self.image_surface:
-            surface.blit(self.image_surface, self.image_rect)
-        if self.text_surface:
-            surface.blit(self.text_surface, self.text_rect)
+            blit_sequence.append((self.image_surface, self.image_rect))
+        self.collect_text_blits(blit_sequence)
         if self.outline_surface:
-            surface.blit(self.outline_surface, self.outline_rect)
+            blit_sequence.append((self.outline_surface, self.outline_rect))
         if self.collision_surface:
-            surface.blit(self.collision_surface, self.collision_rect)
+            blit_sequence.append((self.collision_surface, self.collision_rect))
+
+    def collect_text_blits(self, blit_sequence):
+        """
+        Append the blits drawing the text layer of the element to a blit sequence.
+
+        Args:
+            blit_sequence (list): Blit sequence to be submitted with pygame.Surface.blits.
+        """
+        if self.text_surface:
+            blit_sequence.append((self.text_surface, self.text_rect))
+
+    def draw(self, surface):
+        """
+        Draw the element on the given surface.
+
+        Args:
+            surface (pygame.Surface): The surface to draw the element on.
+
+        Returns:
+            int: Number of blits issued.
+        """
+        blit_sequence = []
+        self.collect_blits(blit_sequence)
+        surface.blits(blit_sequence, doreturn=False)
+        return len(blit_sequence)
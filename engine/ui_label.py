@@ -12,20 +12,27 @@ class UILabel(UIElement):
         Inherits from UIElement:
             - element_type (str): The type of the UI element.
             - element_id (str): ID of the UI element.
-            - config (dict): Configuration dictionary for the element.
-            - managers (dict): Dictionary of manager instances.
+            - style (UIStyle): Shared style of the element.
+            - ui_manager (UIManager): The UIManager, which provides the other managers.
             - logger (Logger): Logger instance for logging.
             - x, y, width, height, label, font_name, font_size, color, image_path,
               font, rect, text_rect, text_surface, surface
 
         UILabel Attributes:
             - alignment (str): Text alignment within the label ('left', 'center', 'right').
+            - glyph_atlas (GlyphAtlas): Glyph atlas used to draw the text in atlas mode.
 
     Methods:
+        Setup Methods:
+            - setup_text(): Set up the text surface and rect, or the glyph atlas in atlas mode.
+
         Game Loop:
-            - update(mouse_pos, mouse_clicks): Update the UILabel state.
+            - update(input_state, hovered=None): Update the UILabel state.
+            - collect_text_blits(blit_sequence): Append the blits drawing the text layer of the UILabel.
             - draw(surface): Draw the UILabel on the given surface.
     """
+    __slots__ = ('alignment', 'glyph_atlas')
+
     def __init__(self, element_id, config, managers, logger):
         """
         Initialize the UILabel.
@@ -36,25 +43,69 @@ class UILabel(UIElement):
             managers (dict): Dictionary of manager instances.
             logger (Logger): Logger instance for logging.
         """
+        # Atlas Attributes, needed by setup_text during the UIElement initialization
+        self.glyph_atlas = None
+
         super().__init__('label', element_id, config, managers, logger)
 
-        # UIButton Attributes
+        # UILabel Attributes
         self.alignment = config.get('alignment', 'center')
 
+    """
+    Setup Methods
+        - setup_text
+    """
+    def setup_text(self):
+        """
+        Set up the text surface and rect, or the glyph atlas in atlas mode ('text_atlas' style option).
+        Atlas mode suits text changing every frame, as no surface is rendered when the text changes.
+        """
+        if not self.text_atlas:
+            super().setup_text()
+            return
+
+        if not self.text_enabled:
+            return
+
+        # Get the shared glyph atlas of the font and color
+        self.text_font = self.ui_manager.get_font(self.text_font_name, self.text_font_size)
+        self.glyph_atlas = self.ui_manager.get_glyph_atlas(self.text_font, self.text_color)
+
+        # Create the text rect from the measured size of the text
+        self.text_rect = pygame.Rect((0, 0), self.glyph_atlas.measure(self.text_label))
+
+        # Align the text rect
+        self.align_rect(self.text_rect, self.text_align, (self.pos_x, self.pos_y))
+
     """
     Game Loop
         - update
+        - collect_text_blits
         - draw
     """
-    def update(self, mouse_pos, mouse_clicks):
+    def update(self, input_state, hovered=None):
         """
         Update the UILabel state.
 
         Args:
-            mouse_pos (tuple): Current position of the mouse.
-            mouse_clicks (list): List of mouse click states.
+            input_state (InputState): Input snapshot of the frame.
+            hovered (bool or None): Hit-test result provided by the UIManager, or None to test the collision rect.
+        """
+        super().update(input_state, hovered)
+
+    def collect_text_blits(self, blit_sequence):
         """
-        super().update(mouse_pos, mouse_clicks)
+        Append the blits drawing the text layer of the UILabel to a blit sequence.
+        In atlas mode the text is appended as one (atlas, position, area) blit per glyph, at the text
+        layer's place in the layer order and in the baked composite.
+
+        Args:
+            blit_sequence (list): Blit sequence to be submitted with pygame.Surface.blits.
+        """
+        if not self.glyph_atlas:
+            super().collect_text_blits(blit_sequence)
+        elif self.text_label:
+            blit_sequence.extend(self.glyph_atlas.get_blits(self.text_label, self.text_rect.topleft))
 
     def draw(self, surface):
         """
@@ -62,5 +113,8 @@ class UILabel(UIElement):
 
         Args:
             surface (pygame.Surface): The surface to draw the UILabel on.
+
+        Returns:
+            int: Number of blits issued.
         """
-        super().draw(surface)
+        return super().draw(surface)
@@ -0,0 +1,353 @@
+# ui_list.py
+
+import pygame
+from engine.ui_element import UIElement
+from engine.ui_label import UILabel
+
+
+class UIList(UIElement):
+    """
+    UIList represents a scrollable list of text rows in the UI.
+
+    The list is virtualized: it only owns enough row labels to fill its viewport, and recycles them
+    as it scrolls by rebinding their text and position. Row texts are rendered lazily through the
+    text cache, so memory and frame time do not depend on the number of rows.
+
+    Attributes:
+        Inherits from UIElement:
+            - element_type (str): The type of the UI element.
+            - element_id (str): ID of the UI element.
+            - style (UIStyle): Shared style of the element; the rectangle is the viewport.
+            - ui_manager (UIManager): The UIManager, which provides the other managers.
+            - logger (Logger): Logger instance for logging.
+
+        UIList Attributes:
+            - rows (Sequence or None): Row values, displayed with str, or None to use row_format.
+            - row_count (int): Number of rows.
+            - row_format (str): Format of the generated rows, with the {index} and {number} fields.
+            - row_height (int): Height of a row in pixels.
+            - row_color (tuple or None): Background color of the rows, or None for no background.
+            - scroll_speed (int): Number of rows scrolled per wheel step.
+            - scroll_offset (int): Scrolled distance in pixels from the first row.
+            - row_labels (list): Recycled row labels.
+            - row_indexes (list): Index of the row bound to each row label, or None if unbound.
+            - rows_dirty (bool): Whether the row labels must be laid out again.
+
+    Methods:
+        Setup Methods:
+            - setup_rows(): Create the recycled row labels filling the viewport.
+
+        Row Management:
+            - set_rows(rows): Display a sequence of rows.
+            - set_row_count(row_count, row_format=None): Display generated rows.
+            - get_row_text(index): Get the text of a row.
+            - layout_rows(): Bind the row labels to the rows in the viewport.
+            - mark_rows_dirty(): Mark the row labels as needing to be laid out on the next update.
+            - get_surface_bytes(): Get the memory used by the surfaces of the list and its row labels.
+
+        Scrolling:
+            - get_max_scroll(): Get the largest scroll offset.
+            - scroll_to(index): Scroll to make a row the first visible row.
+            - scroll_by(offset): Scroll by a number of pixels.
+
+        Update Methods:
+            - update_graphics(): Realign the list and lay out the rows if needed.
+            - update_events(input_state, hovered=None): Handle the list interactions.
+            - update_scroll(input_state, hovered): Scroll with the mouse wheel.
+
+        Game Loop:
+            - collect_blits(blit_sequence): Append the blits of the list and its visible rows.
+            - clip_blits(blits, clip_rect): Clip blits to a rect.
+    """
+    __slots__ = ('rows', 'row_count', 'row_format', 'row_height', 'row_color', 'scroll_speed',
+                 'scroll_offset', 'row_labels', 'row_indexes', 'rows_dirty')
+
+    def __init__(self, element_id, config, managers, logger):
+        """
+        Initialize the UIList.
+
+        Args:
+            element_id (str): ID of the UI element.
+            config (dict): Configuration dictionary for the element.
+            managers (dict): Dictionary of manager instances.
+            logger (Logger): Logger instance for logging.
+        """
+        super().__init__('list', element_id, {'text_enabled': False, **config}, managers, logger)
+
+        # Row Attributes
+        self.rows = config.get('rows')
+        self.row_count = len(self.rows) if self.rows is not None else config.get('row_count', 0)
+        self.row_format = config.get('row_format', '{number}')
+        self.row_height = config.get('row_height', 30)
+        self.row_color = config.get('row_color')
+
+        # Scroll Attributes
+        self.scroll_speed = config.get('scroll_speed', 3)
+        self.scroll_offset = 0
+
+        # Recycled Row Attributes
+        self.row_labels = []
+        self.row_indexes = []
+        self.rows_dirty = True
+
+        self.setup_rows(config)
+
+    """
+    Setup Methods
+        - setup_rows
+    """
+    def setup_rows(self, config):
+        """
+        Create the recycled row labels filling the viewport.
+
+        Args:
+            config (dict): Configuration dictionary of the list, providing the text style of the rows.
+        """
+        if not self.rectangle_rect:
+            self.logger.log_warning(f"List '{self.element_id}' needs a rectangle to define its viewport.")
+            return
+
+        row_config = {
+            'align': 'w', 'text_align': 'w',
+            'rectangle_enabled': self.row_color is not None,
+            'rectangle_width': self.rectangle_rect.width, 'rectangle_height': self.row_height,
+            'rectangle_color': self.row_color, 'hover_color': None, 'pressed_color': None,
+            'shadow_enabled': False, 'outline_enabled': False, 'collision_enabled': False, 'drag_enabled': False,
+            'text_label': '', 'text_color': config.get('text_color', self.text_color),
+            'text_font_name': config.get('text_font_name'), 'text_font_size': config.get('text_font_size')
+        }
+
+        # A partially scrolled viewport shows one more row than it can hold
+        label_count = -(-self.rectangle_rect.height // self.row_height) + 1
+        self.row_labels = [UILabel(f"{self.element_id}.row_{i}", row_config, self.managers, self.logger)
+                           for i in range(label_count)]
+        self.row_indexes = [None] * label_count
+        self.rows_dirty = True
+
+    """
+    Row Management
+        - set_rows
+        - set_row_count
+        - get_row_text
+        - layout_rows
+        - mark_rows_dirty
+        - get_surface_bytes
+    """
+    def set_rows(self, rows):
+        """
+        Display a sequence of rows.
+
+        Args:
+            rows (Sequence): Row values, displayed with str.
+        """
+        self.rows = rows
+        self.row_count = len(rows)
+        self.row_indexes = [None] * len(self.row_labels)
+        self.scroll_by(0)
+        self.mark_rows_dirty()
+
+    def set_row_count(self, row_count, row_format=None):
+        """
+        Display generated rows.
+
+        Args:
+            row_count (int): Number of rows.
+            row_format (str or None): Format of the rows, with the {index} and {number} fields.
+        """
+        self.rows = None
+        self.row_count = row_count
+        self.row_format = row_format or self.row_format
+        self.row_indexes = [None] * len(self.row_labels)
+        self.scroll_by(0)
+        self.mark_rows_dirty()
+
+    def get_row_text(self, index):
+        """
+        Get the text of a row.
+
+        Args:
+            index (int): Index of the row.
+
+        Returns:
+            str: The text of the row.
+        """
+        if self.rows is not None:
+            return str(self.rows[index])
+        return self.row_format.format(index=index, number=index + 1)
+
+    def layout_rows(self):
+        """
+        Bind the row labels to the rows in the viewport.
+        Each row always uses the same label, so scrolling by one row only rebinds one label.
+        """
+        viewport = self.rectangle_rect
+        label_count = len(self.row_labels)
+        first_row = self.scroll_offset // self.row_height
+
+        for index in range(first_row, first_row + label_count):
+            slot = index % label_count
+            row_label = self.row_labels[slot]
+
+            if index >= self.row_count:
+                row_label.set_visible(False)
+                self.row_indexes[slot] = None
+                continue
+
+            # Rebind the text only when the label shows another row
+            if self.row_indexes[slot] != index:
+                row_label.set_text(self.get_row_text(index))
+                self.row_indexes[slot] = index
+            row_label.set_visible(True)
+            row_label.set_position(viewport.x, viewport.y + index * self.row_height + self.row_height // 2
+                                   - self.scroll_offset)
+            row_label.update_graphics()
+
+        self.rows_dirty = False
+        self.mark_dirty()
+
+    def mark_rows_dirty(self):
+        """
+        Mark the row labels as needing to be laid out on the next update.
+        The list is marked as moved, so it is woken and redrawn even without input.
+        """
+        self.rows_dirty = True
+        self.mark_geometry_dirty()
+
+    def get_surface_bytes(self):
+        """
+        Get the memory used by the surfaces owned by the list and its row labels.
+
+        Returns:
+            int: Number of bytes used by the pixels of the owned surfaces.
+        """
+        return super().get_surface_bytes() + sum(row_label.get_surface_bytes() for row_label in self.row_labels)
+
+    """
+    Scrolling
+        - get_max_scroll
+        - scroll_to
+        - scroll_by
+    """
+    def get_max_scroll(self):
+        """
+        Get the largest scroll offset.
+
+        Returns:
+            int: The scroll offset showing the last row at the bottom of the viewport.
+        """
+        viewport_height = self.rectangle_rect.height if self.rectangle_rect else 0
+        return max(0, self.row_count * self.row_height - viewport_height)
+
+    def scroll_to(self, index):
+        """
+        Scroll to make a row the first visible row.
+
+        Args:
+            index (int): Index of the row.
+        """
+        self.scroll_by(index * self.row_height - self.scroll_offset)
+
+    def scroll_by(self, offset):
+        """
+        Scroll by a number of pixels, within the rows.
+
+        Args:
+            offset (int): Distance in pixels; positive values scroll down.
+        """
+        scroll_offset = min(max(self.scroll_offset + offset, 0), self.get_max_scroll())
+        if scroll_offset != self.scroll_offset:
+            self.scroll_offset = scroll_offset
+            self.mark_rows_dirty()
+
+    """
+    Update Methods
+        - update_graphics
+        - update_events
+            - update_scroll
+    """
+    def update_graphics(self):
+        """
+        Realign the list and lay out the rows if the list moved or scrolled.
+        """
+        moved = self.geometry_dirty
+        super().update_graphics()
+        if (moved or self.rows_dirty) and self.row_labels:
+            self.layout_rows()
+
+    def update_events(self, input_state, hovered=None):
+        """
+        Handle the list interactions.
+
+        Args:
+            input_state (InputState): Input snapshot of the frame.
+            hovered (bool or None): Hit-test result provided by the UIManager, or None to test the collision rect.
+        """
+        if hovered is None:
+            hovered = self.collision_rect.collidepoint(input_state.mouse_pos)
+
+        super().update_events(input_state, hovered)
+        self.update_scroll(input_state, hovered)
+
+    def update_scroll(self, input_state, hovered):
+        """
+        Scroll with the mouse wheel while the list is hovered.
+
+        Args:
+            input_state (InputState): Input snapshot of the frame.
+            hovered (bool): Whether the mouse is over the collision rect.
+        """
+        if hovered and input_state.wheel:
+            self.scroll_by(-input_state.wheel * self.scroll_speed * self.row_height)
+
+            # Lay out the rows in this update rather than the next one
+            self.update_graphics()
+
+    """
+    Game Loop
+        - collect_blits
+        - clip_blits
+    """
+    def collect_blits(self, blit_sequence):
+        """
+        Append the blits of the list and of its visible rows, clipped to the viewport.
+
+        Args:
+            blit_sequence (list): Blit sequence to be submitted with pygame.Surface.blits.
+        """
+        super().collect_blits(blit_sequence)
+        if not self.state_visible or not self.row_labels:
+            return
+
+        row_blits = []
+        for row_label in self.row_labels:
+            row_label.collect_blits(row_blits)
+        blit_sequence.extend(self.clip_blits(row_blits, self.rectangle_rect))
+
+    @staticmethod
+    def clip_blits(blits, clip_rect):
+        """
+        Clip blits to a rect.
+
+        Args:
+            blits (list): Blits (surface, position or rect[, area]).
+            clip_rect (pygame.Rect): The clipping rect.
+
+        Returns:
+            list: Blits (surface, position, area) drawing only inside the clipping rect.
+        """
+        clipped_blits = []
+        for blit in blits:
+            surface, dest = blit[0], blit[1]
+            area = pygame.Rect(blit[2]) if len(blit) > 2 and blit[2] else surface.get_rect()
+            dest_rect = pygame.Rect(dest[0], dest[1], area.width, area.height)
+
+            visible_rect = dest_rect.clip(clip_rect)
+            if not visible_rect:
+                continue
+
+            # Shift the source area by the clipped margins
+            area.x += visible_rect.x - dest_rect.x
+            area.y += visible_rect.y - dest_rect.y
+            area.size = visible_rect.size
+            clipped_blits.append((surface, visible_rect.topleft, area))
+        return clipped_blits
@@ -1,13 +1,28 @@
 # ui_manager.py
 
 import pygame
+import bisect
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional
 
 from menu_config import menu_config
 from engine.base_manager import BaseManager
+from engine.action_queue import ActionQueue
+from engine.action_registry import ActionRegistry
+from engine.spatial_grid import SpatialGrid
+from engine.ui_store import UIStore
+from engine.image_cache import ImageCache
+from engine.text_cache import TextCache
+from engine.glyph_atlas import GlyphAtlas
+from engine.ui_style import UIStyle
 from engine.ui_element import UIElement
 from engine.ui_button import UIButton
 from engine.ui_label import UILabel
+from engine.ui_list import UIList
+from engine.ui_container import UIContainer, iter_element_configs
 
 
 class UIManager(BaseManager):
@@ -19,8 +34,30 @@ class UIManager(BaseManager):
             - config (dict): Configuration dictionary loaded from config.json.
 
         UIManager Attributes:
+            - default_font_name (str or None): Font file used by elements without a font name (None for the pygame font).
+            - default_font_size (int): Font size used by elements without a font size.
+            - fonts (dict): Shared pygame.font.Font objects, keyed by (font name, font size).
+            - text_cache (TextCache): Rendered text surfaces shared between UI elements.
+            - glyph_atlases (dict): Shared GlyphAtlas objects, keyed by (font, color, antialias).
             - ui_elements (dict): Dictionary of UI elements, keyed by their IDs.
+            - render_list (list): UI elements ordered by layer, then by insertion order.
+            - render_layers (list): Layers of the elements in render_list, used for bisection.
+            - spatial_grid (SpatialGrid): Grid of the collision rects used for hit-testing.
+            - awake_elements (set): IDs of the UI elements to update with the 'objects' backend (changed, hovered or dragged).
+            - ui_backend (str): 'objects' for per-element processing, 'columnar' for the UIStore backend.
+            - ui_store (UIStore or None): Columnar layout store used for hit-testing and culling with the 'columnar' backend.
+            - image_cache (ImageCache): Images shared between UI elements.
             - current_menu (str): Name of the currently loaded menu.
+            - action_queue (ActionQueue): Button actions deferred until the end of the update pass.
+            - action_registry (ActionRegistry): Compiled button actions shared across menu loads.
+            - menu_cache_size (int): Maximum number of built menus kept besides the current one.
+            - menu_cache_budget (int): Maximum number of surface bytes held by the cached menus.
+            - menu_cache (OrderedDict): Built menus (elements, render list and hit-testing index), in LRU order.
+            - menu_cache_bytes (int): Number of surface bytes held by the cached menus.
+            - preload_budget (float): Main thread time in milliseconds spent on menu preloading per update.
+            - preload_executor (ThreadPoolExecutor or None): Worker thread decoding the images of preloaded menus.
+            - preloads (OrderedDict): Menus being preloaded, keyed by menu name.
+            - pending_menu (str or None): Preloaded menu to switch to on the next update.
             - display (pygame.Surface): Surface for rendering UI components.
 
     Methods:
@@ -28,12 +65,50 @@ class UIManager(BaseManager):
             - load_specific_components(): Load specific components based on the configuration.
             - set_display(display): Set the display surface for rendering UI components.
 
+        Resource Management:
+            - get_font(font_name=None, font_size=None): Get a shared font from the font pool.
+            - get_glyph_atlas(font, color, antialias=True): Get a shared glyph atlas.
+
+        Element Management:
+            - add_element(element): Add a UI element and insert it in the render list.
+            - remove_element(element_id): Remove a UI element and its render list entry.
+            - link_element(element): Insert a UI element in the render list and the hit-testing index.
+            - unlink_element(element): Remove a UI element from the render list and the hit-testing index.
+            - index_element(element): Move the collision rect of a UI element in the hit-testing index.
+            - wake_element(element): Schedule a UI element for an update.
+            - set_element_layer(element_id, layer): Change the layer of a UI element.
+
         Menu Management:
-            - load_menu(menu_name): Load a menu from configuration.
+            - validate_actions(): Compile every action of the menu configuration, failing on invalid ones.
+            - load_menu(menu_name, reset_state=False): Load a menu, reusing it from the menu cache if possible.
+            - build_menu(menu_name): Create the UI elements of a menu from configuration.
+            - create_element(element_type, element_id, config): Create a UI element of the given type.
+            - reset_menu_state(menu_name): Reset the UI elements of a menu to their configured state.
+            - get_menu_state(): Get the elements, render list and hit-testing index of the current menu.
+            - store_menu(): Move the current menu into the menu cache.
+            - restore_menu(menu_state): Make a cached menu the current one.
+            - clear_menu(): Start an empty menu.
+            - evict_menus(): Release cached menus until the cache fits its budget.
+
+        Menu Preloading:
+            - preload_menu(menu_name, activate=True): Prepare a menu in the background, then optionally switch to it.
+            - decode_images(image_paths): Decode image files, on the worker thread.
+            - get_preload_tasks(menu_name, decoded_images): Get the main thread work preparing a menu.
+            - prepare_text(style, text_label): Render a text into the text cache or glyph atlas.
+            - cache_preloaded_menu(menu_name): Build a menu into the menu cache.
+            - update_preloads(): Advance the preloads within the per-update time budget.
+            - cancel_preload(menu_name): Cancel the preload of a menu.
+            - shutdown_preloads(): Cancel the preloads and stop the worker thread.
 
         Game Loop:
-            - update(mouse_pos, mouse_clicks): Update the UI state based on mouse interactions.
-            - draw(): Render the UI elements on the display surface.
+            - get_elements_at(pos): Get the IDs of the UI elements whose collision rect contains a point.
+            - has_changes(): Check whether any UI element needs to be redrawn.
+            - update(input_state): Update the UI state based on mouse interactions, then execute the queued actions.
+            - get_awake_ids(): Get the IDs of the UI elements to update in the next frame.
+            - realign_elements(element_ids): Realign the moved UI elements and index their new rects.
+            - update_elements(input_state, element_ids, hovered_ids): Update the given UI elements.
+            - draw(): Render the UI elements on the display surface and report the changed regions.
+            - collect_dirty_rects(dirty_rects): Collect the changed regions of the awake UI elements.
     """
     def __init__(self):
         """
@@ -43,13 +118,43 @@ class UIManager(BaseManager):
 
         # Common Attributes
         self.config = {
+            "grid_cell_size": Optional[int],
+            "image_cache_budget": Optional[int],
+            "default_font_name": Optional[str],
+            "default_font_size": Optional[int],
+            "text_cache_budget": Optional[int],
+            "ui_backend": Optional[str],
+            "menu_cache_size": Optional[int],
+            "menu_cache_budget": Optional[int],
+            "preload_budget": Optional[float],
+            "action_budget": Optional[int]
         }
 
         # UIManager Attributes
         self.default_font_name = Optional[str]
         self.default_font_size = Optional[int]
+        self.fonts = Optional[dict]
+        self.text_cache = Optional[TextCache]
+        self.glyph_atlases = Optional[dict]
         self.ui_elements = Optional[dict]
+        self.render_list = Optional[list]
+        self.render_layers = Optional[list]
+        self.spatial_grid = Optional[SpatialGrid]
+        self.awake_elements = Optional[set]
+        self.ui_backend = Optional[str]
+        self.ui_store = Optional[UIStore]
+        self.image_cache = Optional[ImageCache]
         self.current_menu = Optional[str]
+        self.action_queue = Optional[ActionQueue]
+        self.action_registry = Optional[ActionRegistry]
+        self.menu_cache_size = Optional[int]
+        self.menu_cache_budget = Optional[int]
+        self.menu_cache = Optional[OrderedDict]
+        self.menu_cache_bytes = Optional[int]
+        self.preload_budget = Optional[float]
+        self.preload_executor = Optional[ThreadPoolExecutor]
+        self.preloads = Optional[OrderedDict]
+        self.pending_menu = Optional[str]
         self.display = Optional[pygame.Surface]
 
     """
@@ -62,10 +167,44 @@ class UIManager(BaseManager):
         Load specific components based on the configuration.
         """
         # Set Manager attributes
+        self.default_font_name = self.config["default_font_name"]
+        self.default_font_size = self.config["default_font_size"]
+        self.fonts = {}
+        self.text_cache = TextCache(self.config["text_cache_budget"])
+        self.glyph_atlases = {}
         self.ui_elements = {}
+        self.render_list = []
+        self.render_layers = []
+        self.spatial_grid = SpatialGrid(self.config["grid_cell_size"])
+        self.awake_elements = set()
+        self.ui_backend = self.config["ui_backend"]
+        self.ui_store = None
+        self.image_cache = ImageCache(self.config["image_cache_budget"])
         self.current_menu = None
+        self.action_queue = ActionQueue(self.config["action_budget"])
+        self.action_registry = ActionRegistry(self.managers, self.logger)
+        self.menu_cache_size = self.config["menu_cache_size"]
+        self.menu_cache_budget = self.config["menu_cache_budget"]
+        self.menu_cache = OrderedDict()
+        self.menu_cache_bytes = 0
+        self.preload_budget = self.config["preload_budget"]
+        self.preload_executor = None
+        self.preloads = OrderedDict()
+        self.pending_menu = None
         self.display = None
 
+        # Set up the columnar backend, which requires NumPy
+        if self.ui_backend == 'columnar':
+            try:
+                self.ui_store = UIStore()
+            except ImportError as e:
+                self.log_warning(f"{e} Install it with 'pip install numpy' to use the 'columnar' UI backend. "
+                                 f"Falling back to the 'objects' UI backend.")
+                self.ui_backend = 'objects'
+        elif self.ui_backend != 'objects':
+            self.log_warning(f"Unknown UI backend '{self.ui_backend}'. Falling back to the 'objects' UI backend.")
+            self.ui_backend = 'objects'
+
     def set_display(self, display):
         """
         Set the display surface for rendering UI components.
@@ -75,60 +214,697 @@ class UIManager(BaseManager):
         """
         self.display = display
 
+    """
+    Resource Management
+        - get_font
+        - get_glyph_atlas
+    """
+    def get_font(self, font_name=None, font_size=None):
+        """
+        Get a shared font from the font pool.
+
+        Args:
+            font_name (str or None): Font file, or None for the default font.
+            font_size (int or None): Font size, or None for the default size.
+
+        Returns:
+            pygame.font.Font: The shared font.
+        """
+        font_name = font_name or self.default_font_name
+        font_size = font_size or self.default_font_size
+
+        font = self.fonts.get((font_name, font_size))
+        if font is None:
+            font = pygame.font.Font(font_name, font_size)
+            self.fonts[(font_name, font_size)] = font
+        return font
+
+    def get_glyph_atlas(self, font, color, antialias=True):
+        """
+        Get a shared glyph atlas, building it on first use.
+
+        Args:
+            font (pygame.font.Font): Font of the glyphs, usually from get_font.
+            color (tuple): Glyph color.
+            antialias (bool): Whether the glyphs are antialiased.
+
+        Returns:
+            GlyphAtlas: The shared glyph atlas.
+        """
+        key = (font, tuple(color), antialias)
+        glyph_atlas = self.glyph_atlases.get(key)
+        if glyph_atlas is None:
+            glyph_atlas = GlyphAtlas(font, color, antialias)
+            self.glyph_atlases[key] = glyph_atlas
+            if self.main_manager:
+                self.main_manager.frame_stats.add_surfaces()
+        return glyph_atlas
+
+    """
+    Element Management
+        - add_element
+        - remove_element
+            - link_element
+            - unlink_element
+            - index_element
+        - wake_element
+        - set_element_layer
+    """
+    def add_element(self, element):
+        """
+        Add a UI element and insert it in the render list.
+
+        Args:
+            element (UIElement): The UI element to add.
+        """
+        if element.element_id in self.ui_elements:
+            self.remove_element(element.element_id)
+
+        self.ui_elements[element.element_id] = element
+        self.link_element(element)
+
+    def remove_element(self, element_id):
+        """
+        Remove a UI element and its render list entry, and release its shared resources.
+
+        Args:
+            element_id (str): ID of the UI element to remove.
+
+        Returns:
+            UIElement or None: The removed element, or None if it does not exist.
+        """
+        element = self.ui_elements.pop(element_id, None)
+        if element is None:
+            self.log_warning(f"UI element '{element_id}' does not exist.")
+            return None
+
+        self.unlink_element(element)
+        element.release_resources()
+
+        # The area covered by the element must be redrawn
+        if element.drawn_rect and self.window_manager:
+            self.window_manager.mark_dirty(element.drawn_rect)
+
+        return element
+
+    def link_element(self, element):
+        """
+        Insert a UI element in the render list and index it for hit-testing.
+
+        Args:
+            element (UIElement): The UI element to link.
+        """
+        # Insert after the elements of the same layer to keep the insertion order
+        index = bisect.bisect_right(self.render_layers, element.layer)
+        self.render_list.insert(index, element)
+        self.render_layers.insert(index, element.layer)
+
+        # Index the element for hit-testing, and update it in the next frame
+        if self.ui_store:
+            self.ui_store.add(element)
+        else:
+            self.index_element(element)
+            self.awake_elements.add(element.element_id)
+
+    def unlink_element(self, element):
+        """
+        Remove a UI element from the render list and the hit-testing index, keeping its resources.
+
+        Args:
+            element (UIElement): The UI element to unlink.
+        """
+        # Search only the entries of the element's layer
+        start = bisect.bisect_left(self.render_layers, element.layer)
+        end = bisect.bisect_right(self.render_layers, element.layer)
+        for index in range(start, end):
+            if self.render_list[index] is element:
+                del self.render_list[index]
+                del self.render_layers[index]
+                break
+        if self.ui_store:
+            self.ui_store.remove(element)
+        else:
+            self.spatial_grid.remove(element.element_id)
+            self.awake_elements.discard(element.element_id)
+
+    def index_element(self, element):
+        """
+        Move the collision rect of a UI element in the hit-testing index, once its rects are realigned.
+
+        Args:
+            element (UIElement): The UI element to index.
+        """
+        if element.store is not None:
+            self.ui_store.sync(element)
+        elif element.collision_rect:
+            self.spatial_grid.insert(element.element_id, element.collision_rect)
+        else:
+            self.spatial_grid.remove(element.element_id)
+
+    def wake_element(self, element):
+        """
+        Schedule a UI element of the current menu for an update in the next frame.
+        Elements bound to the UIStore or to a container are woken through them instead.
+
+        Args:
+            element (UIElement): The changed UI element.
+        """
+        if element.element_id in self.ui_elements:
+            self.awake_elements.add(element.element_id)
+
+    def set_element_layer(self, element_id, layer):
+        """
+        Change the layer of a UI element. The element keeps its surfaces and shared resources.
+
+        Args:
+            element_id (str): ID of the UI element.
+            layer (int): The new layer.
+        """
+        element = self.ui_elements.get(element_id)
+        if element is None:
+            self.log_warning(f"UI element '{element_id}' does not exist.")
+            return
+        if element.layer == layer:
+            return
+
+        self.unlink_element(element)
+        element.layer = layer
+        element.mark_dirty()
+        self.link_element(element)
+
     """
     Menu Management
+        - validate_actions
         - load_menu
+            - build_menu
+            - create_element
+            - reset_menu_state
+        - get_menu_state
+        - store_menu
+        - restore_menu
+        - clear_menu
+        - evict_menus
     """
-    def load_menu(self, menu_name):
+    def validate_actions(self):
+        """
+        Compile every action of the menu configuration.
+
+        Raises:
+            ValueError: If an action of the configuration cannot be resolved.
         """
-        Load a menu from configuration.
+        self.action_registry.validate(menu_config, {'button': UIButton})
+
+    def load_menu(self, menu_name, reset_state=False):
+        """
+        Load a menu, reusing it from the menu cache if possible.
 
         Args:
             menu_name (str): Name of the menu to load.
+            reset_state (bool): Whether a cached menu is reset to its configured state.
         """
         # Check if the specified menu name exists in the UI configuration
-        if menu_name in menu_config:
-            self.current_menu = menu_name
-            self.ui_elements = {}
-
-            # Iterate over the elements in the menu configuration and initialize UIElements
-            for element_type, elements in menu_config[menu_name].items():
-                for element_id, config in elements.items():
-                    if element_type == 'button':
-                        self.ui_elements[element_id] = UIButton(element_id, config, self.managers, self.logger)
-                    elif element_type == 'label':
-                        self.ui_elements[element_id] = UILabel(element_id, config, self.managers, self.logger)
-                    else:
-                        self.ui_elements[element_id] = UIElement(element_type, element_id, config, self.managers, self.logger)
+        if menu_name not in menu_config:
+            self.log_error(f"Menu '{menu_name}' does not exist in the configuration.",
+                           ValueError)
+            return
+
+        # The menu is loaded now, so its preload is no longer needed
+        self.cancel_preload(menu_name)
+
+        # Keep the previous menu in the cache
+        if self.current_menu:
+            self.store_menu()
+        self.current_menu = menu_name
+
+        # Switch to the cached menu, or build it from configuration
+        menu_state = self.menu_cache.pop(menu_name, None)
+        if menu_state:
+            self.menu_cache_bytes -= menu_state["size_bytes"]
+            self.restore_menu(menu_state)
+            if reset_state:
+                self.reset_menu_state(menu_name)
+
+            # The elements may have changed while cached, e.g. by reset_state
+            for element in self.ui_elements.values():
+                element.wake()
         else:
+            self.clear_menu()
+            self.build_menu(menu_name)
+
+        self.evict_menus()
+
+        # The previous menu is replaced as a whole
+        if self.window_manager:
+            self.window_manager.mark_dirty()
+
+    def build_menu(self, menu_name):
+        """
+        Create the UI elements of a menu from configuration.
+
+        Args:
+            menu_name (str): Name of the menu to build.
+        """
+        # Iterate over the elements in the menu configuration and initialize UIElements
+        # Containers create their children themselves, so only the top-level elements are added
+        for element_type, elements in menu_config[menu_name].items():
+            for element_id, config in elements.items():
+                self.add_element(self.create_element(element_type, element_id, config))
+
+    def create_element(self, element_type, element_id, config):
+        """
+        Create a UI element of the given type.
+
+        Args:
+            element_type (str): The type of element.
+            element_id (str): ID of the UI element.
+            config (dict): Configuration dictionary for the element.
+
+        Returns:
+            UIElement: The new element.
+        """
+        if element_type == 'button':
+            return UIButton(element_id, config, self.managers, self.logger)
+        elif element_type == 'label':
+            return UILabel(element_id, config, self.managers, self.logger)
+        elif element_type == 'list':
+            return UIList(element_id, config, self.managers, self.logger)
+        elif element_type == 'container':
+            return UIContainer(element_id, config, self.managers, self.logger)
+        return UIElement(element_type, element_id, config, self.managers, self.logger)
+
+    def reset_menu_state(self, menu_name):
+        """
+        Reset the UI elements of a menu to their configured state.
+
+        Args:
+            menu_name (str): Name of the current menu.
+        """
+        for elements in menu_config[menu_name].values():
+            for element_id, config in elements.items():
+                element = self.ui_elements.get(element_id)
+                if element:
+                    element.reset_state(config)
+
+    def get_menu_state(self):
+        """
+        Get the elements, render list and hit-testing index of the current menu.
+
+        Returns:
+            dict: The menu state, with the number of surface bytes owned by its elements.
+        """
+        return {
+            "ui_elements": self.ui_elements,
+            "render_list": self.render_list,
+            "render_layers": self.render_layers,
+            "spatial_grid": self.spatial_grid,
+            "awake_elements": self.awake_elements,
+            "ui_store": self.ui_store,
+            "size_bytes": sum(element.get_surface_bytes() for element in self.ui_elements.values())
+        }
+
+    def store_menu(self):
+        """
+        Move the current menu into the menu cache.
+        """
+        menu_state = self.get_menu_state()
+        self.menu_cache[self.current_menu] = menu_state
+        self.menu_cache_bytes += menu_state["size_bytes"]
+
+    def restore_menu(self, menu_state):
+        """
+        Make a cached menu the current one.
+
+        Args:
+            menu_state (dict): The cached menu.
+        """
+        self.ui_elements = menu_state["ui_elements"]
+        self.render_list = menu_state["render_list"]
+        self.render_layers = menu_state["render_layers"]
+        self.spatial_grid = menu_state["spatial_grid"]
+        self.awake_elements = menu_state["awake_elements"]
+        self.ui_store = menu_state["ui_store"]
+
+    def clear_menu(self):
+        """
+        Start an empty menu.
+        """
+        self.ui_elements = {}
+        self.render_list = []
+        self.render_layers = []
+        self.spatial_grid = SpatialGrid(self.config["grid_cell_size"])
+        self.awake_elements = set()
+        if self.ui_store:
+            self.ui_store = UIStore()
+
+    def evict_menus(self):
+        """
+        Release cached menus, least recently used first, until the cache fits its budget.
+        """
+        while self.menu_cache and (len(self.menu_cache) > self.menu_cache_size
+                                   or self.menu_cache_bytes > self.menu_cache_budget):
+            menu_name, menu_state = self.menu_cache.popitem(last=False)
+            self.menu_cache_bytes -= menu_state["size_bytes"]
+            self.cancel_preload(menu_name)
+            for element in menu_state["ui_elements"].values():
+                element.release_resources()
+
+    """
+    Menu Preloading
+        - preload_menu
+        - decode_images
+        - get_preload_tasks
+        - prepare_text
+        - cache_preloaded_menu
+        - update_preloads
+        - cancel_preload
+        - shutdown_preloads
+    """
+    def preload_menu(self, menu_name, activate=True):
+        """
+        Prepare a menu in the background, then optionally switch to it.
+
+        Images are decoded on a worker thread. Their conversion to the display format, the text
+        rendering and the element creation then run on the main thread within the preload budget,
+        and the switch happens on the update after the preload completed.
+
+        Args:
+            menu_name (str): Name of the menu to preload.
+            activate (bool): Whether to switch to the menu once it is ready.
+        """
+        if menu_name not in menu_config:
             self.log_error(f"Menu '{menu_name}' does not exist in the configuration.",
                            ValueError)
+            return
+
+        # Built menus only need to be switched to
+        if menu_name == self.current_menu or menu_name in self.menu_cache:
+            if activate and menu_name != self.current_menu:
+                self.pending_menu = menu_name
+            return
+
+        if menu_name in self.preloads:
+            self.preloads[menu_name]["activate"] |= activate
+            return
+
+        # Collect the images which are not in the image cache yet
+        image_paths = set()
+        for _, _, config in iter_element_configs(menu_config[menu_name]):
+            style = UIStyle.from_config(config)
+            if style.image_enabled and style.image_path \
+                    and (style.image_path, None, 'alpha') not in self.image_cache.entries:
+                image_paths.add(style.image_path)
+
+        # Decode the images on the worker thread; pygame releases the GIL while decoding
+        if self.preload_executor is None:
+            self.preload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='preload')
+        self.preloads[menu_name] = {
+            "future": self.preload_executor.submit(self.decode_images, image_paths),
+            "tasks": None,
+            "activate": activate
+        }
+
+    @staticmethod
+    def decode_images(image_paths):
+        """
+        Decode image files. Runs on the worker thread, so the surfaces are not converted.
+
+        Args:
+            image_paths (set): Paths of the image files.
+
+        Returns:
+            dict: Decoded surfaces, keyed by path.
+        """
+        return {path: pygame.image.load(path) for path in image_paths}
+
+    def get_preload_tasks(self, menu_name, decoded_images):
+        """
+        Get the main thread work preparing a menu.
+
+        Args:
+            menu_name (str): Name of the preloaded menu.
+            decoded_images (dict): Surfaces decoded by the worker thread, keyed by path.
+
+        Returns:
+            deque: Callables to run in order, the last one building the menu.
+        """
+        tasks = deque(partial(self.image_cache.prime, path, surface) for path, surface in decoded_images.items())
+
+        for _, _, config in iter_element_configs(menu_config[menu_name]):
+            style = UIStyle.from_config(config)
+
+            # Scaled images are built from the primed originals
+            if style.image_enabled and style.image_path and style.image_width and style.image_height:
+                key = (style.image_path, (style.image_width, style.image_height), 'alpha')
+                tasks.append(partial(self.image_cache.get_surface, key))
+
+            if style.text_enabled and config.get('text_label') is not None:
+                tasks.append(partial(self.prepare_text, style, config['text_label']))
+
+        tasks.append(partial(self.cache_preloaded_menu, menu_name))
+        return tasks
+
+    def prepare_text(self, style, text_label):
+        """
+        Render a text into the text cache, or build the glyph atlas of a text in atlas mode.
+
+        Args:
+            style (UIStyle): Style of the element displaying the text.
+            text_label (str): The text.
+        """
+        font = self.get_font(style.text_font_name, style.text_font_size)
+        if style.text_atlas:
+            self.get_glyph_atlas(font, style.text_color)
+        else:
+            self.text_cache.render(font, text_label, style.text_color)
+
+    def cache_preloaded_menu(self, menu_name):
+        """
+        Build a menu into the menu cache without changing the current menu.
+
+        Args:
+            menu_name (str): Name of the menu to build.
+        """
+        if menu_name == self.current_menu or menu_name in self.menu_cache:
+            return
+
+        current_state = self.get_menu_state()
+        self.clear_menu()
+        self.build_menu(menu_name)
+        menu_state = self.get_menu_state()
+        self.restore_menu(current_state)
+
+        self.menu_cache[menu_name] = menu_state
+        self.menu_cache_bytes += menu_state["size_bytes"]
+        self.evict_menus()
+
+    def update_preloads(self):
+        """
+        Switch to a completed preloaded menu and advance the other preloads within the time budget.
+        """
+        # Switch in the update after the preload completed
+        if self.pending_menu:
+            menu_name, self.pending_menu = self.pending_menu, None
+            self.load_menu(menu_name)
+
+        if not self.preloads:
+            return
+
+        deadline = time.perf_counter() + self.preload_budget / 1000
+        for menu_name, preload in list(self.preloads.items()):
+            # Wait for the worker thread
+            future = preload["future"]
+            if not future.done():
+                continue
+
+            if preload["tasks"] is None:
+                if future.exception():
+                    self.log_warning(f"Preloading menu '{menu_name}' failed: {future.exception()}")
+                    preload["tasks"] = deque()
+                else:
+                    preload["tasks"] = self.get_preload_tasks(menu_name, future.result())
+
+            # Run the main thread work until the budget is spent
+            tasks = preload["tasks"]
+            while tasks and time.perf_counter() < deadline:
+                tasks.popleft()()
+
+            if tasks:
+                break
+
+            del self.preloads[menu_name]
+            if preload["activate"]:
+                self.pending_menu = menu_name
+
+    def cancel_preload(self, menu_name):
+        """
+        Cancel the preload of a menu, dropping its pending image decode.
+
+        Args:
+            menu_name (str): Name of the preloaded menu.
+        """
+        preload = self.preloads.pop(menu_name, None)
+        if preload:
+            preload["future"].cancel()
+
+    def shutdown_preloads(self):
+        """
+        Cancel the preloads and stop the worker thread, without waiting for a decode in progress.
+        """
+        for menu_name in list(self.preloads):
+            self.cancel_preload(menu_name)
+        self.pending_menu = None
+
+        if self.preload_executor is not None:
+            self.preload_executor.shutdown(wait=False, cancel_futures=True)
+            self.preload_executor = None
 
     """
     Game Loop
+        - get_elements_at
+        - has_changes
         - update
+            - get_awake_ids
+            - realign_elements
+            - update_elements
         - draw
+            - collect_dirty_rects
     """
-    def update(self, mouse_pos, mouse_clicks):
+    def get_elements_at(self, pos):
+        """
+        Get the IDs of the UI elements whose collision rect contains a point.
+
+        Args:
+            pos (tuple): The (x, y) position to test.
+
+        Returns:
+            set: IDs of the UI elements under the point.
+        """
+        if self.ui_store:
+            return self.ui_store.query_point(pos)
+        return self.spatial_grid.query_point(pos)
+
+    def has_changes(self):
+        """
+        Check whether any UI element needs to be redrawn.
+
+        Returns:
+            bool: True if an element changed since the last draw or is being animated.
+        """
+        # Preloading menus and queued actions must keep being processed
+        if self.preloads or self.pending_menu or self.action_queue:
+            return True
+
+        # Only the awake elements can have changed
+        for element_id in self.get_awake_ids():
+            element = self.ui_elements.get(element_id)
+            if element and (element.is_animating() or element.is_dirty()):
+                return True
+        return False
+
+    def update(self, input_state):
         """
         Update the UI state based on mouse interactions.
 
         Args:
-            mouse_pos (tuple): Current position of the mouse.
-            mouse_clicks (list): List of mouse click states.
+            input_state (InputState): Input snapshot of the frame.
         """
-        # Iterate over each UI element and check for hover and click interactions
-        for element in self.ui_elements.values():
-            element.update(mouse_pos, mouse_clicks)
+        # Advance the menu preloads before the elements are updated
+        self.update_preloads()
+
+        # Realign the moved elements first, so the hit-test sees the rects of this frame
+        awake_ids = self.get_awake_ids()
+        self.realign_elements(awake_ids)
+
+        # Hit-test only the elements indexed in the grid cell under the cursor
+        hovered_ids = self.get_elements_at(input_state.mouse_pos)
+
+        # Idle elements away from the cursor are not updated
+        self.update_elements(input_state, awake_ids | hovered_ids, hovered_ids)
+
+        # Execute the actions queued by the elements once the update pass is over
+        self.action_queue.drain()
+
+    def get_awake_ids(self):
+        """
+        Get the IDs of the UI elements to update in the next frame: changed, hovered, pressed or dragged.
+
+        Returns:
+            set: IDs of the awake UI elements.
+        """
+        return self.ui_store.awake if self.ui_store else self.awake_elements
+
+    def realign_elements(self, element_ids):
+        """
+        Realign the moved UI elements and move their collision rects in the hit-testing index.
+
+        Args:
+            element_ids (set): IDs of the UI elements which may have moved.
+        """
+        for element_id in element_ids:
+            element = self.ui_elements.get(element_id)
+            if element and element.geometry_dirty:
+                element.update_graphics()
+                self.index_element(element)
+
+    def update_elements(self, input_state, element_ids, hovered_ids):
+        """
+        Update the given UI elements.
+
+        Args:
+            input_state (InputState): Input snapshot of the frame.
+            element_ids (set): IDs of the UI elements to update.
+            hovered_ids (set): IDs of the UI elements under the cursor.
+        """
+        for element_id in element_ids:
+            element = self.ui_elements.get(element_id)
+            if element is None:
+                continue
+
+            moved = element.geometry_dirty
+            element.update(input_state, element_id in hovered_ids)
+
+            # Index the rects realigned by the update itself
+            if moved and not element.geometry_dirty:
+                self.index_element(element)
 
     def draw(self):
         """
-        Render the UI elements on the display surface.
+        Render the UI elements on the display surface and report the changed regions.
         """
         if self.display:
-            # Sort UI elements by their layer
-            sorted_elements = sorted(self.ui_elements.values(), key=lambda e: e.layer)
+            # Collect the blits of the UI elements in layer order, culled by the UIStore if available
+            blit_sequence = []
+            elements = self.ui_store.cull(self.display.get_rect()) if self.ui_store else self.render_list
+            for element in elements:
+                element.collect_blits(blit_sequence)
+
+            # Only the awake elements can have changed
+            dirty_rects = []
+            self.collect_dirty_rects(dirty_rects)
+
+            # Draw all UI elements on the display surface in a single call
+            self.display.blits(blit_sequence, doreturn=False)
+            if self.main_manager:
+                self.main_manager.frame_stats.add_blits(len(blit_sequence))
+
+            # Report the changed regions to the window manager
+            if dirty_rects and self.window_manager:
+                self.window_manager.add_dirty_rects(dirty_rects)
+
+    def collect_dirty_rects(self, dirty_rects):
+        """
+        Collect the changed regions of the awake UI elements, then put the settled ones back to sleep.
+
+        Args:
+            dirty_rects (list): List receiving the changed regions.
+        """
+        awake = self.get_awake_ids()
+        for element_id in list(awake):
+            element = self.ui_elements.get(element_id)
+            if element is None:
+                awake.discard(element_id)
+                continue
 
-            # Draw each UI element on the display surface
-            for element in sorted_elements:
-                element.draw(self.display)
+            dirty_rects.extend(element.pop_dirty_rects())
+            if not (element.geometry_dirty or element.hovered_state or element.is_animating()):
+                awake.discard(element_id)
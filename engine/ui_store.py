@@ -0,0 +1,291 @@
+# ui_store.py
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Flags of the store rows
+FLAG_USED = 1
+FLAG_ACTIVE = 2
+FLAG_VISIBLE = 4
+FLAG_COLLIDABLE = 8
+
+# Horizontal and vertical alignment factors in half sizes, matching UIElement.align_rect
+ALIGN_FACTORS = {
+    'center': (1, 1),
+    'nw': (0, 0),
+    'n': (1, 0),
+    'ne': (2, 0),
+    'e': (2, 1),
+    'se': (2, 2),
+    's': (1, 2),
+    'sw': (0, 2),
+    'w': (0, 1)
+}
+
+
+class UIStore:
+    """
+    UIStore keeps the layout data of UI elements in NumPy arrays, one row per element.
+
+    Alignment, visibility culling and hit-testing are computed with vectorized operations over all
+    rows at once. Bound elements read and write their position through the store, and only the
+    elements in the awake set (changed, hovered or dragged) are updated one by one.
+
+    Attributes:
+        Column Attributes:
+            - positions (numpy.ndarray): Anchor positions (x, y).
+            - sizes (numpy.ndarray): Collision rect sizes (width, height).
+            - aligns (numpy.ndarray): Alignment factors in half sizes (x, y).
+            - extents (numpy.ndarray): Bounding rect edges relative to the anchor (left, top, right, bottom).
+            - layers (numpy.ndarray): Render layers.
+            - sequence (numpy.ndarray): Insertion order, used to order the elements of a layer.
+            - flags (numpy.ndarray): Row flags (FLAG_*).
+            - rects (numpy.ndarray): Collision rects (x, y, width, height), computed by layout.
+
+        Store Attributes:
+            - capacity (int): Number of allocated rows.
+            - elements (list): Bound elements, indexed by row.
+            - free_rows (list): Rows available for reuse.
+            - next_sequence (int): Insertion counter.
+            - layout_dirty (bool): Whether the collision rects must be recomputed.
+            - awake (set): IDs of the elements to update individually.
+
+    Methods:
+        Row Management:
+            - add(element): Bind an element to a new row.
+            - remove(element): Unbind an element and free its row.
+            - clear(): Unbind all elements.
+            - sync(element): Copy the layout data of an element to its row.
+            - grow(): Double the capacity of the columns.
+
+        Element Access:
+            - get_position(row): Get the anchor position of a row.
+            - set_coordinate(row, axis, value): Move the anchor of a row along one axis.
+            - wake(element): Schedule an element for an individual update.
+
+        Vectorized Queries:
+            - layout(): Recompute the collision rects of all rows.
+            - query_point(pos): Get the IDs of the elements whose collision rect contains a point.
+            - cull(view_rect): Get the visible elements intersecting a rect, in render order.
+    """
+    def __init__(self, capacity=1024):
+        """
+        Initialize the UIStore instance.
+
+        Args:
+            capacity (int): Number of rows allocated initially.
+        """
+        if np is None:
+            raise ImportError("The columnar UI backend requires NumPy.")
+
+        # Column Attributes
+        self.positions = np.zeros((capacity, 2), dtype=np.int32)
+        self.sizes = np.zeros((capacity, 2), dtype=np.int32)
+        self.aligns = np.zeros((capacity, 2), dtype=np.int32)
+        self.extents = np.zeros((capacity, 4), dtype=np.int32)
+        self.layers = np.zeros(capacity, dtype=np.int32)
+        self.sequence = np.zeros(capacity, dtype=np.int64)
+        self.flags = np.zeros(capacity, dtype=np.uint8)
+        self.rects = np.zeros((capacity, 4), dtype=np.int32)
+
+        # Store Attributes
+        self.capacity = capacity
+        self.elements = [None] * capacity
+        self.free_rows = list(range(capacity - 1, -1, -1))
+        self.next_sequence = 0
+        self.layout_dirty = False
+        self.awake = set()
+
+    """
+    Row Management
+        - add
+        - remove
+        - clear
+        - sync
+        - grow
+    """
+    def add(self, element):
+        """
+        Bind an element to a new row.
+
+        Args:
+            element (UIElement): The element to bind.
+        """
+        if not self.free_rows:
+            self.grow()
+
+        row = self.free_rows.pop()
+        self.elements[row] = element
+        self.positions[row] = (element.pos_x, element.pos_y)
+        self.sequence[row] = self.next_sequence
+        self.next_sequence += 1
+
+        element.bind_store(self, row)
+        self.sync(element)
+        self.wake(element)
+
+    def remove(self, element):
+        """
+        Unbind an element and free its row. The element keeps its current position.
+
+        Args:
+            element (UIElement): The element to unbind.
+        """
+        row = element.store_row
+        element.unbind_store()
+
+        self.elements[row] = None
+        self.flags[row] = 0
+        self.free_rows.append(row)
+        self.awake.discard(element.element_id)
+
+    def clear(self):
+        """
+        Unbind all elements.
+        """
+        for element in self.elements:
+            if element:
+                self.remove(element)
+        self.layout_dirty = False
+
+    def sync(self, element):
+        """
+        Copy the layout data of an element to its row.
+
+        Args:
+            element (UIElement): The bound element.
+        """
+        row = element.store_row
+        pos_x, pos_y = self.get_position(row)
+
+        # Collision size and alignment, laid out by the vectorized layout
+        if element.collision_rect:
+            self.sizes[row] = element.collision_rect.size
+        self.aligns[row] = ALIGN_FACTORS.get(element.align, (1, 1))
+
+        # Bounding rect relative to the anchor, translated with the anchor for culling
+        bounding_rect = element.get_bounding_rect() if element.state_visible else None
+        if bounding_rect:
+            self.extents[row] = (bounding_rect.left - pos_x, bounding_rect.top - pos_y,
+                                 bounding_rect.right - pos_x, bounding_rect.bottom - pos_y)
+
+        self.layers[row] = element.layer
+        self.flags[row] = (FLAG_USED
+                           | (FLAG_ACTIVE if element.state_active else 0)
+                           | (FLAG_VISIBLE if bounding_rect else 0)
+                           | (FLAG_COLLIDABLE if element.collision_rect else 0))
+        self.layout_dirty = True
+
+    def grow(self):
+        """
+        Double the capacity of the columns.
+        """
+        capacity = self.capacity * 2
+        for name in ('positions', 'sizes', 'aligns', 'extents', 'layers', 'sequence', 'flags', 'rects'):
+            column = getattr(self, name)
+            grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:self.capacity] = column
+            setattr(self, name, grown)
+
+        self.elements.extend([None] * self.capacity)
+        self.free_rows.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    """
+    Element Access
+        - get_position
+        - set_coordinate
+        - wake
+    """
+    def get_position(self, row):
+        """
+        Get the anchor position of a row.
+
+        Args:
+            row (int): The row.
+
+        Returns:
+            tuple: The (x, y) anchor position.
+        """
+        pos_x, pos_y = self.positions[row].tolist()
+        return pos_x, pos_y
+
+    def set_coordinate(self, row, axis, value):
+        """
+        Move the anchor of a row along one axis.
+
+        Args:
+            row (int): The row.
+            axis (int): 0 for the horizontal position, 1 for the vertical position.
+            value (int): The new anchor coordinate.
+        """
+        self.positions[row, axis] = value
+        self.layout_dirty = True
+
+    def wake(self, element):
+        """
+        Schedule an element for an individual update.
+
+        Args:
+            element (UIElement): The bound element.
+        """
+        self.awake.add(element.element_id)
+
+    """
+    Vectorized Queries
+        - layout
+        - query_point
+        - cull
+    """
+    def layout(self):
+        """
+        Recompute the collision rects of all rows from their anchor, size and alignment.
+        """
+        if not self.layout_dirty:
+            return
+
+        self.rects[:, :2] = self.positions - (self.sizes * self.aligns) // 2
+        self.rects[:, 2:] = self.sizes
+        self.layout_dirty = False
+
+    def query_point(self, pos):
+        """
+        Get the IDs of the elements whose collision rect contains a point.
+
+        Args:
+            pos (tuple): The (x, y) position to test.
+
+        Returns:
+            set: IDs of the elements under the point.
+        """
+        self.layout()
+        rects = self.rects
+        offset_x = pos[0] - rects[:, 0]
+        offset_y = pos[1] - rects[:, 1]
+        hits = np.flatnonzero((self.flags & FLAG_COLLIDABLE).astype(bool)
+                              & (offset_x >= 0) & (offset_x < rects[:, 2])
+                              & (offset_y >= 0) & (offset_y < rects[:, 3]))
+        return {self.elements[row].element_id for row in hits.tolist()}
+
+    def cull(self, view_rect):
+        """
+        Get the visible elements intersecting a rect, in render order.
+
+        Args:
+            view_rect (pygame.Rect): The visible area.
+
+        Returns:
+            list: The elements to draw, ordered by layer, then by insertion order.
+        """
+        extents = self.extents
+        positions = self.positions
+        rows = np.flatnonzero((self.flags & FLAG_VISIBLE).astype(bool)
+                              & (positions[:, 0] + extents[:, 0] < view_rect.right)
+                              & (positions[:, 0] + extents[:, 2] > view_rect.left)
+                              & (positions[:, 1] + extents[:, 1] < view_rect.bottom)
+                              & (positions[:, 1] + extents[:, 3] > view_rect.top))
+        rows = rows[np.lexsort((self.sequence[rows], self.layers[rows]))]
+        elements = self.elements
+        return [elements[row] for row in rows.tolist()]
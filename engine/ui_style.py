@@ -0,0 +1,144 @@
+# ui_style.py
+
+import weakref
+from operator import attrgetter
+
+# Style options and their default values
+STYLE_DEFAULTS = {
+    'align': 'center',
+    'rectangle_enabled': True,
+    'rectangle_width': None,
+    'rectangle_height': None,
+    'rectangle_color': None,
+    'image_enabled': True,
+    'image_path': None,
+    'image_width': None,
+    'image_height': None,
+    'shadow_enabled': True,
+    'shadow_color': (255, 255, 255),
+    'shadow_offset': (5, 5),
+    'shadow_blur': 150,
+    'text_enabled': True,
+    'text_color': (255, 255, 255),
+    'text_align': 'center',
+    'text_font_name': None,
+    'text_font_size': None,
+    'text_atlas': False,
+    'hover_color': (255, 0, 0),
+    'pressed_color': (180, 0, 0),
+    'disabled_color': (128, 128, 128),
+    'outline_enabled': True,
+    'outline_color': (0, 255, 255),
+    'outline_border': 1,
+    'collision_enabled': True,
+    'collision_width': None,
+    'collision_height': None,
+    'collision_color': (255, 0, 0),
+    'collision_border': 1,
+    'drag_enabled': True,
+    'drag_exclusive': True,
+    'baked': False
+}
+
+
+class UIStyle:
+    """
+    UIStyle is an immutable set of style options shared by every UI element styled the same way.
+
+    Styles are interned: from_config returns the existing instance for identical options, so
+    thousands of similar elements reference a single style object instead of holding their own copy.
+
+    Attributes:
+        - One read-only attribute per option of STYLE_DEFAULTS.
+        - interned (WeakValueDictionary): Styles in use, keyed by their option values.
+
+    Methods:
+        - from_config(config): Get the interned style of an element configuration.
+        - replace(**options): Get the interned style with some options changed.
+        - freeze(value): Convert an option value to a hashable value.
+    """
+    __slots__ = tuple(STYLE_DEFAULTS) + ('__weakref__',)
+
+    interned = weakref.WeakValueDictionary()
+
+    def __init__(self, values):
+        """
+        Initialize the UIStyle instance. Use from_config to get interned styles.
+
+        Args:
+            values (tuple): Option values, in the order of STYLE_DEFAULTS.
+        """
+        for name, value in zip(STYLE_DEFAULTS, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"UIStyle is immutable, cannot set '{name}'.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"UIStyle is immutable, cannot delete '{name}'.")
+
+    def __repr__(self):
+        options = ", ".join(f"{name}={getattr(self, name)!r}" for name in STYLE_DEFAULTS
+                            if getattr(self, name) != STYLE_DEFAULTS[name])
+        return f"UIStyle({options})"
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Get the interned style of an element configuration.
+
+        Args:
+            config (dict): Element configuration; missing options take their default value.
+
+        Returns:
+            UIStyle: The shared style.
+        """
+        values = tuple(cls.freeze(config.get(name, default)) for name, default in STYLE_DEFAULTS.items())
+        style = cls.interned.get(values)
+        if style is None:
+            style = cls(values)
+            cls.interned[values] = style
+        return style
+
+    def replace(self, **options):
+        """
+        Get the interned style with some options changed.
+
+        Args:
+            **options: Options to change.
+
+        Returns:
+            UIStyle: The shared style.
+        """
+        return self.from_config({**{name: getattr(self, name) for name in STYLE_DEFAULTS}, **options})
+
+    @staticmethod
+    def freeze(value):
+        """
+        Convert an option value to a hashable value.
+
+        Args:
+            value: The option value.
+
+        Returns:
+            The value, with lists converted to tuples.
+        """
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+
+def style_properties(cls):
+    """
+    Class decorator adding a read-only property for each style option, delegating to self.style.
+
+    Args:
+        cls (type): The class to decorate.
+
+    Returns:
+        type: The decorated class.
+    """
+    for name in STYLE_DEFAULTS:
+        if name not in cls.__dict__:
+            setattr(cls, name, property(attrgetter(f"style.{name}"), doc=f"Style option '{name}'."))
+    return cls
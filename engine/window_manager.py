@@ -1,6 +1,7 @@
 # window_manager.py
 
 import pygame
+import math
 import os
 import ctypes
 from typing import Optional
@@ -19,6 +20,8 @@ class WindowManager(BaseManager):
         Game Attributes:
             - title (str): The title of the window.
             - game_size (tuple): The size of the game window in (width, height).
+            - caption_interval (int): Minimum time in milliseconds between two caption updates.
+            - caption_time (int or None): Time in milliseconds of the last caption update.
 
         Display Attributes:
             - screen_info (pygame.display.Info): Information about the display.
@@ -28,6 +31,16 @@ class WindowManager(BaseManager):
             - display (pygame.Surface): Main display surface managed by the window manager.
             - surface (pygame.Surface): Surface for rendering game content.
 
+        Scaling Attributes:
+            - scale_mode (str): Configured scaling filter ('nearest' or 'smooth').
+            - scale_method (str): Scaling method in use ('identity', 'integer', 'nearest' or 'smooth').
+            - scaled_surface (pygame.Surface or None): Persistent destination surface for the scaled game surface.
+
+        Dirty Rect Attributes:
+            - dirty_rects_enabled (bool): Flag indicating if only changed regions are pushed to the display.
+            - dirty_rects (list): Changed regions of the game surface, in game coordinates.
+            - full_redraw (bool): Flag forcing the next frame to push the whole game surface.
+
         Flags Attributes:
             - flags (int): Flags for display mode.
             - is_resizable (bool): Flag indicating if the window is resizable.
@@ -42,6 +55,7 @@ class WindowManager(BaseManager):
             - set_flags(flags): Set the display flags of the window.
             - set_logger(logger): Set the logger instance.
             - get_surface(): Retrieve the pygame.Surface used for rendering game content.
+            - register_bindings(): Register the window event bindings.
 
         Window Management:
             - toggle_fullscreen(): Toggle the fullscreen mode of the window.
@@ -55,6 +69,13 @@ class WindowManager(BaseManager):
             - adjust_display(): Adjust the window display based on current settings.
             - adjust_aspect_ratio(): Adjust the aspect ratio for maintaining proper scaling during resizing.
             - resize(): Resize the window while considering maximize and screen width.
+            - setup_scaled_surface(): Select the scaling method and rebuild the scaled surface.
+            - scale_surface(source, size, destination): Scale a surface into a destination with the scaling method.
+
+        Dirty Rect Management:
+            - mark_dirty(rect=None): Mark a region of the game surface, or the whole surface, as changed.
+            - add_dirty_rects(rects): Mark several regions of the game surface as changed.
+            - map_rect_to_display(rect): Map a game surface rect to its scaled region on the display.
 
         Input Handling:
             - get_adjusted_mouse_position(): Get the adjusted mouse position based on display_factor.
@@ -76,7 +97,9 @@ class WindowManager(BaseManager):
             "height": Optional[int],
             "fullscreen": Optional[bool],
             "resizable": Optional[bool],
-            "maximized": Optional[bool]
+            "maximized": Optional[bool],
+            "dirty_rects": Optional[bool],
+            "scale_mode": Optional[str]
         }
 
         # Set the environment variable to center the game window.
@@ -85,6 +108,8 @@ class WindowManager(BaseManager):
         # Game Attributes
         self.title = Optional[str]
         self.game_size = Optional[tuple]
+        self.caption_interval = 500
+        self.caption_time = None
 
         # Display Attributes
         self.screen_info = pygame.display.Info()
@@ -94,6 +119,16 @@ class WindowManager(BaseManager):
         self.display = pygame.display.set_mode((0, 0), HIDDEN)
         self.surface = pygame.Surface((0, 0))
 
+        # Scaling Attributes
+        self.scale_mode = Optional[str]
+        self.scale_method = Optional[str]
+        self.scaled_surface = None
+
+        # Dirty Rect Attributes
+        self.dirty_rects_enabled = Optional[bool]
+        self.dirty_rects = []
+        self.full_redraw = True
+
         # Flags Attributes
         self.is_fullscreen = Optional[bool]
         self.is_resizable = Optional[bool]
@@ -108,6 +143,7 @@ class WindowManager(BaseManager):
         - set_flags
         - set_logger
         - get_surface
+        - register_bindings
     """
     def load_specific_components(self):
         """
@@ -117,6 +153,8 @@ class WindowManager(BaseManager):
         self.set_title()
         self.set_size()
         self.set_flags()
+        self.dirty_rects_enabled = self.config["dirty_rects"]
+        self.scale_mode = self.config["scale_mode"]
 
         # Adjust the display based on new settings
         self.adjust_display()
@@ -160,6 +198,16 @@ class WindowManager(BaseManager):
         """
         return self.surface
 
+    def register_bindings(self):
+        """
+        Register the window event bindings.
+        """
+        self.main_manager.bind_event(VIDEORESIZE, self.resize)
+        self.main_manager.bind_event(VIDEOEXPOSE, self.mark_dirty)
+        self.main_manager.bind_event(KEYDOWN, self.toggle_maximize, K_F4)
+        self.main_manager.bind_event(KEYDOWN, self.toggle_resizable, K_F6)
+        self.main_manager.bind_event(KEYDOWN, self.toggle_fullscreen, K_F11)
+
     """
     Window Management
         - toggle_fullscreen
@@ -294,6 +342,8 @@ class WindowManager(BaseManager):
         - adjust_display
         - adjust_aspect_ratio
         - resize
+        - setup_scaled_surface
+        - scale_surface
     """
     def adjust_display(self):
         """
@@ -307,6 +357,12 @@ class WindowManager(BaseManager):
         # Set the display mode with the calculated dimensions and provided flags.
         self.display = pygame.display.set_mode(screen_size, self.flags)
 
+        # Rebuild the scaled surface for the new display size
+        self.setup_scaled_surface()
+
+        # The new display holds no content yet
+        self.mark_dirty()
+
     def adjust_aspect_ratio(self):
         """
         Adjust the aspect ratio for maintaining proper scaling during resizing.
@@ -352,6 +408,96 @@ class WindowManager(BaseManager):
         # Adjust the display based on new settings
         self.adjust_display()
 
+    def setup_scaled_surface(self):
+        """
+        Select the scaling method and rebuild the scaled surface.
+        """
+        scaled_w, scaled_h = self.screen_scaled
+        game_w, game_h = self.game_size
+
+        # Select the cheapest scaling method producing the expected result
+        if (scaled_w, scaled_h) == (game_w, game_h):
+            self.scale_method = "identity"
+        elif scaled_w % game_w == 0 and scaled_h % game_h == 0:
+            self.scale_method = "integer"
+        elif self.scale_mode == "smooth" and self.surface.get_bitsize() >= 24:
+            self.scale_method = "smooth"
+        else:
+            if self.scale_mode not in ("nearest", "smooth"):
+                self.log_warning(f"Unsupported scale mode '{self.scale_mode}'. Using 'nearest'.")
+            self.scale_method = "nearest"
+
+        # The game surface is blitted as is when no scaling is needed
+        if self.scale_method == "identity":
+            self.scaled_surface = None
+        else:
+            self.scaled_surface = pygame.Surface(self.screen_scaled, 0, self.surface)
+            if self.main_manager:
+                self.main_manager.frame_stats.add_surfaces()
+
+        self.log_debug(f"Scaling method: {self.scale_method}")
+
+    def scale_surface(self, source, size, destination):
+        """
+        Scale a surface into a destination surface with the current scaling method.
+
+        Args:
+            source (pygame.Surface): Surface to scale.
+            size (tuple): Size of the scaled surface.
+            destination (pygame.Surface): Surface receiving the scaled pixels.
+        """
+        if self.scale_method == "smooth":
+            pygame.transform.smoothscale(source, size, destination)
+        else:
+            pygame.transform.scale(source, size, destination)
+
+    """
+    Dirty Rect Management
+        - mark_dirty
+        - add_dirty_rects
+        - map_rect_to_display
+    """
+    def mark_dirty(self, rect=None):
+        """
+        Mark a region of the game surface as changed.
+
+        Args:
+            rect (pygame.Rect or None): Changed region in game coordinates, or None for the whole surface.
+        """
+        if rect is None:
+            self.full_redraw = True
+            self.dirty_rects.clear()
+        elif not self.full_redraw:
+            self.dirty_rects.append(pygame.Rect(rect))
+
+    def add_dirty_rects(self, rects):
+        """
+        Mark several regions of the game surface as changed.
+
+        Args:
+            rects (list): Changed regions in game coordinates.
+        """
+        if not self.full_redraw:
+            self.dirty_rects.extend(rects)
+
+    def map_rect_to_display(self, rect):
+        """
+        Map a game surface rect to its scaled region on the display.
+
+        Args:
+            rect (pygame.Rect): Region in game coordinates.
+
+        Returns:
+            pygame.Rect: Region in display coordinates, grown outward to whole pixels.
+        """
+        factor_x = self.screen_scaled[0] / self.game_size[0]
+        factor_y = self.screen_scaled[1] / self.game_size[1]
+        left = math.floor(rect.left * factor_x)
+        top = math.floor(rect.top * factor_y)
+        right = math.ceil(rect.right * factor_x)
+        bottom = math.ceil(rect.bottom * factor_y)
+        return pygame.Rect(left + self.screen_gap[0], top + self.screen_gap[1], right - left, bottom - top)
+
     """
     Input Handling
         - get_adjusted_mouse_position
@@ -384,16 +530,65 @@ class WindowManager(BaseManager):
         Args:
             frame_rate (float): Current frame rate in frames per second.
         """
-        # Display the current FPS in the window title
-        pygame.display.set_caption(f"{self.title} ({int(frame_rate)} FPS)")
+        # Display the current FPS in the window title a few times per second
+        current_time = pygame.time.get_ticks()
+        if self.caption_time is None or current_time - self.caption_time >= self.caption_interval:
+            self.caption_time = current_time
+            pygame.display.set_caption(f"{self.title} ({int(frame_rate)} FPS)")
 
     def draw(self):
         """
         Render the game frame.
         """
-        # Scale and blit the game surface onto the display
-        scaled_surface = pygame.transform.scale(self.surface, self.screen_scaled)
-        self.display.blit(scaled_surface, self.screen_gap)
+        if self.dirty_rects_enabled and not self.full_redraw:
+            # Nothing changed since the last frame
+            if not self.dirty_rects:
+                return
+
+            # Regions scaled on their own only match the whole scaled frame at integer factors,
+            # so fractional factors scale the whole frame and only push the changed regions
+            fractional_scale = self.scale_method in ("nearest", "smooth")
+            if fractional_scale:
+                self.scale_surface(self.surface, self.screen_scaled, self.scaled_surface)
+
+            # Scale and blit only the changed regions of the game surface
+            surface_rect = self.surface.get_rect()
+            scaled_rect = pygame.Rect((0, 0), self.screen_scaled)
+            display_rects = []
+            for rect in self.dirty_rects:
+                # Grow the region slightly so filtered edges blend with their surroundings
+                rect = rect.inflate(2, 2).clip(surface_rect)
+                if not rect.width or not rect.height:
+                    continue
+                display_rect = self.map_rect_to_display(rect)
+                if self.scaled_surface:
+                    area = display_rect.move(-self.screen_gap[0], -self.screen_gap[1]).clip(scaled_rect)
+                    display_rect.size = area.size
+                    if not fractional_scale:
+                        self.scale_surface(self.surface.subsurface(rect), area.size,
+                                           self.scaled_surface.subsurface(area))
+                    self.display.blit(self.scaled_surface, display_rect, area)
+                else:
+                    self.display.blit(self.surface, display_rect, rect)
+                display_rects.append(display_rect)
+            self.dirty_rects.clear()
+
+            # Update the changed regions of the display
+            if self.main_manager:
+                self.main_manager.frame_stats.add_blits(len(display_rects))
+            pygame.display.update(display_rects)
+            return
+
+        # Scale the game surface into the persistent scaled surface and blit it onto the display
+        if self.scaled_surface:
+            self.scale_surface(self.surface, self.screen_scaled, self.scaled_surface)
+            self.display.blit(self.scaled_surface, self.screen_gap)
+        else:
+            self.display.blit(self.surface, self.screen_gap)
+        if self.main_manager:
+            self.main_manager.frame_stats.add_blits()
 
         # Update the display
         pygame.display.flip()
+        self.full_redraw = False
+        self.dirty_rects.clear()
@@ -1,10 +1,13 @@
 import pygame
 import random
+import time
 from pygame.locals import *
 from config import load_config
 from engine.ui_manager import UIManager
 from logger import Logger
 from engine.audio_manager import AudioManager
+from engine.frame_stats import FrameStats
+from engine.input_state import InputState
 from engine.window_manager import WindowManager
 
 
@@ -25,24 +28,50 @@ class MainManager:
 
         Time Management Attributes:
             - FPS (int): Target frames per second.
+            - UPS (int): Fixed number of game state updates per second.
+            - update_dt (float): Fixed delta time of a single update in seconds.
+            - max_updates (int): Maximum number of updates run to catch up within a single frame.
+            - accumulator (float): Elapsed time not yet consumed by updates.
+            - alpha (float): Interpolation factor between the last two updates, passed to draw.
             - total_play_time (float): Total play time in seconds.
             - clock (pygame.time.Clock): Clock object to manage frame rate.
             - dt (float): Delta time since the last frame.
+            - frame_stats (FrameStats): Frame timings and counters shown in debug mode.
+
+        Idle Attributes:
+            - idle_enabled (bool): Flag to skip redraws and wait for input while nothing changes.
+            - idle_timeout (int): Maximum time in milliseconds to wait for input while idle.
+            - input_received (bool): Flag indicating if any event was received during the frame.
+            - audio_state (tuple or None): Audio state snapshot of the previous frame.
 
         Input Handling Attributes:
-            - mouse_pos (tuple): Current mouse position.
-            - click (list): List to track mouse click states.
+            - input_state (InputState): Input snapshot built once per frame and consumed by updates.
+            - event_bindings (dict): Callbacks keyed by (event type, key or button), or (event type, None).
+            - input_events (set): Event types consumed by the input snapshot.
 
         Manager Attributes:
             - window_manager (WindowManager): Instance of the WindowManager.
 
     Methods:
         Game Loop:
-            - run(): Main game loop. Handles events, updates game state, and renders the frame.
+            - run(): Main game loop. Handles events, updates game state at a fixed rate, and renders the frame.
             - events(): Handle user input events.
-            - update(): Update the game state.
-            - draw(): Render the game frame.
+            - run_updates(): Run the fixed updates covering the elapsed time.
+            - update(): Update the game state by one fixed step.
+            - draw(alpha): Render the game frame.
+            - toggle_debug_mode(): Toggle debug mode and its frame statistics overlay.
             - quit_game(): Quit the game and clean up resources.
+
+        Idle Management:
+            - is_idle(): Check whether nothing changed during the frame.
+            - wait_for_input(): Block until an event arrives or the idle timeout expires.
+
+        Event Management:
+            - register_bindings(): Register the MainManager event bindings.
+            - bind_event(event_type, callback, code=None): Bind a callback to an event type and key or button.
+            - configure_event_filter(): Allow only the event types consumed by the engine.
+            - get_event_code(event): Get the key or button of an event.
+            - dispatch_event(event): Call the callbacks bound to an event.
     """
     def __init__(self):
         """
@@ -66,13 +95,26 @@ class MainManager:
 
         # Time Management Attributes
         self.FPS = 60
+        self.UPS = self.config["MainManager"]["ups"]
+        self.update_dt = 1 / self.UPS
+        self.max_updates = self.config["MainManager"]["max_updates"]
+        self.accumulator = 0
+        self.alpha = 0
         self.total_play_time = 0
         self.clock = pygame.time.Clock()
         self.dt = self.clock.tick(self.FPS) / 1000
+        self.frame_stats = FrameStats()
+
+        # Idle Attributes
+        self.idle_enabled = self.config["MainManager"]["idle_enabled"]
+        self.idle_timeout = self.config["MainManager"]["idle_timeout"]
+        self.input_received = False
+        self.audio_state = None
 
         # Input Handling Attributes
-        self.mouse_pos = (0, 0)
-        self.click = [None, False, False, False, False, False]
+        self.input_state = InputState.empty()
+        self.event_bindings = {}
+        self.input_events = {MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEWHEEL}
 
         # Manager Attributes
         self.main_manager = self
@@ -96,7 +138,15 @@ class MainManager:
         # Pass managers to UIManager
         self.ui_manager.set_display(self.display)
 
-        # Load the initial menu
+        # Register the event bindings of every manager and filter out unused events
+        self.register_bindings()
+        self.audio_manager.register_bindings()
+        self.ui_manager.register_bindings()
+        self.window_manager.register_bindings()
+        self.configure_event_filter()
+
+        # Check the actions of every menu, then load the initial menu
+        self.ui_manager.validate_actions()
         self.ui_manager.load_menu('start_menu')
 
         self.logger.log_info(f"MainManager initialized")
@@ -105,28 +155,40 @@ class MainManager:
     Game Loop
         - run
         - events
+        - run_updates
         - update
         - draw
+        - toggle_debug_mode
         - quit_game
     """
     def run(self):
         """
-        Main game loop. Handles events, updates game state, and renders the frame.
+        Main game loop. Handles events, updates game state at a fixed rate, and renders the frame.
         """
         while self.playing:
             # Calculate delta time and increment total play time (in seconds)
             self.dt = self.clock.tick(self.FPS) / 1000
             self.total_play_time += self.dt
+            self.accumulator += self.dt
+
+            # The elapsed time closes the statistics of the previous frame
+            self.frame_stats.end_frame(self.dt)
+            self.frame_stats.begin_frame()
 
             # Handle user events
             self.events()
 
-            # Update the game state if not paused
-            if not self.paused:
-                self.update()
+            # Update the game state in fixed steps until it catches up with the elapsed time
+            self.run_updates()
 
-            # Render the current frame
-            self.draw()
+            # Render the current frame between the last two updates, or wait for input if nothing changed
+            if self.is_idle():
+                self.wait_for_input()
+            else:
+                self.alpha = self.accumulator / self.update_dt
+                draw_start = time.perf_counter()
+                self.draw(self.alpha)
+                self.frame_stats.record_draw(time.perf_counter() - draw_start)
 
         # Quit the game when the main loop ends
         self.quit_game()
@@ -135,92 +197,96 @@ class MainManager:
         """
         Handle user input events.
         """
-        # Click: None, Left, Middle, Right, Scroll Up, Scroll Down
-        self.click = [None, False, False, False, False, False]
+        # Keep the edges not yet consumed by an update
+        # Buttons: None, Left, Middle, Right, Scroll Up, Scroll Down
+        previous_state = self.input_state
+        buttons_down = list(previous_state.buttons_down)
+        buttons_up = list(previous_state.buttons_up)
+        wheel = previous_state.wheel
+
+        # Coalesce mouse motion bursts, the mouse position is read once below
+        mouse_moved = pygame.event.peek(MOUSEMOTION)
+        if mouse_moved:
+            pygame.event.clear(MOUSEMOTION)
+            if (MOUSEMOTION, None) in self.event_bindings:
+                self.dispatch_event(pygame.event.Event(MOUSEMOTION))
 
         # Get events
         self.event = pygame.event.get()
+        self.input_received = mouse_moved or bool(self.event)
         for event in self.event:
-            # Handle window resizing event
-            if event.type == VIDEORESIZE:
-                self.window_manager.resize()
-
-            # Handle mouse click events
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:
-                    self.click[1] = True
-                elif event.button == 2:
-                    self.click[2] = True
-                elif event.button == 3:
-                    self.click[3] = True
-                elif event.button == 4:
-                    self.click[4] = True
-                elif event.button == 5:
-                    self.click[5] = True
-
-            # Handle keyboard shortcuts
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.quit_game()
-                elif event.key == pygame.K_h:
-                    self.debug_mode = not self.debug_mode
-                elif event.key == pygame.K_F4:
-                    self.window_manager.toggle_maximize()
-                elif event.key == pygame.K_F6:
-                    self.window_manager.toggle_resizable()
-                elif event.key == pygame.K_F11:
-                    self.window_manager.toggle_fullscreen()
-
-            # Debug
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_1:
-                    self.audio_manager.play_music("bgm_eight_Lament_Scarlet")
-                elif event.key == pygame.K_2:
-                    self.audio_manager.play_music("bgm_nagumorizu_Strategy_Meeting")
-                elif event.key == pygame.K_3:
-                    self.audio_manager.play_music("bgm_tak_mfk_Dance_of_the_Cold_Moon")
-                elif event.key == pygame.K_4:
-                    self.audio_manager.play_sound("maou_se_onepoint09")
-                elif event.key == pygame.K_5:
-                    self.audio_manager.play_voice("YouFulca_voice_07_cool_attack")
-                elif event.key == pygame.K_m:
-                    self.audio_manager.toggle_music_playback()
-                elif event.key == pygame.K_v:
-                    self.audio_manager.stop_music()
-                elif event.key == pygame.K_b:
-                    self.audio_manager.stop_sound()
-                elif event.key == pygame.K_n:
-                    self.audio_manager.stop_voice()
-                elif event.key == pygame.K_o:
-                    self.audio_manager.set_bgm_loop(-1)  # Infinite loop
-                elif event.key == pygame.K_p:
-                    self.audio_manager.set_bgm_loop(0)   # No loop
-                elif event.key == pygame.K_u:
-                    self.audio_manager.toggle_audio_mute()  # Toggle mute/unmute
-                elif event.key == pygame.K_KP_PLUS:
-                    self.audio_manager.adjust_volume("master", 0.05)
-                elif event.key == pygame.K_KP_MINUS:
-                    self.audio_manager.adjust_volume("master", -0.05)
-
-            # Handle quit event
-            if event.type == pygame.QUIT:
-                self.quit_game()
+            # Handle mouse button and wheel events
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button < len(buttons_down):
+                buttons_down[event.button] = True
+            elif event.type == pygame.MOUSEBUTTONUP and event.button < len(buttons_up):
+                buttons_up[event.button] = True
+            elif event.type == pygame.MOUSEWHEEL:
+                wheel += event.y
+
+            # Call the bound callbacks
+            self.dispatch_event(event)
 
         # Update mouse position based on display_factor
-        self.mouse_pos = self.window_manager.get_adjusted_mouse_position()
+        mouse_pos = self.window_manager.get_adjusted_mouse_position()
+        mouse_delta = (
+            previous_state.mouse_delta[0] + mouse_pos[0] - previous_state.mouse_pos[0],
+            previous_state.mouse_delta[1] + mouse_pos[1] - previous_state.mouse_pos[1]
+        )
+
+        # Build the input snapshot of the frame
+        left, middle, right = pygame.mouse.get_pressed()
+        self.input_state = InputState(
+            mouse_pos=mouse_pos,
+            mouse_delta=mouse_delta,
+            buttons_down=tuple(buttons_down),
+            buttons_held=(False, left, middle, right, False, False),
+            buttons_up=tuple(buttons_up),
+            wheel=wheel,
+            modifiers=pygame.key.get_mods()
+        )
+
+    def run_updates(self):
+        """
+        Run the fixed updates covering the elapsed time, at most max_updates per frame.
+
+        Returns:
+            int: Number of fixed steps consumed.
+        """
+        updates = 0
+        while self.accumulator >= self.update_dt and updates < self.max_updates:
+            if not self.paused:
+                update_start = time.perf_counter()
+                self.update()
+                self.frame_stats.record_update(time.perf_counter() - update_start)
+            else:
+                # Input edges received while paused are dropped rather than replayed after the pause
+                self.input_state = self.input_state.clear_edges()
+            self.accumulator -= self.update_dt
+            updates += 1
+
+        # Drop the remaining backlog when the game cannot keep up
+        if updates == self.max_updates:
+            self.accumulator = min(self.accumulator, self.update_dt)
+        return updates
 
     def update(self):
         """
-        Update the game state.
+        Update the game state by one fixed step.
         """
         # Update game components
         self.window_manager.update(self.clock.get_fps())
 
-        self.ui_manager.update(self.mouse_pos, self.click)
+        self.ui_manager.update(self.input_state)
 
-    def draw(self):
+        # Input edges are consumed by the first update following them
+        self.input_state = self.input_state.clear_edges()
+
+    def draw(self, alpha=1.0):
         """
         Render the game frame.
+
+        Args:
+            alpha (float): Interpolation factor between the previous and the current game state (0.0 to 1.0).
         """
         # Clear the display
         self.display.fill((0, 0, 0))
@@ -231,16 +297,135 @@ class MainManager:
 
         # Draw the game components
         self.ui_manager.draw()
+
+        # Draw the frame statistics overlay
+        if self.debug_mode:
+            self.window_manager.mark_dirty(self.frame_stats.draw(self.display))
+
         self.window_manager.draw()
 
+    def toggle_debug_mode(self):
+        """
+        Toggle debug mode and its frame statistics overlay.
+        """
+        self.debug_mode = not self.debug_mode
+
+        # Redraw the whole frame to remove the overlay
+        self.window_manager.mark_dirty()
+
     def quit_game(self):
         """
         Quit the game and clean up resources.
         """
         self.logger.log_info(f"Total game time: {self.total_play_time:.3f} seconds")
+        self.ui_manager.shutdown_preloads()
         pygame.quit()
         quit()
 
+    """
+    Idle Management
+        - is_idle
+        - wait_for_input
+    """
+    def is_idle(self):
+        """
+        Check whether nothing changed during the frame.
+
+        Returns:
+            bool: True if there was no input, no UI change, no audio state change and no debug overlay.
+        """
+        if not self.idle_enabled or self.debug_mode:
+            return False
+
+        # Audio state is compared every frame to keep the snapshot current
+        audio_state = self.audio_manager.get_playback_state()
+        audio_changed = audio_state != self.audio_state
+        self.audio_state = audio_state
+
+        if self.input_received or audio_changed:
+            return False
+        if self.window_manager.full_redraw or self.ui_manager.has_changes():
+            return False
+        return True
+
+    def wait_for_input(self):
+        """
+        Block until an event arrives or the idle timeout expires.
+        """
+        # Put the event back in the queue to be handled by the next frame
+        event = pygame.event.wait(self.idle_timeout)
+        if event.type != pygame.NOEVENT:
+            pygame.event.post(event)
+
+        # The idle time counts as play time but is not simulated
+        self.total_play_time += self.clock.tick() / 1000
+
+    """
+    Event Management
+        - register_bindings
+        - bind_event
+        - configure_event_filter
+        - get_event_code
+        - dispatch_event
+    """
+    def register_bindings(self):
+        """
+        Register the MainManager event bindings.
+        """
+        self.bind_event(QUIT, self.quit_game)
+        self.bind_event(KEYDOWN, self.quit_game, K_ESCAPE)
+        self.bind_event(KEYDOWN, self.toggle_debug_mode, K_h)
+
+    def bind_event(self, event_type, callback, code=None):
+        """
+        Bind a callback to an event type and key or button.
+
+        Args:
+            event_type (int): Pygame event type.
+            callback (Callable): Function called without arguments when the event is received.
+            code (int or None): Key or mouse button of the event, or None for every event of the type.
+        """
+        self.event_bindings.setdefault((event_type, code), []).append(callback)
+
+    def configure_event_filter(self):
+        """
+        Allow only the event types consumed by the engine.
+        """
+        allowed_events = self.input_events | {event_type for event_type, _ in self.event_bindings}
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(allowed_events))
+
+    @staticmethod
+    def get_event_code(event):
+        """
+        Get the key or button of an event.
+
+        Args:
+            event (pygame.event.Event): The event.
+
+        Returns:
+            int or None: The key of keyboard events, the button of mouse button events, otherwise None.
+        """
+        if event.type in (KEYDOWN, KEYUP):
+            return event.key
+        if event.type in (MOUSEBUTTONDOWN, MOUSEBUTTONUP):
+            return event.button
+        return None
+
+    def dispatch_event(self, event):
+        """
+        Call the callbacks bound to an event.
+
+        Args:
+            event (pygame.event.Event): The event to dispatch.
+        """
+        code = self.get_event_code(event)
+        for callback in self.event_bindings.get((event.type, code), ()):
+            callback()
+        if code is not None:
+            for callback in self.event_bindings.get((event.type, None), ()):
+                callback()
+
 
 if __name__ == "__main__":
     game = MainManager()
@@ -151,6 +151,38 @@ menu_config = {
                 'rectangle_color': (70, 130, 180), 'border_color': (255, 255, 255), 'border_width': 5,
                 'layer': 1,
             }
+        },
+        "list": {
+            'save_slots': {
+                'pos_x': 400, 'pos_y': 260, 'rectangle_width': 300, 'rectangle_height': 150,
+                'rectangle_color': (40, 40, 60), 'hover_color': None, 'pressed_color': None,
+                'row_count': 10000, 'row_format': 'Save Slot {number}', 'row_height': 30,
+                'text_font_size': 24, 'scroll_speed': 3,
+                'shadow_enabled': False, 'drag_enabled': False
+            }
+        },
+        "container": {
+            'side_panel': {
+                'pos_x': 20, 'pos_y': 185, 'rectangle_width': 200, 'rectangle_height': 150, 'align': 'nw',
+                'rectangle_color': (40, 40, 60), 'hover_color': None, 'pressed_color': None,
+                'shadow_enabled': False, 'drag_enabled': False,
+                'children': {
+                    "label": {
+                        'panel_title': {
+                            'pos_x': 100, 'pos_y': 25, 'rectangle_width': 180, 'rectangle_height': 30,
+                            'text_label': 'Panel', 'text_font_size': 24,
+                            'rectangle_color': (70, 130, 180), 'shadow_enabled': False, 'drag_enabled': False
+                        }
+                    },
+                    "button": {
+                        'panel_main_menu': {
+                            'pos_x': 100, 'pos_y': 100, 'rectangle_width': 180, 'rectangle_height': 50,
+                            'rectangle_color': (70, 130, 180), 'text_label': 'Main Menu',
+                            'action': "ui_manager.load_menu('main_menu')", 'drag_enabled': False
+                        }
+                    }
+                }
+            }
         }
     }
 }
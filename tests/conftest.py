@@ -0,0 +1,42 @@
+# conftest.py
+
+import os
+
+import pygame
+import pytest
+
+# Run pygame headless; the managers read config.json and the assets relative to the project root
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+PROJECT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="session")
+def main_manager():
+    """
+    MainManager shared by the tests, with the start menu loaded.
+    """
+    previous_path = os.getcwd()
+    os.chdir(PROJECT_PATH)
+
+    from main import MainManager
+    manager = MainManager()
+    yield manager
+
+    manager.ui_manager.shutdown_preloads()
+    pygame.quit()
+    os.chdir(previous_path)
+
+
+@pytest.fixture
+def ui_manager(main_manager):
+    """
+    UIManager with an empty menu cache, restored to the start menu after the test.
+    """
+    ui_manager = main_manager.ui_manager
+    yield ui_manager
+
+    ui_manager.action_queue.clear()
+    ui_manager.load_menu('start_menu')
+    ui_manager.menu_cache.clear()
+    ui_manager.menu_cache_bytes = 0
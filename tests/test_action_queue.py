@@ -0,0 +1,85 @@
+# test_action_queue.py
+
+from engine.action_queue import ActionQueue
+from engine.ui_button import UIButton
+
+
+def test_push_coalesces_by_key():
+    calls = []
+    queue = ActionQueue()
+
+    queue.push(lambda: calls.append('a'), 'key')
+    queue.push(lambda: calls.append('b'), 'key')
+    queue.push(lambda: calls.append('c'), 'other')
+
+    assert len(queue) == 2
+    assert queue.drain() == 2
+    assert calls == ['a', 'c']
+    assert queue.coalesced == 1
+    assert queue.executed == 2
+
+
+def test_push_without_key_coalesces_same_callable():
+    calls = []
+    queue = ActionQueue()
+
+    def action():
+        calls.append(1)
+
+    queue.push(action)
+    queue.push(action)
+    queue.drain()
+
+    assert calls == [1]
+
+
+def test_drain_respects_budget_in_push_order():
+    calls = []
+    queue = ActionQueue(budget=2)
+    for i in range(5):
+        queue.push(lambda i=i: calls.append(i), i)
+
+    assert queue.drain() == 2
+    assert calls == [0, 1]
+    assert queue.drain() == 2
+    assert queue.drain() == 1
+    assert calls == [0, 1, 2, 3, 4]
+    assert queue.drain() == 0
+
+
+def test_clear_drops_pending_actions():
+    calls = []
+    queue = ActionQueue()
+    queue.push(lambda: calls.append(1), 'key')
+
+    queue.clear()
+
+    assert len(queue) == 0
+    assert queue.drain() == 0
+    assert calls == []
+
+
+def test_element_actions_coalesce_per_button(ui_manager, monkeypatch):
+    calls = []
+    monkeypatch.setattr(UIButton, 'debug', lambda self, *args: calls.append((self.element_id, args)))
+    config = {'rectangle_width': 50, 'rectangle_height': 20, 'action': 'debug(7)'}
+    first = ui_manager.create_element('button', 'first', config)
+    second = ui_manager.create_element('button', 'second', config)
+
+    first.click()
+    first.click()
+    second.click()
+    ui_manager.action_queue.drain()
+
+    assert calls == [('first', (7,)), ('second', (7,))]
+
+
+def test_manager_actions_coalesce_across_buttons(ui_manager):
+    config = {'rectangle_width': 50, 'rectangle_height': 20, 'action': "ui_manager.load_menu('test_menu')"}
+    first = ui_manager.create_element('button', 'first', config)
+    second = ui_manager.create_element('button', 'second', config)
+
+    first.click()
+    second.click()
+
+    assert len(ui_manager.action_queue) == 1
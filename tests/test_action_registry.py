@@ -0,0 +1,122 @@
+# test_action_registry.py
+
+import pytest
+
+from engine.action_registry import ActionRegistry
+from engine.ui_button import UIButton
+from engine.ui_label import UILabel
+
+
+@pytest.fixture
+def registry(main_manager):
+    return ActionRegistry(main_manager.managers, main_manager.logger)
+
+
+def test_parse_arguments_literals():
+    assert ActionRegistry.parse_arguments("(800, 600), 42, 'abc', True") == ((800, 600), 42, 'abc', True)
+    assert ActionRegistry.parse_arguments("  ") == ()
+    assert ActionRegistry.parse_arguments("'one'") == ('one',)
+
+
+def test_parse_arguments_rejects_expressions():
+    with pytest.raises(ValueError):
+        ActionRegistry.parse_arguments("__import__('os')")
+
+
+def test_parse_action(registry):
+    assert registry.parse_action("audio_manager.adjust_volume('master', 0.05)") == \
+        ('audio_manager.adjust_volume', ('master', 0.05))
+    assert registry.parse_action("window_manager.toggle_fullscreen") == ('window_manager.toggle_fullscreen', ())
+    with pytest.raises(ValueError, match="closing parenthesis"):
+        registry.parse_action("debug(1, 2")
+
+
+def test_compile_manager_action_is_shared(registry, main_manager):
+    action, element_bound = registry.compile("window_manager.toggle_fullscreen")
+
+    assert not element_bound
+    assert action == main_manager.window_manager.toggle_fullscreen
+    assert registry.compile("window_manager.toggle_fullscreen", UIButton)[0] is action
+
+
+def test_compile_unknown_manager_method(registry):
+    with pytest.raises(ValueError, match="not found"):
+        registry.compile("window_manager.toggle_fulscreen")
+
+
+def test_compile_element_action_per_class(registry):
+    action, element_bound = registry.compile("debug(1)", UIButton)
+    assert element_bound
+    assert registry.compile("debug(1)", UIButton)[0] is action
+
+    # A cached compilation for one class does not resolve the method on another
+    with pytest.raises(ValueError, match="not found in the element"):
+        registry.compile("debug(1)", UILabel)
+
+
+def test_get_action_binds_element(registry, ui_manager, monkeypatch):
+    calls = []
+    monkeypatch.setattr(UIButton, 'debug', lambda self, *args: calls.append((self.element_id, args)))
+    button = ui_manager.create_element('button', 'bound', {'rectangle_width': 10, 'rectangle_height': 10})
+
+    registry.get_action("debug(3, 'x')", button)()
+
+    assert calls == [('bound', (3, 'x'))]
+    assert registry.get_action_key("debug(3, 'x')", button) == ("debug(3, 'x')", 'bound')
+    assert registry.get_action_key("window_manager.toggle_fullscreen", button) == "window_manager.toggle_fullscreen"
+
+
+def test_get_action_unresolved_returns_none(registry, ui_manager):
+    label = ui_manager.create_element('label', 'label', {'rectangle_width': 10, 'rectangle_height': 10})
+
+    assert registry.get_action("debug(1)", label) is None
+
+
+def test_validate_reports_every_invalid_action(registry):
+    menu_config = {
+        'menu': {
+            'button': {
+                'good': {'action': "window_manager.toggle_fullscreen"},
+                'typo': {'action': "window_manager.toggle_fulscreen"},
+                'open': {'action': "debug(1, 2"},
+            },
+            'container': {
+                'panel': {'children': {'button': {'nested': {'action': "missing_method()"}}}}
+            }
+        }
+    }
+
+    with pytest.raises(ValueError) as excinfo:
+        registry.validate(menu_config, {'button': UIButton})
+
+    message = str(excinfo.value)
+    assert 'menu.typo' in message and 'menu.open' in message and 'menu.nested' in message
+    assert 'menu.good' not in message
+
+
+def test_failures_are_cached(registry, monkeypatch):
+    calls = []
+    parse_action = registry.parse_action
+    monkeypatch.setattr(registry, 'parse_action', lambda action_str: (calls.append(action_str),
+                                                                      parse_action(action_str))[1])
+
+    for _ in range(3):
+        with pytest.raises(ValueError, match="not found"):
+            registry.compile("window_manager.toggle_fulscreen")
+        with pytest.raises(ValueError, match="closing parenthesis"):
+            registry.compile("debug(1, 2", UIButton)
+
+    assert calls == ["window_manager.toggle_fulscreen", "debug(1, 2"]
+
+
+def test_validate_reports_shared_failure_once(registry):
+    menu_config = {
+        'menu': {'button': {'first': {'action': "missing_method()"}, 'second': {'action': "missing_method()"}}}
+    }
+
+    with pytest.raises(ValueError) as excinfo:
+        registry.validate(menu_config, {'button': UIButton})
+
+    message = str(excinfo.value)
+    assert message.count("not found") == 1
+    assert 'menu.first, menu.second' in message
@@ -0,0 +1,86 @@
+# test_glyph_atlas.py
+
+import pygame
+import pytest
+
+from engine.glyph_atlas import GlyphAtlas
+
+
+@pytest.fixture
+def atlas(main_manager):
+    return GlyphAtlas(pygame.font.Font(None, 24), (255, 255, 255))
+
+
+def test_measure_is_close_to_font_size(atlas):
+    # Glyph advances and pair kerning approximate the font layout to a few pixels
+    for text in ("Score: 12345", "AVATAR", "x"):
+        width, height = atlas.measure(text)
+        assert abs(width - atlas.font.size(text)[0]) <= 4
+        assert height == atlas.height
+
+
+def test_measure_and_blits_accept_missing_text(atlas):
+    assert atlas.measure(None) == (0, atlas.height)
+    assert atlas.measure('') == (0, atlas.height)
+    assert atlas.get_blits(None, (0, 0)) == []
+
+
+def test_get_blits_one_per_glyph(atlas):
+    blits = atlas.get_blits("ab1", (10, 20))
+
+    assert len(blits) == 3
+    assert blits[0][1] == (10, 20)
+    assert all(surface is atlas.atlas for surface, _, _ in blits)
+    assert blits[1][1][0] > blits[0][1][0]
+
+
+def test_missing_glyph_is_added(atlas):
+    width, _ = atlas.measure("é")
+
+    assert width > 0
+    assert "é" in atlas.glyphs
+
+
+def test_atlas_label_without_text(ui_manager):
+    label = ui_manager.create_element('label', 'atlas_label', {
+        'rectangle_width': 100, 'rectangle_height': 30, 'text_atlas': True
+    })
+    blit_sequence = []
+    label.collect_blits(blit_sequence)
+
+    assert label.text_rect.width == 0
+    label.set_text("42")
+    assert label.text_rect.width > 0
+
+
+def atlas_label(ui_manager, **config):
+    return ui_manager.create_element('label', 'atlas_label', {
+        'rectangle_width': 100, 'rectangle_height': 30, 'rectangle_color': (0, 0, 0), 'shadow_enabled': False,
+        'text_label': 'AB', 'text_atlas': True, 'text_color': (255, 255, 255), **config
+    })
+
+
+def test_atlas_text_is_drawn_at_text_layer(ui_manager):
+    label = atlas_label(ui_manager)
+    label.update_graphics()
+    blit_sequence = []
+
+    label.collect_blits(blit_sequence)
+
+    surfaces = [blit[0] for blit in blit_sequence]
+    glyph_indexes = [i for i, blit in enumerate(blit_sequence) if len(blit) == 3]
+    assert len(glyph_indexes) == 2
+    assert surfaces.index(label.rectangle_surface) < glyph_indexes[0]
+    assert glyph_indexes[-1] < surfaces.index(label.outline_surface)
+
+
+def test_baked_atlas_label_keeps_its_text(ui_manager):
+    label = atlas_label(ui_manager, baked=True)
+    label.update_graphics()
+
+    composite_surface, composite_rect = label.get_composite()
+
+    text_rect = label.text_rect.move(-composite_rect.x, -composite_rect.y)
+    text_pixels = [composite_surface.get_at((x, y)) for x in range(text_rect.left, text_rect.right)
+                   for y in range(text_rect.top, text_rect.bottom)]
+    assert (255, 255, 255, 255) in text_pixels
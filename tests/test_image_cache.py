@@ -0,0 +1,91 @@
+# test_image_cache.py
+
+import pygame
+import pytest
+from engine.image_cache import ImageCache
+
+
+@pytest.fixture
+def images(main_manager, tmp_path):
+    """
+    Paths of three 16x16 images on disk, with a display to convert them for.
+    """
+    paths = []
+    for index, color in enumerate([(255, 0, 0), (0, 255, 0), (0, 0, 255)]):
+        surface = pygame.Surface((16, 16))
+        surface.fill(color)
+        path = str(tmp_path / f"image_{index}.png")
+        pygame.image.save(surface, path)
+        paths.append(path)
+    return paths
+
+
+def test_acquire_shares_surfaces(images):
+    cache = ImageCache()
+
+    first = cache.acquire(images[0])
+    second = cache.acquire(images[0])
+
+    assert first is second
+    assert cache.entries[(images[0], None, 'alpha')][1] == 2
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_scaled_variant_is_built_from_original(images):
+    cache = ImageCache()
+
+    surface = cache.acquire(images[0], (32, 8))
+
+    assert surface.get_size() == (32, 8)
+    assert cache.entries[(images[0], (32, 8), 'alpha')][1] == 1
+    assert cache.entries[(images[0], None, 'alpha')][1] == 0
+    assert cache.total_bytes == sum(entry[2] for entry in cache.entries.values())
+
+
+def test_release_drops_reference(images):
+    cache = ImageCache()
+    cache.acquire(images[0])
+
+    cache.release(images[0])
+    cache.release(images[0])
+    cache.release(images[1])
+
+    assert cache.entries[(images[0], None, 'alpha')][1] == 0
+
+
+def test_evict_keeps_referenced_entries(images):
+    cache = ImageCache()
+    cache.acquire(images[0])
+    cache.budget = 0
+
+    cache.acquire(images[1])
+    cache.release(images[1])
+
+    assert list(cache.entries) == [(images[0], None, 'alpha')]
+    assert cache.total_bytes == cache.entries[(images[0], None, 'alpha')][2]
+
+
+def test_evict_least_recently_used_first(images):
+    cache = ImageCache()
+    for path in images:
+        cache.acquire(path)
+        cache.release(path)
+    entry_bytes = cache.entries[(images[0], None, 'alpha')][2]
+
+    # Touch the first image, then shrink the budget to two entries
+    cache.get_surface((images[0], None, 'alpha'))
+    cache.budget = 2 * entry_bytes
+    cache.evict()
+
+    assert list(cache.entries) == [(images[2], None, 'alpha'), (images[0], None, 'alpha')]
+    assert cache.total_bytes == 2 * entry_bytes
+
+
+def test_prime_stores_without_reference(images):
+    cache = ImageCache()
+
+    cache.prime(images[0], pygame.image.load(images[0]))
+    surface = cache.acquire(images[0])
+
+    assert cache.misses == 0
+    assert cache.entries[(images[0], None, 'alpha')] == [surface, 1, cache.total_bytes]
@@ -0,0 +1,66 @@
+# test_main_manager.py
+
+import pytest
+from engine.input_state import InputState
+
+
+@pytest.fixture
+def fixed_step(main_manager, monkeypatch):
+    """
+    MainManager counting its fixed updates instead of running them.
+    """
+    calls = []
+    monkeypatch.setattr(main_manager, 'update', lambda: calls.append(main_manager.accumulator))
+    monkeypatch.setattr(main_manager, 'accumulator', 0)
+    monkeypatch.setattr(main_manager, 'paused', False)
+    return main_manager, calls
+
+
+def test_timestep_is_read_from_config(main_manager):
+    config = main_manager.config["MainManager"]
+
+    assert main_manager.UPS == config["ups"]
+    assert main_manager.update_dt == pytest.approx(1 / config["ups"])
+    assert main_manager.max_updates == config["max_updates"]
+    assert main_manager.idle_enabled == config["idle_enabled"]
+    assert main_manager.idle_timeout == config["idle_timeout"]
+
+
+def test_run_updates_consumes_whole_steps(fixed_step):
+    main_manager, calls = fixed_step
+    main_manager.accumulator = main_manager.update_dt * 2.5
+
+    assert main_manager.run_updates() == 2
+    assert len(calls) == 2
+    assert main_manager.accumulator == pytest.approx(main_manager.update_dt * 0.5)
+
+
+def test_run_updates_drops_backlog(fixed_step):
+    main_manager, calls = fixed_step
+    main_manager.accumulator = main_manager.update_dt * (main_manager.max_updates + 10)
+
+    assert main_manager.run_updates() == main_manager.max_updates
+    assert len(calls) == main_manager.max_updates
+    assert main_manager.accumulator <= main_manager.update_dt
+
+
+def test_run_updates_skips_updates_while_paused(fixed_step):
+    main_manager, calls = fixed_step
+    main_manager.paused = True
+    main_manager.accumulator = main_manager.update_dt * 3
+
+    assert main_manager.run_updates() == 3
+    assert calls == []
+
+
+def test_run_updates_drops_input_edges_while_paused(fixed_step, monkeypatch):
+    main_manager, calls = fixed_step
+    buttons = (False, True, False, False, False, False)
+    monkeypatch.setattr(main_manager, 'input_state',
+                        InputState(mouse_pos=(10, 20), buttons_down=buttons, buttons_held=buttons, wheel=1))
+    main_manager.paused = True
+    main_manager.accumulator = main_manager.update_dt
+
+    main_manager.run_updates()
+
+    assert main_manager.input_state == InputState(mouse_pos=(10, 20), buttons_held=buttons)
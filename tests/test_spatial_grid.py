@@ -0,0 +1,59 @@
+# test_spatial_grid.py
+
+import pygame
+from engine.spatial_grid import SpatialGrid
+
+
+def test_get_cells_covers_rect():
+    grid = SpatialGrid(64)
+
+    assert grid.get_cells(pygame.Rect(0, 0, 64, 64)) == {(0, 0)}
+    assert grid.get_cells(pygame.Rect(60, 0, 10, 10)) == {(0, 0), (1, 0)}
+    assert grid.get_cells(pygame.Rect(-10, -10, 5, 5)) == {(-1, -1)}
+    assert grid.get_cells(pygame.Rect(70, 70, 0, 0)) == {(1, 1)}
+
+
+def test_query_point_tests_the_rects():
+    grid = SpatialGrid(64)
+    grid.insert('a', pygame.Rect(10, 10, 20, 20))
+    grid.insert('b', pygame.Rect(20, 20, 100, 100))
+
+    assert grid.query_point((15, 15)) == {'a'}
+    assert grid.query_point((25, 25)) == {'a', 'b'}
+    assert grid.query_point((100, 100)) == {'b'}
+    assert grid.query_point((50, 5)) == set()
+    assert grid.query_point((500, 500)) == set()
+
+
+def test_insert_moves_key_between_cells():
+    grid = SpatialGrid(64)
+    grid.insert('a', pygame.Rect(0, 0, 10, 10))
+    grid.insert('a', pygame.Rect(200, 0, 10, 10))
+
+    assert grid.query_point((5, 5)) == set()
+    assert grid.query_point((205, 5)) == {'a'}
+    assert (0, 0) not in grid.cells
+    assert grid.cells[(3, 0)] == {'a'}
+
+
+def test_insert_copies_rect():
+    grid = SpatialGrid(64)
+    rect = pygame.Rect(0, 0, 10, 10)
+    grid.insert('a', rect)
+    rect.move_ip(300, 300)
+
+    assert grid.query_point((5, 5)) == {'a'}
+
+
+def test_remove_and_clear_drop_empty_cells():
+    grid = SpatialGrid(64)
+    grid.insert('a', pygame.Rect(0, 0, 100, 100))
+    grid.insert('b', pygame.Rect(0, 0, 10, 10))
+
+    grid.remove('a')
+    grid.remove('missing')
+    assert grid.cells == {(0, 0): {'b'}}
+    assert 'a' not in grid.rects
+
+    grid.clear()
+    assert not grid.cells and not grid.rects
@@ -0,0 +1,65 @@
+# test_text_cache.py
+
+import pygame
+import pytest
+from engine.text_cache import TextCache
+
+
+@pytest.fixture
+def font(main_manager):
+    return pygame.font.Font(None, 24)
+
+
+def test_render_reuses_surfaces(font):
+    cache = TextCache()
+
+    first = cache.render(font, 'Play', (255, 255, 255))
+    second = cache.render(font, 'Play', [255, 255, 255])
+
+    assert first is second
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.total_bytes == first.get_pitch() * first.get_height()
+
+
+def test_render_keys_on_style(font):
+    cache = TextCache()
+
+    surfaces = [cache.render(font, 'Play', (255, 255, 255)),
+                cache.render(font, 'Play', (0, 0, 0)),
+                cache.render(font, 'Play', (255, 255, 255), antialias=False),
+                cache.render(font, 'Play', (255, 255, 255), background=(0, 0, 0)),
+                cache.render(pygame.font.Font(None, 30), 'Play', (255, 255, 255))]
+
+    assert len({id(surface) for surface in surfaces}) == 5
+    assert cache.misses == 5
+
+
+def test_evict_least_recently_used_first(font):
+    cache = TextCache()
+    for text in ('a', 'b', 'c'):
+        cache.render(font, text, (255, 255, 255))
+    cache.render(font, 'a', (255, 255, 255))
+
+    cache.budget = cache.total_bytes - 1
+    cache.evict()
+
+    assert [key[1] for key in cache.entries] == ['c', 'a']
+    assert cache.total_bytes == sum(size_bytes for _, size_bytes in cache.entries.values())
+
+
+def test_evict_keeps_latest_entry(font):
+    cache = TextCache(budget=0)
+
+    surface = cache.render(font, 'A long line of text', (255, 255, 255))
+
+    assert [key[1] for key in cache.entries] == ['A long line of text']
+    assert cache.render(font, 'A long line of text', (255, 255, 255)) is surface
+
+
+def test_clear(font):
+    cache = TextCache()
+    cache.render(font, 'Play', (255, 255, 255))
+
+    cache.clear()
+
+    assert not cache.entries and cache.total_bytes == 0
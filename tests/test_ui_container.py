@@ -0,0 +1,115 @@
+# test_ui_container.py
+
+import pytest
+from engine.input_state import InputState
+from engine.ui_button import UIButton
+from engine.ui_container import UIContainer
+
+
+def box(pos_x, pos_y, **config):
+    return {'pos_x': pos_x, 'pos_y': pos_y, 'align': 'nw', 'rectangle_width': 40, 'rectangle_height': 20,
+            'text_enabled': False, **config}
+
+
+@pytest.fixture
+def panel(ui_manager):
+    config = box(100, 100, rectangle_width=200, rectangle_height=200, children={
+        'button': {'first': box(10, 10), 'second': box(10, 100)},
+        'container': {'inner': box(100, 10, rectangle_width=80, rectangle_height=80, children={
+            'button': {'deep': box(5, 5)}
+        })}
+    })
+    panel = UIContainer('panel', config, ui_manager.managers, ui_manager.logger)
+    panel.update(InputState.empty())
+    return panel
+
+
+def hovered_ids(container):
+    return {child.element_id for child in container.children if child.hovered_state}
+
+
+def test_children_are_positioned_relative_to_origin(panel):
+    assert panel.get_child('first').collision_rect.topleft == (110, 110)
+    assert panel.get_child('inner').get_child('deep').collision_rect.topleft == (205, 115)
+
+
+def test_moving_container_moves_children(panel):
+    panel.set_position(300, 50)
+    panel.update(InputState.empty())
+
+    assert panel.get_child('second').collision_rect.topleft == (310, 150)
+    assert panel.get_child('inner').get_child('deep').collision_rect.topleft == (405, 65)
+    assert panel.get_world_rect().topleft == (300, 50)
+
+
+def test_empty_container_world_rect_follows_its_geometry(ui_manager):
+    panel = UIContainer('empty', box(0, 0), ui_manager.managers, ui_manager.logger)
+    panel.update(InputState.empty())
+    assert panel.get_world_rect().topleft == (0, 0)
+
+    panel.set_position(50, 60)
+    panel.update(InputState.empty())
+    assert panel.get_world_rect().topleft == (50, 60)
+
+    panel.set_visible(False)
+    assert panel.get_world_rect() is None
+
+    panel.set_visible(True)
+    assert panel.get_world_rect().topleft == (50, 60)
+
+
+def test_children_are_hit_tested_through_grid(panel):
+    panel.update(InputState(mouse_pos=(115, 205)))
+    assert hovered_ids(panel) == {'second'}
+
+    panel.update(InputState(mouse_pos=(210, 120)))
+    assert hovered_ids(panel) == {'inner'}
+    assert hovered_ids(panel.get_child('inner')) == {'deep'}
+
+    panel.update(InputState(mouse_pos=(250, 250)))
+    panel.update(InputState(mouse_pos=(250, 250)))
+    assert not hovered_ids(panel)
+    assert not hovered_ids(panel.get_child('inner'))
+
+
+def test_grid_follows_moved_container(panel):
+    panel.set_position(400, 300)
+    panel.update(InputState.empty())
+    panel.update(InputState.empty())
+
+    panel.update(InputState(mouse_pos=(415, 315)))
+    assert hovered_ids(panel) == {'first'}
+
+
+def test_idle_children_away_from_mouse_are_skipped(panel, monkeypatch):
+    panel.update(InputState.empty())
+    panel.update(InputState.empty())
+    updated = []
+    update = UIButton.update
+    monkeypatch.setattr(UIButton, 'update', lambda self, *args: (updated.append(self.element_id),
+                                                                 update(self, *args)))
+
+    panel.update(InputState(mouse_pos=(115, 115)))
+
+    assert updated == ['first']
+
+
+def test_hidden_container_skips_children(panel):
+    panel.set_visible(False)
+    panel.update(InputState(mouse_pos=(115, 115)))
+
+    assert not panel.get_child('first').hovered_state
+    assert panel.get_world_rect() is None
+
+
+def test_child_change_wakes_ancestors(panel):
+    panel.update(InputState.empty())
+    panel.children_dirty = False
+    panel.get_child('inner').children_dirty = False
+    panel.dirty = False
+
+    panel.get_child('inner').get_child('deep').mark_dirty()
+
+    assert panel.is_dirty()
+    assert 'inner' in panel.awake_children
+    assert panel.get_child('inner').is_dirty()
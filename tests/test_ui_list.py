@@ -0,0 +1,117 @@
+# test_ui_list.py
+
+import pygame
+import pytest
+from engine.input_state import InputState
+from engine.ui_container import UIContainer
+from engine.ui_element import UIElement
+from engine.ui_list import UIList
+from tests.test_ui_manager import settle
+
+
+@pytest.fixture
+def ui_list(ui_manager):
+    config = {'pos_x': 10, 'pos_y': 20, 'align': 'nw', 'rectangle_width': 200, 'rectangle_height': 100,
+              'row_height': 30, 'row_count': 100, 'row_format': 'Row {number}'}
+    ui_list = UIList('list', config, ui_manager.managers, ui_manager.logger)
+    ui_list.update_graphics()
+    return ui_list
+
+
+def visible_rows(ui_list):
+    return sorted((index, label.text_label) for index, label in zip(ui_list.row_indexes, ui_list.row_labels)
+                  if label.state_visible)
+
+
+def test_clip_blits_crops_source_area():
+    surface = pygame.Surface((50, 20))
+    clip_rect = pygame.Rect(0, 0, 100, 100)
+
+    clipped = UIList.clip_blits([(surface, (-10, 90)), (surface, (10, 10), (5, 0, 20, 20)),
+                                 (surface, (200, 0))], clip_rect)
+
+    assert clipped == [(surface, (0, 90), pygame.Rect(10, 0, 40, 10)),
+                       (surface, (10, 10), pygame.Rect(5, 0, 20, 20))]
+
+
+def test_layout_rows_fills_viewport(ui_list):
+    assert len(ui_list.row_labels) == 5
+    assert visible_rows(ui_list)[:2] == [(0, 'Row 1'), (1, 'Row 2')]
+    assert ui_list.row_labels[0].pos_y == 20 + 15
+    assert ui_list.row_labels[3].pos_y == 20 + 3 * 30 + 15
+
+
+def test_scrolling_one_row_rebinds_one_label(ui_list):
+    labels = list(ui_list.row_labels)
+    row_indexes = list(ui_list.row_indexes)
+
+    ui_list.scroll_by(30)
+    ui_list.layout_rows()
+
+    assert ui_list.row_labels == labels
+    assert sum(a != b for a, b in zip(row_indexes, ui_list.row_indexes)) == 1
+    assert visible_rows(ui_list)[0] == (1, 'Row 2')
+    assert ui_list.row_labels[1].pos_y == 20 + 15
+
+
+def test_scroll_is_clamped_and_hides_missing_rows(ui_list):
+    ui_list.scroll_to(1000)
+    ui_list.layout_rows()
+
+    assert ui_list.scroll_offset == ui_list.get_max_scroll() == 100 * 30 - 100
+    assert [index for index, _ in visible_rows(ui_list)] == [96, 97, 98, 99]
+
+    ui_list.set_rows(['a', 'b'])
+    ui_list.layout_rows()
+
+    assert ui_list.scroll_offset == 0
+    assert visible_rows(ui_list) == [(0, 'a'), (1, 'b')]
+
+
+def test_collect_blits_stays_inside_viewport(ui_list):
+    ui_list.scroll_by(45)
+    ui_list.layout_rows()
+    list_blits, blits = [], []
+    UIElement.collect_blits(ui_list, list_blits)
+
+    ui_list.collect_blits(blits)
+
+    row_blits = blits[len(list_blits):]
+    assert len(row_blits) == 4
+    for surface, dest, area in row_blits:
+        assert ui_list.rectangle_rect.contains(pygame.Rect(dest, area.size))
+
+
+def test_scroll_without_input_redraws_next_frame(main_manager, ui_manager, ui_list):
+    ui_manager.load_menu('test_menu')
+    ui_manager.add_element(ui_list)
+    settle(main_manager)
+    assert main_manager.is_idle()
+
+    ui_list.scroll_to(10)
+
+    assert ui_manager.has_changes()
+    assert not main_manager.is_idle()
+
+    ui_manager.update(InputState.empty())
+    assert ui_list.is_dirty()
+    assert visible_rows(ui_list)[0] == (10, 'Row 11')
+
+    settle(main_manager)
+    assert main_manager.is_idle()
+
+
+def test_set_rows_wakes_parent_container(ui_manager):
+    config = {'pos_x': 0, 'pos_y': 0, 'align': 'nw', 'rectangle_width': 300, 'rectangle_height': 300,
+              'text_enabled': False,
+              'children': {'list': {'rows': {'align': 'nw', 'rectangle_width': 200, 'rectangle_height': 100}}}}
+    panel = UIContainer('panel', config, ui_manager.managers, ui_manager.logger)
+    panel.update(InputState.empty())
+    panel.awake_children.clear()
+    panel.children_dirty = False
+
+    panel.get_child('rows').set_rows(['a', 'b'])
+    panel.update(InputState(mouse_pos=(1000, 1000)))
+
+    assert panel.is_dirty()
+    assert visible_rows(panel.get_child('rows')) == [(0, 'a'), (1, 'b')]
@@ -0,0 +1,113 @@
+# test_ui_manager.py
+
+import threading
+
+from engine.input_state import InputState
+from engine.ui_button import UIButton
+from engine.ui_container import UIContainer
+from engine.ui_element import UIElement
+
+
+def test_set_element_layer_keeps_resources(ui_manager):
+    ui_manager.load_menu('test_menu')
+    element = ui_manager.ui_elements['quit_game']
+    image_surface = element.image_surface
+    refcounts = {key: entry[1] for key, entry in ui_manager.image_cache.entries.items()}
+
+    ui_manager.set_element_layer('quit_game', 5)
+
+    assert element.image_surface is image_surface
+    assert {key: entry[1] for key, entry in ui_manager.image_cache.entries.items()} == refcounts
+    assert all(refcounts[key] > 0 for key in refcounts if key[0] == element.image_path)
+    assert ui_manager.render_list[-1] is element
+    assert ui_manager.render_layers == sorted(ui_manager.render_layers)
+    assert 'quit_game' in ui_manager.get_elements_at(element.collision_rect.center)
+
+
+def test_set_element_layer_orders_render_list(ui_manager):
+    ui_manager.load_menu('test_menu')
+
+    ui_manager.set_element_layer('layer_test', 3)
+
+    ids = [element.element_id for element in ui_manager.render_list]
+    assert ids.index('layer_test') > ids.index('test_header')
+    assert len(ids) == len(ui_manager.ui_elements)
+
+
+def settle(main_manager):
+    """
+    Update and draw until the UI has no pending change, then take the idle snapshot.
+    """
+    ui_manager = main_manager.ui_manager
+    for _ in range(10):
+        ui_manager.update(InputState.empty())
+        ui_manager.draw()
+        main_manager.window_manager.full_redraw = False
+        if not ui_manager.has_changes():
+            break
+    main_manager.input_received = False
+    main_manager.is_idle()
+
+
+def test_set_position_prevents_idle(main_manager, ui_manager):
+    ui_manager.load_menu('test_menu')
+    settle(main_manager)
+    assert main_manager.is_idle()
+
+    ui_manager.ui_elements['back_to_start'].set_position(300, 300)
+
+    assert ui_manager.has_changes()
+    assert not main_manager.is_idle()
+
+    settle(main_manager)
+    assert ui_manager.ui_elements['back_to_start'].collision_rect.center == (300, 300)
+    assert main_manager.is_idle()
+
+
+def test_moved_element_is_hit_tested_at_new_position(main_manager, ui_manager):
+    ui_manager.load_menu('test_menu')
+    settle(main_manager)
+    element = ui_manager.ui_elements['back_to_start']
+
+    element.set_position(200, 500)
+    ui_manager.update(InputState(mouse_pos=(200, 500)))
+
+    assert element.collision_rect.center == (200, 500)
+    assert element.hovered_state
+    assert 'back_to_start' in ui_manager.get_elements_at((200, 500))
+
+
+def test_only_hovered_and_awake_elements_are_updated(main_manager, ui_manager, monkeypatch):
+    ui_manager.load_menu('test_menu')
+    settle(main_manager)
+    updated = []
+    monkeypatch.setattr(UIElement, 'update', lambda self, *args: updated.append(self.element_id))
+    monkeypatch.setattr(UIButton, 'update', lambda self, *args: updated.append(self.element_id))
+    monkeypatch.setattr(UIContainer, 'update', lambda self, *args: updated.append(self.element_id))
+
+    ui_manager.update(InputState(mouse_pos=(700, 580)))
+    assert updated == []
+
+    ui_manager.update(InputState(mouse_pos=(400, 400)))
+    assert updated == ['back_to_start']
+
+
+def test_load_menu_cancels_its_preload(ui_manager):
+    ui_manager.preload_menu('test_menu')
+
+    ui_manager.load_menu('test_menu')
+
+    assert 'test_menu' not in ui_manager.preloads
+    assert ui_manager.current_menu == 'test_menu'
+
+
+def test_shutdown_preloads_stops_worker(ui_manager):
+    ui_manager.preload_menu('test_menu')
+    executor = ui_manager.preload_executor
+
+    ui_manager.shutdown_preloads()
+
+    assert ui_manager.preload_executor is None
+    assert not ui_manager.preloads and ui_manager.pending_menu is None
+    executor.shutdown(wait=True)
+    assert not any(thread.name.startswith('preload') for thread in threading.enumerate())
@@ -0,0 +1,81 @@
+# test_ui_store.py
+
+import pygame
+import pytest
+
+pytest.importorskip("numpy")
+
+from engine.ui_element import UIElement
+from engine.ui_store import UIStore
+
+
+def make_element(ui_manager, element_id, pos_x, pos_y, align='nw', layer=0):
+    config = {'pos_x': pos_x, 'pos_y': pos_y, 'align': align, 'layer': layer,
+              'rectangle_width': 40, 'rectangle_height': 20, 'text_enabled': False}
+    element = UIElement('panel', element_id, config, ui_manager.managers, ui_manager.logger)
+    element.update_graphics()
+    return element
+
+
+@pytest.fixture
+def store():
+    return UIStore(capacity=2)
+
+
+def test_query_point_matches_collision_rects(ui_manager, store):
+    elements = [make_element(ui_manager, 'nw', 0, 0), make_element(ui_manager, 'center', 100, 100, 'center'),
+                make_element(ui_manager, 'se', 300, 300, 'se')]
+    for element in elements:
+        store.add(element)
+
+    for element in elements:
+        rect = element.collision_rect
+        assert store.query_point(rect.topleft) == {element.element_id}
+        assert element.element_id not in store.query_point(rect.bottomright)
+    assert store.capacity == 4
+
+
+def test_moved_element_is_laid_out_by_store(ui_manager, store):
+    element = make_element(ui_manager, 'moved', 0, 0)
+    store.add(element)
+    store.awake.clear()
+
+    element.set_position(200, 50)
+
+    assert (element.pos_x, element.pos_y) == (200, 50)
+    assert store.awake == {'moved'}
+    assert store.query_point((210, 60)) == {'moved'}
+    assert store.query_point((10, 10)) == set()
+
+
+def test_cull_orders_by_layer_then_insertion(ui_manager, store):
+    for element_id, layer in [('top', 2), ('bottom', 0), ('middle', 1), ('bottom_2', 0)]:
+        store.add(make_element(ui_manager, element_id, 0, 0, layer=layer))
+    store.add(make_element(ui_manager, 'outside', 500, 500))
+
+    culled = store.cull(pygame.Rect(0, 0, 100, 100))
+
+    assert [element.element_id for element in culled] == ['bottom', 'bottom_2', 'middle', 'top']
+
+
+def test_hidden_element_is_culled(ui_manager, store):
+    element = make_element(ui_manager, 'hidden', 0, 0)
+    store.add(element)
+
+    element.set_visible(False)
+
+    assert store.cull(pygame.Rect(0, 0, 100, 100)) == []
+
+
+def test_remove_keeps_position_and_frees_row(ui_manager, store):
+    element = make_element(ui_manager, 'removed', 0, 0)
+    store.add(element)
+    element.set_position(30, 40)
+    row = element.store_row
+
+    store.remove(element)
+
+    assert element.store is None
+    assert (element.pos_x, element.pos_y) == (30, 40)
+    assert store.query_point((35, 45)) == set()
+    assert store.free_rows[-1] == row
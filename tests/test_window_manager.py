@@ -0,0 +1,61 @@
+# test_window_manager.py
+
+import pygame
+import pytest
+
+
+@pytest.fixture
+def window_manager(main_manager):
+    """
+    WindowManager drawing dirty rects, restored to its configured display after the test.
+    """
+    window_manager = main_manager.window_manager
+    dirty_rects_enabled = window_manager.dirty_rects_enabled
+    scale_mode = window_manager.scale_mode
+    window_manager.dirty_rects_enabled = True
+    yield window_manager
+
+    window_manager.dirty_rects_enabled = dirty_rects_enabled
+    window_manager.scale_mode = scale_mode
+    window_manager.screen_scaled = window_manager.game_size
+    window_manager.adjust_display()
+
+
+def set_scaled_size(window_manager, size, scale_mode):
+    window_manager.scale_mode = scale_mode
+    window_manager.screen_scaled = size
+    window_manager.adjust_display()
+
+
+def draw_pattern(surface):
+    surface.fill((20, 40, 60))
+    for i in range(0, surface.get_width(), 7):
+        pygame.draw.line(surface, (255, (i * 5) % 256, 0), (i, 0), (i, surface.get_height()))
+
+
+@pytest.mark.parametrize("size, scale_mode", [
+    ((800, 600), "nearest"),
+    ((1600, 1200), "nearest"),
+    ((1000, 750), "nearest"),
+    ((1000, 750), "smooth"),
+    ((1237, 928), "smooth"),
+])
+def test_dirty_draw_matches_full_draw(window_manager, size, scale_mode):
+    set_scaled_size(window_manager, size, scale_mode)
+    surface = window_manager.get_surface()
+    draw_pattern(surface)
+    window_manager.draw()
+
+    # Change a region and push it through the dirty rect path
+    changed_rect = pygame.Rect(333, 211, 181, 47)
+    surface.fill((200, 0, 0), changed_rect)
+    pygame.draw.rect(surface, (0, 255, 255), changed_rect, 1)
+    window_manager.mark_dirty(changed_rect)
+    window_manager.draw()
+    dirty_frame = pygame.image.tobytes(window_manager.display, 'RGB')
+
+    window_manager.mark_dirty()
+    window_manager.draw()
+    full_frame = pygame.image.tobytes(window_manager.display, 'RGB')
+
+    assert dirty_frame == full_frame